@@ -402,6 +402,7 @@ ${assessment.recommendations.map(rec => `• ${rec}`).join('\n')}
 
             <div class="section">
               <h2>Market Size Analysis</h2>
+              ${result.market_data.placeholders?.includes('market_size') ? '<p><em>Illustrative baseline figures, not derived from validation data</em></p>' : ''}
               <div class="metric">
                 <div class="metric-value">${result.market_data.market_size.tam}</div>
                 <div class="metric-label">Total Addressable Market</div>
@@ -445,6 +446,7 @@ ${assessment.recommendations.map(rec => `• ${rec}`).join('\n')}
 
             <div class="section">
               <h2>Growth Projections</h2>
+              ${result.market_data.placeholders?.includes('growth_projections') ? '<p><em>Illustrative baseline figures, not derived from validation data</em></p>' : ''}
               <ul>
                 <li><strong>Year 1:</strong> ${result.market_data.growth_projections.year_1}</li>
                 <li><strong>Year 2:</strong> ${result.market_data.growth_projections.year_2}</li>
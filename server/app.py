@@ -1,18 +1,198 @@
-from flask import Flask, request, jsonify, send_from_directory
-from flask_cors import CORS
+import io
 import os
 import sys
-import json
+import time
 from datetime import datetime
 
 # Add the server directory to the Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from ml_validator import ml_validator
+from lazy_imports import startup_phase, startup_report
+
+with startup_phase('import flask'):
+    from flask import Flask, Response, g, request, jsonify, send_from_directory, stream_with_context
+    from flask.json.provider import JSONProvider
+    from werkzeug.middleware.proxy_fix import ProxyFix
+    from flask_cors import CORS
+
+with startup_phase('build ml_validator'):
+    from founder_readiness import founder_readiness
+    from json_codec import codec, dumps
+    from market_research import market_research
+    from metrics import StageTimer, metrics
+    from ml_validator import ml_validator
+    from pitch_engine import pitch_engine
+    from rate_limiter import RateLimited, rate_limiter
+    from validation_store import validation_store
+    from validation_jobs import QueueFull, validation_jobs
+    from validation_sessions import check_fields, validation_sessions
+    from stream_validate import DEFAULT_BATCH_SIZE, StreamStats, stream_validate
+
+class CodecJSONProvider(JSONProvider):
+    """jsonify and request.get_json() backed by the process-wide codec (orjson when installed)"""
+
+    mimetype = 'application/json'
+
+    def dumps(self, obj, **kwargs):
+        return codec.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return codec.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Skip the bytes -> str -> bytes round trip that dumps() needs
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(codec.dumps(obj), mimetype=self.mimetype)
+
+
+def json_response(body, etag):
+    """Response for pre-encoded JSON with a strong ETag"""
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    # 304 Not Modified for GET/HEAD requests whose If-None-Match already has this body
+    return response.make_conditional(request)
+
 
 app = Flask(__name__, static_folder='../client', static_url_path='')
+app.json = CodecJSONProvider(app)
 CORS(app)
 
+# Reverse proxies in front of the app (e.g. the Node server in index.ts) trusted to append
+# X-Forwarded-For, so remote_addr, and the rate limit keyed on it, is the caller's; 0 trusts none
+TRUSTED_PROXIES = int(os.environ.get('TRUSTED_PROXIES', 0))
+if TRUSTED_PROXIES:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXIES)
+
+# Flipped once the module has finished initialising; cleared again while a worker drains
+app.config['READY'] = False
+
+# Upper bound on records accepted by /api/validate/batch in a single request
+MAX_BATCH_SIZE = 10000
+
+# Request body limits in bytes, checked before anything is parsed; 0 means unlimited
+MAX_REQUEST_BYTES = int(os.environ.get('MAX_REQUEST_BYTES', 1024 * 1024))
+MAX_BATCH_REQUEST_BYTES = int(os.environ.get('MAX_BATCH_REQUEST_BYTES', 64 * 1024 * 1024))
+MAX_STREAM_REQUEST_BYTES = int(os.environ.get('MAX_STREAM_REQUEST_BYTES', 0))
+
+# Endpoints that take more than a single form
+BODY_LIMITS = {
+    '/api/validate/batch': MAX_BATCH_REQUEST_BYTES,
+    '/api/validate/jobs': MAX_BATCH_REQUEST_BYTES,
+    '/api/generate-pitch/batch': MAX_BATCH_REQUEST_BYTES,
+    '/api/validate/stream': MAX_STREAM_REQUEST_BYTES
+}
+
+def cache_samples(stat):
+    return {
+        (('cache', 'result'),): ml_validator.result_cache.stats()[stat],
+        (('cache', 'text_quality'),): ml_validator.text_quality_cache.stats()[stat]
+    }
+
+metrics.add_collector('validation_cache_hits_total', 'Cache hits', 'counter', lambda: cache_samples('hits'))
+metrics.add_collector('validation_cache_misses_total', 'Cache misses', 'counter', lambda: cache_samples('misses'))
+metrics.add_collector('validation_cache_entries', 'Entries held in memory', 'gauge', lambda: cache_samples('size'))
+metrics.add_collector('validation_jobs_pending', 'Queued or running validation jobs', 'gauge',
+                      lambda: {None: validation_jobs.stats()['pending']})
+metrics.add_collector('validation_sessions_active', 'Open live-scoring sessions', 'gauge',
+                      lambda: {None: validation_sessions.stats()['active']})
+metrics.add_collector('rate_limited_requests_total', 'API requests refused with 429, by reason', 'counter',
+                      lambda: {(('reason', reason),): rate_limiter.stats_counts[reason]
+                               for reason in ('rate', 'concurrency')})
+metrics.add_collector('similarity_index_entries', 'Startups in the similarity index', 'gauge',
+                      lambda: {None: len(ml_validator.similarity_index)})
+if validation_store is not None:
+    metrics.add_collector('validation_store_rows_total', 'Validation rows by persistence outcome', 'counter',
+                          lambda: {(('outcome', outcome),): validation_store.stats()[outcome]
+                                   for outcome in ('written', 'dropped', 'skipped')})
+    metrics.add_collector('validation_store_failures_total', 'Failed database connects and inserts', 'counter',
+                          lambda: {(('stage', stage),): validation_store.stats()[f'failed_{stage}']
+                                   for stage in ('connects', 'flushes')})
+    metrics.add_collector('validation_store_pending', 'Rows waiting to be flushed', 'gauge',
+                          lambda: {None: validation_store.stats()['pending']})
+
+@app.before_request
+def start_request_metrics():
+    if request.path.startswith('/api/'):
+        g.metrics_started = time.perf_counter()
+        metrics.request_started()
+
+@app.before_request
+def enforce_rate_limit():
+    # Runs before the body is read, so a throttled client costs no parsing
+    if not request.path.startswith('/api/') or request.method == 'OPTIONS':
+        return None
+    client = rate_limiter.client_for(request.headers.get('X-API-Key'), request.remote_addr)
+    try:
+        g.rate_limit_lease = rate_limiter.acquire(client, request.url_rule.rule if request.url_rule is not None else None)
+    except RateLimited as e:
+        response = jsonify({
+            'success': False,
+            'error': str(e)
+        })
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 429
+
+@app.after_request
+def hold_rate_limit_for_stream(response):
+    # A streamed body (/api/validate/stream) is sent after teardown, so it keeps its slot until closed
+    if response.is_streamed:
+        lease = g.pop('rate_limit_lease', None)
+        if lease is not None:
+            response.call_on_close(lambda: rate_limiter.release(lease))
+    return response
+
+@app.teardown_request
+def release_rate_limit(exc):
+    lease = g.pop('rate_limit_lease', None)
+    if lease is not None:
+        rate_limiter.release(lease)
+
+def body_too_large(limit):
+    return jsonify({
+        'success': False,
+        'error': f'Request body too large (max {limit} bytes)'
+    }), 413
+
+@app.before_request
+def enforce_body_limit():
+    limit = BODY_LIMITS.get(request.path, MAX_REQUEST_BYTES) or None
+    if limit is None:
+        return None
+    if request.content_length is not None and request.content_length > limit:
+        return body_too_large(limit)
+    # Chunked bodies have no Content-Length: the stream stops one byte past the limit,
+    # which is how an oversized body is told apart from one of exactly the limit
+    request.max_content_length = limit + 1
+    # Reading here, outside the views' try/except, means get_json() later parses the cached
+    # bytes; the NDJSON stream is left unread and fails mid-body instead
+    if request.path != '/api/validate/stream' and len(request.get_data(cache=True)) > limit:
+        return body_too_large(limit)
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.pop('metrics_started', None)
+    if started is not None:
+        endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        method, status = request.method, response.status_code
+
+        def finish():
+            metrics.request_finished(endpoint, method, status, time.perf_counter() - started)
+
+        # Streamed bodies (/api/validate/stream) are timed until the last chunk is sent
+        if response.is_streamed:
+            response.call_on_close(finish)
+        else:
+            finish()
+    return response
+
+@app.teardown_request
+def finish_failed_request_metrics(exc):
+    # after_request is skipped when a view raises, so settle the in-flight gauge here
+    started = g.pop('metrics_started', None)
+    if started is not None:
+        endpoint = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        metrics.request_finished(endpoint, request.method, 500, time.perf_counter() - started)
+
 @app.route('/')
 def serve_index():
     """Serve the main HTML file"""
@@ -36,9 +216,23 @@ def validate_startup():
             }), 400
         
         # Validate using ML
-        result = ml_validator.validate_startup_idea(data)
-        
-        return jsonify(result)
+        timer = StageTimer(metrics)
+        result = ml_validator.validate_startup_idea(data, timer)
+
+        # ?include=swot adds the SWOT analysis from the same scores, saving a /api/generate-swot call
+        if 'swot' in request.args.get('include', '').split(',') and result.get('success'):
+            result = dict(result, swot_analysis=ml_validator.swot_analysis(ml_validator.result_scores(result), data))
+            timer.lap('swot')
+
+        body = dumps(result)
+        timer.lap('serialize')
+        timer.publish()
+
+        # ?timings=1 adds the per-stage breakdown (in ms) for debugging
+        if request.args.get('timings') in ('1', 'true'):
+            body = dumps(dict(result, timings=timer.as_dict()))
+
+        return Response(body, mimetype='application/json')
         
     except Exception as e:
         return jsonify({
@@ -46,42 +240,293 @@ def validate_startup():
             'error': f'Validation failed: {str(e)}'
         }), 500
 
+@app.route('/api/validate/batch', methods=['POST'])
+def validate_startup_batch():
+    """Batch validation endpoint for re-scoring many ideas in one call"""
+    try:
+        data = request.get_json()
+
+        # Accept either a bare list of records or {"records": [...]}
+        records = data.get('records') if isinstance(data, dict) else data
+
+        if not isinstance(records, list) or not records:
+            return jsonify({
+                'success': False,
+                'error': 'No records provided'
+            }), 400
+
+        if len(records) > MAX_BATCH_SIZE:
+            return jsonify({
+                'success': False,
+                'error': f'Batch too large: {len(records)} records (max {MAX_BATCH_SIZE})'
+            }), 413
+
+        results = ml_validator.validate_batch(records)
+
+        head = dumps({'success': True, 'count': len(results), 'timestamp': datetime.now().isoformat()})
+        body = head[:-1] + b',"results":[' + b','.join(dumps(result) for result in results) + b']}'
+        return Response(body, mimetype='application/json')
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Batch validation failed: {str(e)}'
+        }), 500
+
+@app.route('/api/validate/stream', methods=['POST'])
+def validate_startup_stream():
+    """Score a (chunked) NDJSON body in micro-batches, streaming NDJSON results back"""
+    batch_size = min(request.args.get('batch_size', DEFAULT_BATCH_SIZE, type=int), MAX_BATCH_SIZE)
+    stats = StreamStats()
+
+    # request.stream is unbuffered, and iterating it line by line would read one byte at a time
+    body = io.BufferedReader(request.stream, buffer_size=64 * 1024)
+
+    def generate():
+        for output in stream_validate(body, ml_validator, max(batch_size, 1), stats):
+            result = output.pop('result')
+            yield dumps(output)[:-1] + b',"result":' + dumps(result) + b'}\n'
+        # Trailer line with throughput for the whole stream
+        yield dumps({'summary': stats.summary()}) + b'\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+@app.route('/api/similar', methods=['POST'])
+def find_similar_startups():
+    """Top-k previously validated startups most similar to the submitted problem/solution"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({
+                'success': False,
+                'error': 'No data provided'
+            }), 400
+
+        k = min(max(request.args.get('k', 5, type=int), 1), 50)
+
+        return jsonify({
+            'success': True,
+            'similar': ml_validator.similarity_index.similar(data, k),
+            'timestamp': datetime.now().isoformat()
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Similarity search failed: {str(e)}'
+        }), 500
+
+@app.route('/api/validate/jobs', methods=['POST'])
+def submit_validation_job():
+    """Queue a validation (single record or {"records": [...]}) and return its job id"""
+    try:
+        data = request.get_json()
+
+        if not data:
+            return jsonify({
+                'success': False,
+                'error': 'No data provided'
+            }), 400
+
+        is_batch = isinstance(data, list) or (isinstance(data, dict) and 'records' in data)
+        payload = (data.get('records') if isinstance(data, dict) else data) if is_batch else data
+
+        if is_batch and (not isinstance(payload, list) or len(payload) > MAX_BATCH_SIZE):
+            return jsonify({
+                'success': False,
+                'error': f'records must be a list of at most {MAX_BATCH_SIZE} items'
+            }), 400
+
+        try:
+            job_id = validation_jobs.submit(payload, is_batch=is_batch)
+        except QueueFull as e:
+            response = jsonify({
+                'success': False,
+                'error': str(e)
+            })
+            response.headers['Retry-After'] = str(e.retry_after)
+            return response, 429
+
+        return jsonify({
+            'success': True,
+            'job_id': job_id,
+            'status': 'queued',
+            'status_url': f'/api/validate/jobs/{job_id}'
+        }), 202
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Job submission failed: {str(e)}'
+        }), 500
+
+@app.route('/api/validate/jobs/<job_id>', methods=['GET'])
+def get_validation_job(job_id):
+    """Poll a validation job for its status and result"""
+    job = validation_jobs.status(job_id)
+
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': 'Job not found or expired'
+        }), 404
+
+    return jsonify({
+        'success': True,
+        'job': job
+    })
+
+@app.route('/api/validate/jobs/<job_id>', methods=['DELETE'])
+def cancel_validation_job(job_id):
+    """Cancel a validation job that has not started yet"""
+    cancelled = validation_jobs.cancel(job_id)
+
+    if cancelled is None:
+        return jsonify({
+            'success': False,
+            'error': 'Job not found or expired'
+        }), 404
+
+    if not cancelled:
+        return jsonify({
+            'success': False,
+            'error': 'Job is already running or finished'
+        }), 409
+
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status': 'cancelled'
+    })
+
+@app.route('/api/validate/sessions', methods=['POST'])
+def create_validation_session():
+    """Open a live-scoring session: the form is scored in full once, then updated with PATCH"""
+    try:
+        data = request.get_json()
+        if data is None:
+            data = {}
+
+        result = validation_sessions.create(data)
+        return Response(dumps(result), status=201, mimetype='application/json')
+
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Validation failed: {str(e)}'
+        }), 500
+
+@app.route('/api/validate/sessions/<session_id>', methods=['PATCH'])
+def update_validation_session(session_id):
+    """Apply changed fields only; just the categories that read them are rescored"""
+    try:
+        fields = request.get_json()
+
+        result = validation_sessions.update(session_id, fields)
+        if result is None:
+            return jsonify({
+                'success': False,
+                'error': 'Session not found or expired'
+            }), 404
+
+        return Response(dumps(result), mimetype='application/json')
+
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Validation failed: {str(e)}'
+        }), 500
+
+@app.route('/api/validate/sessions/<session_id>', methods=['GET'])
+def get_validation_session(session_id):
+    """Latest result of a live-scoring session"""
+    result = validation_sessions.result(session_id)
+
+    if result is None:
+        return jsonify({
+            'success': False,
+            'error': 'Session not found or expired'
+        }), 404
+
+    return Response(dumps(result), mimetype='application/json')
+
+@app.route('/api/validate/sessions/<session_id>', methods=['DELETE'])
+def close_validation_session(session_id):
+    """Close a live-scoring session"""
+    if not validation_sessions.close(session_id):
+        return jsonify({
+            'success': False,
+            'error': 'Session not found or expired'
+        }), 404
+
+    return jsonify({
+        'success': True,
+        'session_id': session_id,
+        'status': 'closed'
+    })
+
 @app.route('/api/generate-pitch', methods=['POST'])
 def generate_pitch():
     """Generate AI pitch content"""
     try:
         data = request.get_json()
-        
-        # Extract key information
-        problem = data.get('problemStatement', '')
-        solution = data.get('solutionDescription', '')
-        market = data.get('targetMarket', '')
-        revenue_model = data.get('revenueModel', '')
-        stage = data.get('currentStage', '')
-        
-        # Generate contextual pitch content
-        pitch_content = {
-            'executiveSummary': f"Our startup addresses a critical market need by providing {solution.lower()[:100]}... We're targeting {market.lower()[:50]} with a proven {revenue_model} business model.",
-            
-            'problemStatement': f"The market faces a significant challenge: {problem[:200]}... This problem affects thousands of potential customers daily, creating a substantial opportunity for disruption.",
-            
-            'solutionOverview': f"Our innovative solution: {solution[:200]}... We've designed this to be scalable, user-friendly, and directly address the core pain points identified in our market research.",
-            
-            'marketOpportunity': f"We're targeting {market[:100]}... The total addressable market is estimated at $2-5 billion, with strong growth indicators and limited direct competition in our specific niche.",
-            
-            'businessModel': f"Our {revenue_model} model ensures sustainable revenue growth. We've validated our pricing strategy through market research and early customer feedback, projecting strong unit economics.",
-            
-            'competitiveAdvantage': f"Our key differentiators include proprietary technology, first-mover advantage in our segment, and deep domain expertise. We've built sustainable moats through {solution[:50]}...",
-            
-            'fundingRequirements': f"Currently in {stage} stage, we're seeking $500K-2M to accelerate growth, expand our team, and scale our proven solution. Funds will be allocated primarily to product development and customer acquisition."
-        }
-        
+
+        result = pitch_engine.generate(data)
+        if not result['success']:
+            return jsonify(result), 400
+
+        result['timestamp'] = datetime.now().isoformat()
+        return jsonify(result)
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Pitch generation failed: {str(e)}'
+        }), 500
+
+@app.route('/api/generate-pitch/batch', methods=['POST'])
+def generate_pitch_batch():
+    """Pitch drafts for a whole cohort in one call"""
+    try:
+        data = request.get_json()
+
+        # Accept either a bare list of records or {"records": [...]}
+        records = data.get('records') if isinstance(data, dict) else data
+
+        if not isinstance(records, list) or not records:
+            return jsonify({
+                'success': False,
+                'error': 'No records provided'
+            }), 400
+
+        if len(records) > MAX_BATCH_SIZE:
+            return jsonify({
+                'success': False,
+                'error': f'Batch too large: {len(records)} records (max {MAX_BATCH_SIZE})'
+            }), 413
+
+        results = pitch_engine.generate_batch(records)
+
         return jsonify({
             'success': True,
-            'pitch_content': pitch_content,
+            'count': len(results),
+            'results': results,
             'timestamp': datetime.now().isoformat()
         })
-        
+
     except Exception as e:
         return jsonify({
             'success': False,
@@ -93,180 +538,171 @@ def generate_swot():
     """Generate SWOT analysis"""
     try:
         data = request.get_json()
-        
-        swot_analysis = {
-            'strengths': [
-                'Strong problem-solution fit validated through user research',
-                'Experienced founding team with relevant domain expertise',
-                'Clear competitive advantages and unique value proposition',
-                'Scalable business model with multiple revenue streams'
-            ],
-            'weaknesses': [
-                'Limited initial funding and resource constraints',
-                'Need to build brand awareness in competitive market',
-                'Potential technical challenges in scaling infrastructure',
-                'Dependence on key team members and knowledge retention'
-            ],
-            'opportunities': [
-                'Large and growing total addressable market',
-                'Emerging technology trends supporting our solution',
-                'Potential for strategic partnerships and collaborations',
-                'International expansion possibilities'
-            ],
-            'threats': [
-                'Well-funded competitors entering the market',
-                'Rapid technological changes requiring constant adaptation',
-                'Economic uncertainties affecting customer spending',
-                'Regulatory changes that could impact our business model'
-            ]
-        }
-        
+
+        if not data:
+            return jsonify({
+                'success': False,
+                'error': 'No data provided'
+            }), 400
+        check_fields(data, allow_null=True)
+
+        # Reuses the category scores of an earlier /api/validate call for the same form
+        scores = ml_validator.category_scores(data)
+
         return jsonify({
             'success': True,
-            'swot_analysis': swot_analysis,
+            'swot_analysis': ml_validator.swot_analysis(scores, data),
             'timestamp': datetime.now().isoformat()
         })
-        
+
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
     except Exception as e:
         return jsonify({
             'success': False,
             'error': f'SWOT generation failed: {str(e)}'
         }), 500
 
-@app.route('/api/founder-readiness', methods=['POST'])
+@app.route('/api/founder-readiness', methods=['GET', 'POST'])
 def check_founder_readiness():
-    """Assess founder readiness"""
+    """Assess founder readiness from questionnaire answers; GET returns a founder's latest assessment"""
     try:
-        data = request.get_json()
-        
-        # Simulate comprehensive founder assessment
-        assessment = {
-            'overall_score': 73,
-            'categories': {
-                'entrepreneurial_mindset': 85,
-                'technical_skills': 72,
-                'business_acumen': 78,
-                'leadership_ability': 80,
-                'financial_management': 65,
-                'network_connections': 60
-            },
-            'strengths': [
-                'Strong entrepreneurial drive and vision',
-                'Good technical understanding of the solution',
-                'Clear communication and leadership skills'
-            ],
-            'improvement_areas': [
-                'Strengthen financial planning and management skills',
-                'Expand professional network and industry connections',
-                'Develop more comprehensive business strategy'
-            ],
-            'recommendations': [
-                'Consider taking a business finance course',
-                'Join entrepreneur communities and accelerator programs',
-                'Seek mentorship from experienced entrepreneurs',
-                'Build advisory board with complementary expertise'
-            ]
-        }
-        
+        if request.method == 'GET':
+            founder_id = request.args.get('founderId')
+            if not founder_id:
+                return jsonify({
+                    'success': False,
+                    'error': 'founderId is required'
+                }), 400
+            result = founder_readiness.latest(founder_id)
+            if result is None:
+                return jsonify({
+                    'success': False,
+                    'error': 'No assessment found for this founder'
+                }), 404
+            return jsonify(result)
+
+        data = request.get_json(silent=True)
+        if data is None:
+            return jsonify({
+                'success': False,
+                'error': 'No data provided'
+            }), 400
+        return jsonify(founder_readiness.assess(data))
+
+    except ValueError as e:
         return jsonify({
-            'success': True,
-            'assessment': assessment,
-            'timestamp': datetime.now().isoformat()
-        })
-        
+            'success': False,
+            'error': str(e)
+        }), 400
+
     except Exception as e:
         return jsonify({
             'success': False,
-            'error': f'Assessment failed: {str(e)}'
+            'error': f'Founder readiness assessment failed: {str(e)}'
         }), 500
 
-@app.route('/api/market-research', methods=['POST'])
+@app.route('/api/market-research', methods=['GET', 'POST'])
 def generate_market_research():
-    """Generate market research report"""
+    """Market research figures for the requester's industry and stage, from precomputed summaries"""
     try:
-        data = request.get_json()
-        
-        market_data = {
-            'market_size': {
-                'tam': '$2.4B',
-                'sam': '$450M',
-                'som': '$45M'
-            },
-            'customer_segments': {
-                'primary': 'Early-stage entrepreneurs (40%)',
-                'secondary': 'Student entrepreneurs (25%)',
-                'tertiary': 'Corporate innovators (20%)',
-                'other': 'Consultants and advisors (15%)'
-            },
-            'competitive_landscape': {
-                'direct_competitors': 3,
-                'indirect_competitors': 8,
-                'market_leader_share': '25%',
-                'competitive_intensity': 'Medium-High'
-            },
-            'market_trends': [
-                'Growing startup ecosystem (+15% YoY)',
-                'Increased focus on validation (+22% search volume)',
-                'AI adoption in business tools (+45% growth)',
-                'Remote entrepreneurship trend (+30% increase)'
-            ],
-            'growth_projections': {
-                'year_1': '$500K ARR',
-                'year_2': '$2M ARR',
-                'year_3': '$8M ARR',
-                'year_5': '$25M ARR'
-            }
-        }
-        
-        return jsonify({
-            'success': True,
-            'market_data': market_data,
-            'timestamp': datetime.now().isoformat()
-        })
-        
+        data = request.get_json(silent=True) if request.method == 'POST' else None
+        params = dict(data) if isinstance(data, dict) else {}
+        params.update(request.args.items())
+
+        body, etag = market_research.lookup(*market_research.segment(params))
+        return json_response(body, etag)
+
     except Exception as e:
         return jsonify({
             'success': False,
             'error': f'Market research failed: {str(e)}'
         }), 500
 
+@app.route('/api/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus text-format metrics for this process"""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
     return jsonify({
         'status': 'healthy',
+        'live': True,
+        'ready': app.config['READY'],
         'timestamp': datetime.now().isoformat(),
-        'ml_validator': 'ready'
+        'ml_validator': 'ready' if app.config['READY'] else 'starting',
+        'sentiment_backend': ml_validator.sentiment.name,
+        'result_cache': ml_validator.result_cache.stats(),
+        'text_quality_cache': ml_validator.text_quality_cache.stats(),
+        'validation_jobs': validation_jobs.stats(),
+        'validation_sessions': validation_sessions.stats(),
+        'market_research': market_research.stats(),
+        'founder_readiness': founder_readiness.stats(),
+        'rate_limiter': rate_limiter.stats(),
+        'similarity_index': ml_validator.similarity_index.stats(),
+        'validation_store': validation_store.stats() if validation_store is not None else None,
+        'score_model': ml_validator.score_model.meta if ml_validator.score_model is not None else None
     })
 
+@app.route('/api/health/live', methods=['GET'])
+def liveness_check():
+    """Liveness probe: the process is up and serving requests"""
+    return jsonify({
+        'status': 'alive',
+        'uptime_ms': startup_report()['uptime_ms']
+    })
+
+@app.route('/api/health/ready', methods=['GET'])
+def readiness_check():
+    """Readiness probe: the validator is built and this worker accepts traffic"""
+    ready = app.config['READY']
+    return jsonify({
+        'ready': ready,
+        'startup': startup_report()
+    }), 200 if ready else 503
+
+def shutdown_services():
+    """Stop this process's background work: the job pool, queued similarity-index updates and the write-behind store
+
+    Each service also registers itself with atexit; a prefork worker leaves through os._exit,
+    which skips atexit, so it calls this instead.
+    """
+    validation_jobs.shutdown()
+    # Index updates first, then the store, so nothing queued by either is left behind
+    ml_validator.similarity_index.close()
+    if validation_store is not None:
+        validation_store.close()
+    rate_limiter.backend.close()
+
+def print_startup_report():
+    """Print per-phase and per-import startup timings"""
+    report = startup_report()
+    print(f"⏱️  Startup: {report['phases_ms']} ms")
+    for timing in report['timings']:
+        print(f"   {timing['kind']:<12} {timing['name']:<24} {timing['ms']:>9} ms")
+
+app.config['READY'] = True
+
 if __name__ == '__main__':
-    # Install required packages if not available
+    # Optional packages (numpy for batch scoring, scikit-learn, textblob) are imported on first use
     try:
-        import pandas
         import numpy
-        import sklearn
-        import nltk
-        import textblob
     except ImportError as e:
         print(f"Missing required package: {e}")
         print("Please install required packages:")
-        print("pip install pandas numpy scikit-learn nltk textblob flask flask-cors")
+        print("pip install numpy flask flask-cors")
         sys.exit(1)
-    
-    # Download required NLTK data
-    try:
-        import nltk
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt')
-    
-    try:
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        nltk.download('stopwords')
-    
+
     print("🚀 Starting StartupValidator ML Backend...")
+    print_startup_report()
     print("📊 ML Validation Engine: Ready")
     print("🌐 Server running on http://localhost:5000")
+    print("   (development server; use `python serve.py` for the preforking production server)")
     
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -0,0 +1,247 @@
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+# Add the server directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from synthetic_data import generate_form, generate_forms, generate_text
+
+# Field lengths (characters) exercised by the micro benchmarks, from empty to 10 KB
+FIELD_LENGTHS = (0, 100, 1000, 10000)
+
+
+def summarize(samples_ns):
+    """Latency summary in microseconds using nearest-rank percentiles"""
+    ordered = sorted(samples_ns)
+    n = len(ordered)
+
+    def percentile(p):
+        return round(ordered[max(math.ceil(p / 100 * n), 1) - 1] / 1000, 2)
+
+    return {
+        'n': n,
+        'mean_us': round(sum(ordered) / n / 1000, 2),
+        'min_us': round(ordered[0] / 1000, 2),
+        'p50_us': percentile(50),
+        'p95_us': percentile(95),
+        'p99_us': percentile(99),
+        'max_us': round(ordered[-1] / 1000, 2)
+    }
+
+
+def time_calls(fn, args_list):
+    samples = []
+    clock = time.perf_counter_ns
+    for args in args_list:
+        started = clock()
+        fn(*args)
+        samples.append(clock() - started)
+    return summarize(samples)
+
+
+def run_micro(iterations, seed, with_indexing=False):
+    """Time text quality, each analyzer and the full validation across field lengths"""
+    from ml_validator import CATEGORY_ANALYZERS, StartupMLValidator
+    from similarity_index import SimilarityIndex
+    from validation_cache import ValidationCache
+
+    # A private validator so the process-wide caches and stores are not involved; every
+    # timed call gets a fresh input, so the memo and result caches always miss. Background
+    # similarity-index refits would compete for the GIL and add noise, so they are off by default
+    validator = StartupMLValidator(
+        result_cache=ValidationCache(max_entries=1),
+        similarity_index=SimilarityIndex(read_only=not with_indexing)
+    )
+    validator.warm_up()
+    rng = random.Random(seed)
+
+    results = {}
+    for length in FIELD_LENGTHS:
+        texts = [(generate_text(rng, 'problemStatement', length) + f' {i}',) for i in range(iterations)]
+        results[f'calculate_text_quality[len={length}]'] = time_calls(validator.calculate_text_quality, texts)
+
+        forms = [generate_form(rng, length) for _ in range(iterations)]
+        for i, form in enumerate(forms):
+            # Keep every input distinct, even the empty ones
+            form['problemStatement'] += f' {i}'
+
+        # Each analyze_* method is called with its form fields, as validate_startup_idea calls it
+        for method, fields in CATEGORY_ANALYZERS.values():
+            args_list = [tuple(form[field] for field in fields) for form in forms]
+            results[f'{method}[len={length}]'] = time_calls(getattr(validator, method), args_list)
+
+        results[f'validate_startup_idea[len={length}]'] = time_calls(
+            validator.validate_startup_idea, [(form,) for form in forms]
+        )
+        if validator.similarity_index.updates is not None:
+            # Let queued index updates finish before timing the next field length
+            validator.similarity_index.updates.join()
+        print(f"   len={length:<6} done", file=sys.stderr)
+
+    validator.similarity_index.close()
+    return results
+
+
+def run_load(url, endpoint, concurrency, requests, seed, batch_size):
+    """Drive a running server with concurrent clients and report end-to-end latency
+
+    Every request comes from one client, so leave RATE_LIMIT_PER_SECOND unset unless the
+    rate limiter itself is under test; throttled requests show up as 429s.
+    """
+    forms = generate_forms(max(requests, batch_size), seed=seed)
+    if endpoint == '/api/validate/batch':
+        payloads = [json.dumps({'records': [forms[(i + j) % len(forms)] for j in range(batch_size)]}).encode()
+                    for i in range(requests)]
+    else:
+        payloads = [json.dumps(forms[i]).encode() for i in range(requests)]
+
+    samples = []
+    statuses = {}
+    lock = threading.Lock()
+
+    def send(payload):
+        req = urllib.request.Request(url.rstrip('/') + endpoint, data=payload,
+                                     headers={'Content-Type': 'application/json'})
+        started = time.perf_counter_ns()
+        try:
+            with urllib.request.urlopen(req, timeout=60) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+        except OSError:
+            status = 'error'
+        elapsed = time.perf_counter_ns() - started
+        with lock:
+            samples.append(elapsed)
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(send, payloads))
+    seconds = time.perf_counter() - started
+
+    summary = summarize(samples)
+    summary.update({
+        'concurrency': concurrency,
+        'seconds': round(seconds, 3),
+        'requests_per_second': round(len(samples) / seconds, 1),
+        'statuses': statuses
+    })
+    return {f'load[{endpoint},c={concurrency}]': summary}
+
+
+def compare(baseline, current, metric, threshold):
+    """Rows of (name, baseline, current, change) and the names that regressed beyond threshold"""
+    rows, regressions = [], []
+    for name, stats in current['results'].items():
+        before = baseline['results'].get(name)
+        if before is None or metric not in stats or not before.get(metric):
+            continue
+        change = stats[metric] / before[metric] - 1
+        rows.append((name, before[metric], stats[metric], change))
+        if change > threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def print_comparison(rows, regressions, metric, threshold, file=sys.stdout):
+    print(f"{'benchmark':<52} {'base ' + metric:>14} {'now ' + metric:>14} {'change':>8}", file=file)
+    for name, before, after, change in rows:
+        flag = '  ❌' if name in regressions else ''
+        print(f"{name:<52} {before:>14} {after:>14} {change:>+8.1%}{flag}", file=file)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) above {threshold:.0%} on {metric}", file=file)
+    else:
+        print(f"✅ No regressions above {threshold:.0%} on {metric}", file=file)
+
+
+def write_report(results, args, output):
+    report = {
+        'meta': {
+            'kind': args.command,
+            'seed': args.seed,
+            'timestamp': datetime.now().isoformat(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'cpu_count': os.cpu_count()
+        },
+        'results': results
+    }
+    text = json.dumps(report, indent=2)
+    if output == '-':
+        print(text)
+    else:
+        with open(output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+        print(f"✅ Wrote {len(results)} benchmark results to {output}", file=sys.stderr)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks and load generator for the ML validator')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    micro = subparsers.add_parser('micro', help='time scoring functions in-process')
+    micro.add_argument('--iterations', type=int, default=200, help='timed calls per benchmark')
+    micro.add_argument('--with-indexing', action='store_true',
+                       help='include background similarity-index updates in validate_startup_idea')
+
+    load = subparsers.add_parser('load', help='drive a running server over HTTP')
+    load.add_argument('--url', default='http://localhost:5000')
+    load.add_argument('--endpoint', default='/api/validate', choices=('/api/validate', '/api/validate/batch'))
+    load.add_argument('--concurrency', type=int, default=8)
+    load.add_argument('--requests', type=int, default=1000)
+    load.add_argument('--batch-size', type=int, default=100, help='records per request for the batch endpoint')
+
+    for sub in (micro, load):
+        sub.add_argument('--seed', type=int, default=42)
+        sub.add_argument('-o', '--output', default='-', help='JSON report file (default: stdout)')
+        sub.add_argument('--baseline', help='compare against this saved report and exit 1 on regressions')
+        sub.add_argument('--metric', default='p95_us')
+        sub.add_argument('--threshold', type=float, default=0.10, help='allowed slowdown, e.g. 0.10 = 10%%')
+
+    comparison = subparsers.add_parser('compare', help='compare two saved reports')
+    comparison.add_argument('baseline')
+    comparison.add_argument('current')
+    comparison.add_argument('--metric', default='p95_us')
+    comparison.add_argument('--threshold', type=float, default=0.10)
+
+    args = parser.parse_args()
+
+    if args.command == 'compare':
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        with open(args.current, encoding='utf-8') as f:
+            current = json.load(f)
+    else:
+        if args.command == 'micro':
+            results = run_micro(args.iterations, args.seed, args.with_indexing)
+        else:
+            results = run_load(args.url, args.endpoint, args.concurrency, args.requests, args.seed, args.batch_size)
+        current = write_report(results, args, args.output)
+        if not args.baseline:
+            return
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    rows, regressions = compare(baseline, current, args.metric, args.threshold)
+    # The table goes to stderr when the JSON report itself is on stdout
+    out = sys.stderr if args.command != 'compare' and args.output == '-' else sys.stdout
+    print_comparison(rows, regressions, args.metric, args.threshold, file=out)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == '__main__':
+    main()
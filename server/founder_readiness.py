@@ -0,0 +1,328 @@
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+
+from keyword_matcher import KeywordMatcher
+from ml_validator import ml_validator
+from response_templates import FOUNDER_CATEGORIES, FOUNDER_LIMIT, FOUNDER_TEXTS, score_level
+from validation_store import sqlite_path_from_env
+
+# Bump whenever answer scoring changes; stored profiles scored by another version are rescored
+ASSESSMENT_VERSION = '1.0'
+
+# Answer key -> founder-readiness categories it counts towards. The validation form's own
+# fields are answers too, so the wizard's payload can be assessed as it is
+FOUNDER_QUESTIONS = {
+    'foundersExperience': ('leadership_ability', 'business_acumen'),
+    'keySkills': ('technical_skills',),
+    'existingTraction': ('entrepreneurial_mindset',),
+    'pricingStrategy': ('business_acumen',),
+    'keyMetrics': ('business_acumen', 'financial_management'),
+    'fundingNeeds': ('financial_management',),
+    'motivation': ('entrepreneurial_mindset',),
+    'setbacks': ('entrepreneurial_mindset', 'leadership_ability'),
+    'technicalBackground': ('technical_skills',),
+    'leadershipExperience': ('leadership_ability',),
+    'financialPlanning': ('financial_management',),
+    'network': ('network_connections',),
+    'mentors': ('network_connections',),
+    'experienceLevel': ('entrepreneurial_mindset', 'leadership_ability')
+}
+
+# Derived item scored by analyze_team_strength from these answers, and the categories it counts towards
+TEAM_ITEM = 'team'
+TEAM_FIELDS = ('teamSize', 'foundersExperience', 'keySkills')
+TEAM_CATEGORIES = ('leadership_ability', 'technical_skills')
+
+# entrepreneur_profiles.experience_level values (see database/schema.sql)
+EXPERIENCE_SCORES = {
+    'first-time': 30,
+    '1-2-years': 50,
+    '3-5-years': 65,
+    '5-10-years': 80,
+    '10-plus': 90,
+    'serial': 100
+}
+
+# Keywords that show evidence for a category in a free-text answer
+FOUNDER_KEYWORDS = {
+    'entrepreneurial_mindset': ['founded', 'started', 'launched', 'built', 'pivot', 'failure', 'learned', 'risk', 'persist'],
+    'technical_skills': ['technical', 'engineering', 'development', 'programming', 'software', 'architecture', 'data', 'code'],
+    'business_acumen': ['revenue', 'pricing', 'sales', 'margin', 'customers', 'strategy', 'growth', 'market'],
+    'leadership_ability': ['led', 'managed', 'hired', 'mentored', 'leadership', 'director', 'head of', 'team'],
+    'financial_management': ['budget', 'runway', 'cash flow', 'forecast', 'burn', 'profit', 'funding', 'unit economics'],
+    'network_connections': ['mentor', 'advisor', 'investor', 'accelerator', 'incubator', 'partner', 'network', 'community']
+}
+
+# Score for a category nothing has been answered for yet
+UNANSWERED_SCORE = 50
+
+# Local stand-in for the PostgreSQL founder_assessments table; arrays and JSONB stored as JSON text
+FOUNDER_ASSESSMENTS_SQLITE_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS founder_assessments (
+        id TEXT PRIMARY KEY,
+        user_id TEXT NOT NULL,
+        startup_id TEXT,
+        overall_score INTEGER CHECK (overall_score >= 0 AND overall_score <= 100),
+        category_scores TEXT NOT NULL,
+        strengths TEXT,
+        improvement_areas TEXT,
+        recommendations TEXT,
+        assessment_data TEXT,
+        assessment_version TEXT DEFAULT '1.0',
+        assessed_at TEXT DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    'CREATE INDEX IF NOT EXISTS idx_founder_assessments_user ON founder_assessments(user_id, assessed_at)'
+)
+
+
+def founder_answers(data):
+    """Answers in a request: the form fields and any explicit 'answers' object, which wins
+
+    A null answer is read as empty, i.e. unanswered, as the validator reads null form fields.
+    """
+    if not isinstance(data, dict):
+        raise ValueError('Expected a JSON object')
+    answers = {key: data[key] for key in tuple(FOUNDER_QUESTIONS) + TEAM_FIELDS if key in data}
+    extra = data.get('answers') or {}
+    if not isinstance(extra, dict):
+        raise ValueError("'answers' must be an object of question -> answer")
+    answers.update(extra)
+    for key, value in answers.items():
+        if key not in FOUNDER_QUESTIONS and key not in TEAM_FIELDS:
+            raise ValueError(f"Unknown question '{key}'")
+        if value is None:
+            answers[key] = ''
+        elif not isinstance(value, str):
+            raise ValueError(f"Answer '{key}' must be a string or null")
+    return answers
+
+
+class FounderReadiness:
+    """Founder-readiness scoring over questionnaire answers, with a cached profile per founder
+
+    Each answer is scored on its own (text quality plus category keywords) and the team
+    answers through analyze_team_strength; a profile keeps those item scores, so a
+    re-assessment only rescores the answers that changed and re-averages the categories.
+    Profiles are an LRU per process; assessments are stored in founder_assessments, and a
+    founder's latest one restores the profile in a worker that has not seen them yet.
+    """
+
+    def __init__(self, validator, path=None, max_profiles=4096):
+        self.validator = validator
+        self.path = path
+        self.max_profiles = max_profiles
+        self.keyword_matcher = KeywordMatcher(FOUNDER_KEYWORDS)
+        self.profiles = OrderedDict()  # founder id -> profile, least recently used first
+        self.lock = threading.Lock()
+        self.db_lock = threading.Lock()
+        self.conn = None
+        self.pid = None
+        self.version = f'{ASSESSMENT_VERSION}+{validator.cache_version}'
+        self.stats_counts = {'assessments': 0, 'items_scored': 0, 'items_reused': 0, 'restored': 0, 'stored': 0}
+
+    def score_item(self, item, answers):
+        """0-100 score for one answer, or for the team item from the team answers"""
+        if item == TEAM_ITEM:
+            return self.validator.analyze_team_strength(*(answers.get(field, '') for field in TEAM_FIELDS))
+        answer = answers[item]
+        if item == 'experienceLevel':
+            return EXPERIENCE_SCORES.get(answer, UNANSWERED_SCORE)
+        category = FOUNDER_QUESTIONS[item][0]
+        keywords = self.keyword_matcher.hits(answer, (category,))[category]
+        evidence = min(keywords / 2, 1.0)
+        return (self.validator.calculate_text_quality(answer) * 0.7 + evidence * 0.3) * 100
+
+    def items_for(self, answers):
+        """Items a set of answers produces; the team item exists once any team answer does"""
+        items = [key for key in answers if key in FOUNDER_QUESTIONS and answers[key]]
+        if any(answers.get(field) for field in TEAM_FIELDS):
+            items.append(TEAM_ITEM)
+        return items
+
+    def assessment(self, items):
+        """Category averages, overall score and the text lists for a profile's item scores"""
+        totals = {key: [0.0, 0] for key, _ in FOUNDER_CATEGORIES}
+        for item, score in items.items():
+            for category in TEAM_CATEGORIES if item == TEAM_ITEM else FOUNDER_QUESTIONS[item]:
+                totals[category][0] += score
+                totals[category][1] += 1
+        categories = {key: round(total / count) if count else UNANSWERED_SCORE for key, (total, count) in totals.items()}
+
+        ranked = sorted(categories, key=lambda key: categories[key])
+        return {
+            'overall_score': round(sum(categories.values()) / len(categories)),
+            'categories': categories,
+            'strengths': [FOUNDER_TEXTS[key][0] for key in reversed(ranked)
+                          if score_level(categories[key]) == 'high'][:FOUNDER_LIMIT],
+            'improvement_areas': [FOUNDER_TEXTS[key][1] for key in ranked
+                                  if score_level(categories[key]) == 'low'][:FOUNDER_LIMIT],
+            'recommendations': [FOUNDER_TEXTS[key][2] for key in ranked
+                                if score_level(categories[key]) != 'high'][:FOUNDER_LIMIT + 1],
+            'answered': sum(1 for item in items if item != TEAM_ITEM)
+        }
+
+    def _score(self, profile, answers):
+        # Only items whose inputs changed are rescored; the rest keep their cached scores
+        changed = {key for key, value in answers.items() if profile['answers'].get(key) != value}
+        profile['answers'].update(answers)
+        items = self.items_for(profile['answers'])
+        rescored = [item for item in items
+                    if item not in profile['items']
+                    or (item in changed if item != TEAM_ITEM else not changed.isdisjoint(TEAM_FIELDS))]
+        for item in rescored:
+            profile['items'][item] = self.score_item(item, profile['answers'])
+        for item in set(profile['items']) - set(items):
+            del profile['items'][item]
+
+        self.stats_counts['items_scored'] += len(rescored)
+        self.stats_counts['items_reused'] += len(items) - len(rescored)
+        self.stats_counts['assessments'] += 1
+        return dict(self.assessment(profile['items']), rescored=rescored)
+
+    def assess(self, data):
+        """Assess a founder's answers; with a founderId they update that founder's profile and are stored"""
+        answers = founder_answers(data)
+        founder_id = data.get('founderId') or data.get('userId')
+        if founder_id is not None and not isinstance(founder_id, str):
+            raise ValueError("'founderId' must be a string")
+        if not founder_id:
+            # One-off assessment of the submitted answers
+            return {
+                'success': True,
+                'assessment': self._score({'answers': {}, 'items': {}}, answers),
+                'timestamp': datetime.now().isoformat()
+            }
+
+        profile = self._profile(founder_id)
+        with profile['lock']:
+            assessment = self._score(profile, answers)
+            profile['revision'] += 1
+            assessment_id = self._store(founder_id, data.get('startupId'), profile, assessment)
+            result = {
+                'success': True,
+                'founder_id': founder_id,
+                'assessment_id': assessment_id,
+                'revision': profile['revision'],
+                'assessment': assessment,
+                'timestamp': datetime.now().isoformat()
+            }
+            profile['result'] = result
+            return result
+
+    def latest(self, founder_id):
+        """The founder's latest assessment, or None if they have never been assessed"""
+        profile = self._profile(founder_id, create=False)
+        if profile is None:
+            return None
+        with profile['lock']:
+            if profile.get('result') is None:
+                # Restored from the database; the stored item scores make this cheap
+                profile['result'] = {
+                    'success': True,
+                    'founder_id': founder_id,
+                    'revision': profile['revision'],
+                    'assessment': dict(self.assessment(profile['items']), rescored=[]),
+                    'timestamp': datetime.now().isoformat()
+                }
+            return profile['result']
+
+    def _profile(self, founder_id, create=True):
+        with self.lock:
+            profile = self.profiles.get(founder_id)
+            if profile is not None:
+                self.profiles.move_to_end(founder_id)
+                return profile
+
+        profile = self._restore(founder_id)
+        if profile is None:
+            if not create:
+                return None
+            profile = {'answers': {}, 'items': {}, 'revision': 0}
+        profile['lock'] = threading.Lock()
+
+        with self.lock:
+            # Another request may have loaded the same founder meanwhile
+            profile = self.profiles.setdefault(founder_id, profile)
+            self.profiles.move_to_end(founder_id)
+            while len(self.profiles) > self.max_profiles:
+                self.profiles.popitem(last=False)
+            return profile
+
+    def _connect(self):
+        # Connections do not survive fork, so each prefork worker opens its own
+        if self.conn is None or self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            for statement in FOUNDER_ASSESSMENTS_SQLITE_SCHEMA:
+                self.conn.execute(statement)
+            self.conn.commit()
+        return self.conn
+
+    def _restore(self, founder_id):
+        if self.path is None:
+            return None
+        with self.db_lock:
+            row = self._connect().execute(
+                'SELECT assessment_data FROM founder_assessments WHERE user_id = ? ORDER BY assessed_at DESC LIMIT 1',
+                (founder_id,)
+            ).fetchone()
+        if row is None or not row[0]:
+            return None
+        data = json.loads(row[0])
+        answers = data.get('answers', {})
+        # Item scores from another scoring version are recomputed on the next assessment
+        items = data.get('items', {}) if data.get('version') == self.version else {}
+        if not items and answers:
+            items = {item: self.score_item(item, answers) for item in self.items_for(answers)}
+        self.stats_counts['restored'] += 1
+        return {'answers': answers, 'items': items, 'revision': data.get('revision', 0)}
+
+    def _store(self, founder_id, startup_id, profile, assessment):
+        if self.path is None:
+            return None
+        assessment_id = str(uuid.uuid4())
+        assessment_data = {
+            'answers': profile['answers'],
+            'items': profile['items'],
+            'revision': profile['revision'],
+            'version': self.version
+        }
+        with self.db_lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    'INSERT INTO founder_assessments (id, user_id, startup_id, overall_score, category_scores, strengths, '
+                    'improvement_areas, recommendations, assessment_data, assessment_version, assessed_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    (
+                        assessment_id, founder_id, startup_id if isinstance(startup_id, str) else None,
+                        assessment['overall_score'], json.dumps(assessment['categories']),
+                        json.dumps(assessment['strengths']), json.dumps(assessment['improvement_areas']),
+                        json.dumps(assessment['recommendations']), json.dumps(assessment_data),
+                        ASSESSMENT_VERSION, datetime.now().isoformat()
+                    )
+                )
+        self.stats_counts['stored'] += 1
+        return assessment_id
+
+    def stats(self):
+        with self.lock:
+            profiles = len(self.profiles)
+        return dict(self.stats_counts, profiles=profiles, max_profiles=self.max_profiles, stored_to=self.path)
+
+
+# Global per-process engine; assessments are stored when FOUNDER_ASSESSMENTS_DB or a sqlite
+# VALIDATION_STORE_URL gives it a database
+founder_readiness = FounderReadiness(
+    ml_validator,
+    path=sqlite_path_from_env('FOUNDER_ASSESSMENTS_DB'),
+    max_profiles=int(os.environ.get('FOUNDER_PROFILE_LIMIT', 4096))
+)
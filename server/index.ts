@@ -22,6 +22,24 @@ export function createServer() {
   // Proxy requests to Python ML backend
   const PYTHON_BACKEND_URL = 'http://localhost:5000';
 
+  // Every request reaches Python from this server's address, so pass on who sent it:
+  // the backend rate-limits by API key (RATE_LIMIT_API_KEYS), else by the last X-Forwarded-For hop (TRUSTED_PROXIES=1)
+  const backendHeaders = (req: express.Request) => {
+    const headers: Record<string, string> = {
+      'Content-Type': 'application/json',
+    };
+    const address = req.socket.remoteAddress;
+    if (address) {
+      const forwarded = req.get('X-Forwarded-For');
+      headers['X-Forwarded-For'] = forwarded ? `${forwarded}, ${address}` : address;
+    }
+    const apiKey = req.get('X-API-Key');
+    if (apiKey) {
+      headers['X-API-Key'] = apiKey;
+    }
+    return headers;
+  };
+
   // Validation endpoint
   app.post('/api/validate', async (req, res) => {
     try {
@@ -31,9 +49,7 @@ export function createServer() {
 
       const response = await fetch(`${PYTHON_BACKEND_URL}/api/validate`, {
         method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
+        headers: backendHeaders(req),
         body: JSON.stringify(req.body),
         signal: controller.signal
       });
@@ -64,9 +80,7 @@ export function createServer() {
 
       const response = await fetch(`${PYTHON_BACKEND_URL}/api/generate-pitch`, {
         method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
+        headers: backendHeaders(req),
         body: JSON.stringify(req.body),
         signal: controller.signal
       });
@@ -97,9 +111,7 @@ export function createServer() {
 
       const response = await fetch(`${PYTHON_BACKEND_URL}/api/generate-swot`, {
         method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
+        headers: backendHeaders(req),
         body: JSON.stringify(req.body),
         signal: controller.signal
       });
@@ -130,9 +142,7 @@ export function createServer() {
 
       const response = await fetch(`${PYTHON_BACKEND_URL}/api/founder-readiness`, {
         method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
+        headers: backendHeaders(req),
         body: JSON.stringify(req.body),
         signal: controller.signal
       });
@@ -163,9 +173,7 @@ export function createServer() {
 
       const response = await fetch(`${PYTHON_BACKEND_URL}/api/market-research`, {
         method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
+        headers: backendHeaders(req),
         body: JSON.stringify(req.body),
         signal: controller.signal
       });
@@ -195,6 +203,7 @@ export function createServer() {
       const timeoutId = setTimeout(() => controller.abort(), 2000); // 2 second timeout
 
       const response = await fetch(`${PYTHON_BACKEND_URL}/api/health`, {
+        headers: backendHeaders(req),
         signal: controller.signal
       });
 
@@ -0,0 +1,52 @@
+class KeywordMatcher:
+    """Substring keyword matcher over several named keyword groups, built once and reused per call"""
+
+    def __init__(self, groups):
+        self.groups = {name: list(keywords) for name, keywords in groups.items()}
+
+        # Distinct keywords, longest first, so a hit on "healthcare" settles "health" without a scan
+        self.keywords = sorted({kw for group in self.groups.values() for kw in group}, key=len, reverse=True)
+        self.implied = {kw: [other for other in self.keywords if other in kw] for kw in self.keywords}
+
+        # Which groups each keyword contributes to
+        self.keyword_groups = {}
+        for name, group in self.groups.items():
+            for kw in set(group):
+                self.keyword_groups.setdefault(kw, []).append(name)
+
+        # Keyword scan lists for every group subset requested so far
+        self.scan_lists = {None: self.keywords}
+
+    def scan_list(self, groups):
+        """Keywords (longest first) that need scanning for the given groups"""
+        if groups not in self.scan_lists:
+            wanted = {kw for name in groups for kw in self.groups[name]}
+            self.scan_lists[groups] = [kw for kw in self.keywords if kw in wanted]
+        return self.scan_lists[groups]
+
+    def matches(self, text, groups=None):
+        """Return the set of keywords that occur in text (case-insensitive)"""
+        if not text:
+            return set()
+        return self.matches_lower(text.lower(), groups)
+
+    def matches_lower(self, text, groups=None):
+        """matches() for text that is already lowercase"""
+        found = set()
+        for kw in self.scan_list(groups):
+            if kw not in found and kw in text:
+                found.update(self.implied[kw])
+        return found
+
+    def count(self, found, groups=None):
+        """Return {group: number of distinct group keywords in found}, a set from matches()"""
+        counts = dict.fromkeys(groups or self.groups, 0)
+        for kw in found:
+            for name in self.keyword_groups[kw]:
+                if name in counts:
+                    counts[name] += 1
+        return counts
+
+    def hits(self, text, groups=None):
+        """Return {group: number of distinct group keywords found in text}, optionally for a tuple of groups"""
+        return self.count(self.matches(text, groups), groups)
@@ -0,0 +1,76 @@
+import importlib
+import threading
+import time
+from contextlib import contextmanager
+
+# Wall-clock seconds spent in each startup phase and each deferred import, in load order
+STARTUP_TIMINGS = []
+PROCESS_STARTED = time.time()  # first import of this module, i.e. the top of app.py
+
+_lock = threading.Lock()
+
+
+def _record(name, kind, seconds):
+    with _lock:
+        STARTUP_TIMINGS.append({
+            'name': name,
+            'kind': kind,
+            'ms': round(seconds * 1000, 2),
+            'at_ms': round((time.time() - PROCESS_STARTED) * 1000, 2)
+        })
+
+
+@contextmanager
+def startup_phase(name):
+    """Time a block of startup work (building the validator, loading tables, ...)"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(name, 'phase', time.perf_counter() - started)
+
+
+class LazyModule:
+    """Module proxy that imports the real module on first attribute access"""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+        self._load_lock = threading.Lock()
+
+    def _load(self):
+        if self._module is None:
+            with self._load_lock:
+                if self._module is None:
+                    started = time.perf_counter()
+                    module = importlib.import_module(self._name)
+                    _record(self._name, 'lazy_import', time.perf_counter() - started)
+                    self._module = module
+        return self._module
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self.loaded else 'not loaded'
+        return f'<LazyModule {self._name} ({state})>'
+
+
+def lazy_import(name):
+    """Return a proxy for module `name` that defers the import until it is used"""
+    return LazyModule(name)
+
+
+def startup_report():
+    """Per-phase and per-import timings recorded so far"""
+    with _lock:
+        timings = list(STARTUP_TIMINGS)
+    return {
+        'uptime_ms': round((time.time() - PROCESS_STARTED) * 1000, 2),
+        'phases_ms': round(sum(t['ms'] for t in timings if t['kind'] == 'phase'), 2),
+        'timings': timings
+    }
@@ -0,0 +1,567 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from datetime import datetime
+
+# Add the server directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from json_codec import codec
+from response_templates import SCORE_CATEGORIES, score_level
+from validation_store import SQLITE_SCHEMA, SQLiteBackend, sqlite_path_from_env, validation_store
+
+# Industry label -> keywords, checked in order like extractIndustry() in shared/api.ts
+INDUSTRY_KEYWORDS = (
+    ('HealthTech', ('healthcare', 'medical', 'health')),
+    ('EdTech', ('education', 'learning', 'student')),
+    ('FinTech', ('finance', 'payment', 'banking')),
+    ('FoodTech', ('food', 'restaurant', 'delivery')),
+    ('PropTech', ('real estate', 'property', 'housing')),
+    ('Logistics', ('transportation', 'logistics')),
+    ('AI/ML', ('ai', 'machine learning', 'artificial intelligence')),
+    ('Blockchain', ('blockchain', 'crypto', 'web3')),
+    ('ClimaTech', ('environment', 'sustainable', 'green'))
+)
+DEFAULT_INDUSTRY = 'Technology'
+
+# Whole words only, so 'ai' does not match 'email' or 'maintain'
+INDUSTRY_PATTERNS = tuple(
+    (label, re.compile(r'\b(?:' + '|'.join(re.escape(keyword) for keyword in keywords) + r')\b'))
+    for label, keywords in INDUSTRY_KEYWORDS
+)
+INDUSTRY_LABELS = {label.lower(): label for label, _ in INDUSTRY_KEYWORDS + ((DEFAULT_INDUSTRY, ()),)}
+
+# startups.current_stage values (see database/schema.sql) and the form's stage options mapped onto them
+STAGES = ('idea', 'mvp', 'beta', 'launched', 'growth')
+STAGE_ALIASES = {
+    'concept': 'idea',
+    'wireframe': 'idea',
+    'prototype': 'mvp',
+    'early-revenue': 'launched'
+}
+
+# Summary key for "every industry" or "every stage"
+ALL = '*'
+
+# Local stand-in for the PostgreSQL startups table, limited to the columns the summaries read
+STARTUPS_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS startups (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    industry TEXT,
+    current_stage TEXT,
+    market_size TEXT,
+    revenue_model TEXT,
+    team_size INTEGER DEFAULT 1,
+    funding_raised REAL DEFAULT 0,
+    funding_goal REAL,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+SCORE_TOTALS = tuple(f'{key}_total' for key, _ in SCORE_CATEGORIES)
+
+# Columns summed per (industry, stage); largest_raise is a running maximum
+SUMMED_COLUMNS = (
+    'startups', 'validations', 'score_total') + SCORE_TOTALS + (
+    'high_viability', 'medium_viability', 'low_viability', 'funding_raised', 'funding_goal'
+)
+
+SUMMARY_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS market_summaries (industry TEXT NOT NULL, stage TEXT NOT NULL, '
+    + ''.join(f'{column} REAL NOT NULL DEFAULT 0, ' for column in SUMMED_COLUMNS)
+    + 'largest_raise REAL NOT NULL DEFAULT 0, updated_at TEXT, PRIMARY KEY (industry, stage))',
+    # Startups per market size and revenue model, for the segment breakdown
+    'CREATE TABLE IF NOT EXISTS market_summary_mix (industry TEXT NOT NULL, stage TEXT NOT NULL, '
+    'dimension TEXT NOT NULL, value TEXT NOT NULL, startups INTEGER NOT NULL DEFAULT 0, '
+    'PRIMARY KEY (industry, stage, dimension, value))',
+    'CREATE INDEX IF NOT EXISTS idx_validations_startup_id ON validations(startup_id)',
+    'CREATE INDEX IF NOT EXISTS idx_validations_input_data_hash ON validations(input_data_hash)'
+)
+
+UPSERT_SUMMARY = (
+    f"INSERT INTO market_summaries (industry, stage, {', '.join(SUMMED_COLUMNS)}, largest_raise, updated_at) "
+    f"VALUES ({', '.join('?' * (len(SUMMED_COLUMNS) + 4))}) "
+    f"ON CONFLICT (industry, stage) DO UPDATE SET "
+    + ', '.join(f'{column} = {column} + excluded.{column}' for column in SUMMED_COLUMNS)
+    + ', largest_raise = MAX(largest_raise, excluded.largest_raise), updated_at = excluded.updated_at'
+)
+
+UPSERT_MIX = (
+    'INSERT INTO market_summary_mix (industry, stage, dimension, value, startups) VALUES (?, ?, ?, ?, ?) '
+    'ON CONFLICT (industry, stage, dimension, value) DO UPDATE SET startups = startups + excluded.startups'
+)
+
+STARTUP_COLUMNS = ('id', 'industry', 'current_stage', 'market_size', 'revenue_model', 'funding_raised', 'funding_goal')
+
+# SQLite's default limit on bound parameters is 999 on older builds
+IN_CHUNK = 900
+
+# Served until any validation has been summarized; market_size and growth_projections always
+# come from here, as the tables carry nothing to estimate them from
+DEFAULT_MARKET_DATA = {
+    'market_size': {
+        'tam': '$2.4B',
+        'sam': '$450M',
+        'som': '$45M'
+    },
+    'customer_segments': {
+        'primary': 'Early-stage entrepreneurs (40%)',
+        'secondary': 'Student entrepreneurs (25%)',
+        'tertiary': 'Corporate innovators (20%)',
+        'other': 'Consultants and advisors (15%)'
+    },
+    'competitive_landscape': {
+        'direct_competitors': 3,
+        'indirect_competitors': 8,
+        'market_leader_share': '25%',
+        'competitive_intensity': 'Medium-High'
+    },
+    'market_trends': [
+        'Growing startup ecosystem (+15% YoY)',
+        'Increased focus on validation (+22% search volume)',
+        'AI adoption in business tools (+45% growth)',
+        'Remote entrepreneurship trend (+30% increase)'
+    ],
+    'growth_projections': {
+        'year_1': '$500K ARR',
+        'year_2': '$2M ARR',
+        'year_3': '$8M ARR',
+        'year_5': '$25M ARR'
+    }
+}
+
+# market_data sections that are baseline figures rather than read from the summaries
+PLACEHOLDER_SECTIONS = ('market_size', 'growth_projections')
+
+# The form's geographic market sizes, as customer segments
+MARKET_REACH_LABELS = {
+    'local': 'Local (city/region) customers',
+    'national': 'National customers',
+    'international': 'International customers',
+    'global': 'Global customers',
+    'unknown': 'Unspecified reach'
+}
+
+# A low average competition score means a crowded, well-served market
+COMPETITIVE_INTENSITY = {'high': 'Low', 'medium': 'Medium', 'low': 'High'}
+
+SCORE_NAMES = {name: key for key, name in SCORE_CATEGORIES}
+
+
+def classify_industry(text):
+    """Industry label for free text describing a startup"""
+    text = text.lower()
+    for label, pattern in INDUSTRY_PATTERNS:
+        if pattern.search(text):
+            return label
+    return DEFAULT_INDUSTRY
+
+
+def normalize_industry(industry):
+    """Summary key for an industry name; known labels keep their spelling whatever the case"""
+    industry = ' '.join(industry.split())
+    return INDUSTRY_LABELS.get(industry.lower(), industry) if industry else DEFAULT_INDUSTRY
+
+
+def normalize_stage(stage):
+    """One of STAGES for a stored or submitted stage, or 'other'"""
+    stage = stage.strip().lower() if isinstance(stage, str) else ''
+    stage = STAGE_ALIASES.get(stage, stage)
+    return stage if stage in STAGES else 'other'
+
+
+def form_industry(form):
+    return classify_industry(' '.join(
+        form.get(field) for field in ('problemStatement', 'solutionDescription', 'targetMarket')
+        if isinstance(form.get(field), str)
+    ))
+
+
+def percent(part, whole):
+    return f'{round(100 * part / whole) if whole else 0}%'
+
+
+def startup_key(row_id, startup_id, input_data_hash):
+    """Which startup a validations row counts towards: its startup, else the form it scored, else the row itself"""
+    if startup_id is not None:
+        return f'startup:{startup_id}'
+    if input_data_hash is not None:
+        return f'form:{input_data_hash}'
+    return f'row:{row_id}'
+
+
+class MarketAggregates:
+    """Column deltas for market_summaries and market_summary_mix, folded one validation at a time"""
+
+    def __init__(self):
+        self.summaries = {}  # (industry, stage) -> {column: delta}
+        self.mix = {}  # (industry, stage, dimension, value) -> startups
+
+    def add(self, overall_score, viability_level, scores, analysis_data, startup, new_startup):
+        """Fold one validations row in; startup is its startups row (or None), new_startup whether it is its first"""
+        form = {}
+        if analysis_data:
+            form = json.loads(analysis_data).get('input') or {}
+        if startup is not None:
+            industry = normalize_industry(startup['industry'] or form_industry(form))
+            stage = normalize_stage(startup['current_stage'] or form.get('currentStage'))
+            market_size = startup['market_size'] or form.get('marketSize')
+            revenue_model = startup['revenue_model'] or form.get('revenueModel')
+        else:
+            industry = form_industry(form)
+            stage = normalize_stage(form.get('currentStage'))
+            market_size = form.get('marketSize')
+            revenue_model = form.get('revenueModel')
+
+        delta = dict.fromkeys(SUMMED_COLUMNS, 0)
+        delta['validations'] = 1
+        delta['score_total'] = overall_score
+        for entry in json.loads(scores) if scores else ():
+            key = SCORE_NAMES.get(entry.get('category'))
+            if key is not None:
+                delta[f'{key}_total'] += entry.get('score') or 0
+        if viability_level in ('high', 'medium', 'low'):
+            delta[f'{viability_level}_viability'] = 1
+        elif viability_level == 'very-low':
+            delta['low_viability'] = 1
+
+        # Startup-level figures count once, on a startup's first validation
+        raised = 0
+        if new_startup:
+            delta['startups'] = 1
+            if startup is not None:
+                raised = startup['funding_raised'] or 0
+                delta['funding_raised'] = raised
+                delta['funding_goal'] = startup['funding_goal'] or 0
+
+        for scope in ((industry, stage), (industry, ALL), (ALL, stage), (ALL, ALL)):
+            summary = self.summaries.get(scope)
+            if summary is None:
+                self.summaries[scope] = summary = dict.fromkeys(SUMMED_COLUMNS, 0)
+                summary['largest_raise'] = 0
+            for column, value in delta.items():
+                summary[column] += value
+            summary['largest_raise'] = max(summary['largest_raise'], raised)
+            if new_startup:
+                for dimension, value in (('market_size', market_size), ('revenue_model', revenue_model)):
+                    value = value.strip().lower() if isinstance(value, str) and value.strip() else 'unknown'
+                    key = scope + (dimension, value)
+                    self.mix[key] = self.mix.get(key, 0) + 1
+
+    def write(self, conn):
+        """Add the folded deltas to the summary tables; runs inside the caller's transaction"""
+        now = datetime.now().isoformat()
+        conn.executemany(UPSERT_SUMMARY, [
+            scope + tuple(summary[column] for column in SUMMED_COLUMNS) + (summary['largest_raise'], now)
+            for scope, summary in self.summaries.items()
+        ])
+        conn.executemany(UPSERT_MIX, [key + (count,) for key, count in self.mix.items()])
+
+
+class MarketResearch:
+    """Per-industry, per-stage market summaries kept in the database and served from a per-process snapshot
+
+    Summaries are materialized in market_summaries, together with rollups over every stage
+    and every industry, and updated in the same transaction that inserts new validations.
+    Each process holds every summary pre-encoded, so a request costs one dict lookup; the
+    snapshot is reloaded at most every refresh_seconds, and only when the database changed.
+    A startup whose industry or stage is edited later keeps counting where it was first
+    seen until rebuild() recomputes everything from the tables.
+    """
+
+    def __init__(self, path=None, refresh_seconds=5.0):
+        self.path = path
+        self.refresh_seconds = refresh_seconds
+        self.lock = threading.Lock()
+        self.default = self.encode(self.default_payload())
+        self.snapshot = {}
+        self.loaded_at = None
+        self.data_version = None
+        self.conn = None
+        self.pid = None
+        self.stats_counts = {'reloads': 0, 'applied': 0}
+
+    def prepare(self, conn):
+        """Create the startups stand-in and the summary tables on a validations database"""
+        conn.execute(SQLITE_SCHEMA)
+        conn.execute(STARTUPS_SQLITE_SCHEMA)
+        for statement in SUMMARY_SCHEMA:
+            conn.execute(statement)
+        conn.commit()
+
+    def _startups(self, conn, ids):
+        startups = {}
+        ids = list(ids)
+        for i in range(0, len(ids), IN_CHUNK):
+            chunk = ids[i:i + IN_CHUNK]
+            cursor = conn.execute(
+                f"SELECT {', '.join(STARTUP_COLUMNS)} FROM startups WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            for row in cursor:
+                startups[row[0]] = dict(zip(STARTUP_COLUMNS, row))
+        return startups
+
+    def _validation_counts(self, conn, column, values):
+        """(value, validations rows) pairs for values of startup_id or input_data_hash; hashes count rows without a startup"""
+        anonymous = ' AND startup_id IS NULL' if column == 'input_data_hash' else ''
+        values = list(values)
+        for i in range(0, len(values), IN_CHUNK):
+            chunk = values[i:i + IN_CHUNK]
+            yield from conn.execute(
+                f"SELECT {column}, COUNT(*) FROM validations WHERE {column} IN ({', '.join('?' * len(chunk))})"
+                f"{anonymous} GROUP BY {column}", chunk
+            )
+
+    def apply(self, conn, rows):
+        """Fold freshly inserted validations rows (validation_store.COLUMNS order) into the summaries
+
+        Called by SQLiteBackend inside its insert transaction, after the rows are written.
+        """
+        ids = {row[1] for row in rows if row[1] is not None}
+        startups = self._startups(conn, ids)
+
+        # Validations per startup including this batch; a startup is new if the batch holds all of them.
+        # Validations without a startup count as one startup per form, so a resubmitted form is not new
+        hashes = {row[9] for row in rows if row[1] is None and row[9] is not None}
+        totals = {f'startup:{startup_id}': count
+                  for startup_id, count in self._validation_counts(conn, 'startup_id', ids)}
+        totals.update((f'form:{input_data_hash}', count)
+                      for input_data_hash, count in self._validation_counts(conn, 'input_data_hash', hashes))
+        keys = [startup_key(row[0], row[1], row[9]) for row in rows]
+        in_batch = {}
+        for key in keys:
+            in_batch[key] = in_batch.get(key, 0) + 1
+
+        aggregates = MarketAggregates()
+        seen = set()
+        for row, key in zip(rows, keys):
+            new_startup = key not in seen and totals.get(key, 0) <= in_batch[key]
+            seen.add(key)
+            aggregates.add(row[2], row[3], row[4], row[6], startups.get(row[1]), new_startup)
+        aggregates.write(conn)
+        self.stats_counts['applied'] += len(rows)
+        # This process sees its own writes on the next request
+        self.loaded_at = None
+
+    def rebuild(self, conn):
+        """Recompute every summary from the startups and validations tables"""
+        aggregates = MarketAggregates()
+        cursor = conn.execute(
+            'SELECT id, startup_id, overall_score, viability_level, scores, analysis_data, input_data_hash '
+            'FROM validations ORDER BY validated_at, id'
+        )
+        rows = cursor.fetchall()
+        startups = self._startups(conn, {row[1] for row in rows if row[1] is not None})
+        seen = set()
+        for row_id, startup_id, overall_score, viability_level, scores, analysis_data, input_data_hash in rows:
+            key = startup_key(row_id, startup_id, input_data_hash)
+            new_startup = key not in seen
+            seen.add(key)
+            aggregates.add(overall_score, viability_level, scores, analysis_data,
+                           startups.get(startup_id), new_startup)
+        with conn:
+            conn.execute('DELETE FROM market_summaries')
+            conn.execute('DELETE FROM market_summary_mix')
+            aggregates.write(conn)
+        self.loaded_at = None
+        return len(rows)
+
+    def _connect(self):
+        # Connections do not survive fork, so each prefork worker opens its own
+        if self.conn is None or self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self.prepare(self.conn)
+        return self.conn
+
+    def default_payload(self):
+        return {
+            'success': True,
+            'market_data': dict(DEFAULT_MARKET_DATA, placeholders=list(DEFAULT_MARKET_DATA)),
+            'scope': None,
+            'aggregates': None,
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def encode(self, payload):
+        body = codec.dumps(payload)
+        return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    def report(self, scope, summaries, mix):
+        """Response payload for one (industry, stage) summary"""
+        industry, stage = scope
+        summary = summaries[scope]
+        validations = summary['validations'] or 1
+        startups = summary['startups']
+        averages = {key: round(summary[f'{key}_total'] / validations) for key, _ in SCORE_CATEGORIES}
+
+        revenue_models = sorted(mix.get(scope + ('revenue_model',), {}).items(), key=lambda item: (-item[1], item[0]))
+
+        # Segments are the geographic reach the startups in this scope sell to, largest first
+        reaches = sorted(mix.get(scope + ('market_size',), {}).items(), key=lambda item: (-item[1], item[0]))
+        segments = {}
+        for slot, (reach, count) in zip(('primary', 'secondary', 'tertiary'), reaches):
+            label = MARKET_REACH_LABELS.get(reach, reach.replace('-', ' ').capitalize())
+            segments[slot] = f"{label} ({percent(count, startups)} of startups)"
+        for slot in ('primary', 'secondary', 'tertiary'):
+            segments.setdefault(slot, 'No data (0% of startups)')
+        segments['other'] = f"Other reach ({percent(sum(count for _, count in reaches[3:]), startups)} of startups)"
+
+        # Competitors are the other startups in this scope; indirect ones share the broader scope
+        if stage != ALL:
+            parent = (industry, ALL)
+        elif industry != ALL:
+            parent = (ALL, ALL)
+        else:
+            parent = None
+        indirect = summaries[parent]['startups'] - startups if parent in summaries else 0
+
+        ranked = sorted(SCORE_CATEGORIES, key=lambda category: averages[category[0]])
+        return {
+            'success': True,
+            'market_data': {
+                'market_size': DEFAULT_MARKET_DATA['market_size'],
+                'customer_segments': segments,
+                'competitive_landscape': {
+                    'direct_competitors': int(startups),
+                    'indirect_competitors': int(indirect),
+                    'market_leader_share': percent(summary['largest_raise'], summary['funding_raised']),
+                    'competitive_intensity': COMPETITIVE_INTENSITY[score_level(averages['competition'])]
+                },
+                'market_trends': [
+                    f"{int(summary['validations'])} validations across {int(startups)} startups, "
+                    f"averaging {round(summary['score_total'] / validations)}/100",
+                    f"Strongest area: {ranked[-1][1]} ({averages[ranked[-1][0]]}/100 on average)",
+                    f"Weakest area: {ranked[0][1]} ({averages[ranked[0][0]]}/100 on average)",
+                    f"{percent(summary['high_viability'], validations)} of validations rated high viability"
+                ],
+                'growth_projections': DEFAULT_MARKET_DATA['growth_projections'],
+                'placeholders': list(PLACEHOLDER_SECTIONS)
+            },
+            'scope': {'industry': industry, 'stage': stage},
+            'aggregates': {
+                'startups': int(startups),
+                'validations': int(summary['validations']),
+                'average_score': round(summary['score_total'] / validations, 1),
+                'category_averages': averages,
+                'viability': {level: int(summary[f'{level}_viability']) for level in ('high', 'medium', 'low')},
+                'market_sizes': mix.get(scope + ('market_size',), {}),
+                'revenue_models': dict(revenue_models),
+                'funding': {
+                    'raised': summary['funding_raised'],
+                    'goal': summary['funding_goal'],
+                    'largest_raise': summary['largest_raise']
+                }
+            },
+            'timestamp': summary['updated_at']
+        }
+
+    def _load(self, conn):
+        columns = ('industry', 'stage') + SUMMED_COLUMNS + ('largest_raise', 'updated_at')
+        summaries = {}
+        for row in conn.execute(f"SELECT {', '.join(columns)} FROM market_summaries"):
+            summary = dict(zip(columns, row))
+            summaries[(summary['industry'], summary['stage'])] = summary
+        mix = {}
+        for industry, stage, dimension, value, startups in conn.execute(
+                'SELECT industry, stage, dimension, value, startups FROM market_summary_mix'):
+            mix.setdefault((industry, stage, dimension), {})[value] = startups
+
+        snapshot = {}
+        for scope in summaries:
+            if summaries[scope]['validations']:
+                snapshot[(scope[0].lower(), scope[1])] = self.encode(self.report(scope, summaries, mix))
+        self.snapshot = snapshot
+        self.stats_counts['reloads'] += 1
+
+    def refresh(self):
+        """Reload the snapshot if refresh_seconds have passed and the database has changed since"""
+        now = time.monotonic()
+        if self.path is None or (self.loaded_at is not None and now - self.loaded_at < self.refresh_seconds):
+            return
+        # One thread reloads while the others keep serving the current snapshot
+        if not self.lock.acquire(blocking=self.loaded_at is None):
+            return
+        try:
+            conn = self._connect()
+            # data_version only changes when another connection commits
+            version = conn.execute('PRAGMA data_version').fetchone()[0]
+            if self.loaded_at is None or version != self.data_version:
+                self._load(conn)
+                self.data_version = version
+            self.loaded_at = now
+        finally:
+            self.lock.release()
+
+    def segment(self, params):
+        """(industry, stage) summary keys for a request: explicit fields first, else read from the form"""
+        industry = params.get('industry')
+        if isinstance(industry, str) and industry.strip():
+            industry = normalize_industry(industry)
+        elif any(isinstance(params.get(field), str) and params[field].strip()
+                 for field in ('problemStatement', 'solutionDescription', 'targetMarket')):
+            industry = form_industry(params)
+        else:
+            industry = ALL
+        stage = params.get('stage') or params.get('currentStage')
+        stage = normalize_stage(stage) if isinstance(stage, str) and stage.strip() else ALL
+        return industry, stage
+
+    def lookup(self, industry=ALL, stage=ALL):
+        """Pre-encoded (body, etag) for the narrowest summary with data, widening to all stages, then all industries"""
+        self.refresh()
+        snapshot = self.snapshot
+        industry = industry.lower()
+        for scope in ((industry, stage), (industry, ALL), (ALL, stage), (ALL, ALL)):
+            entry = snapshot.get(scope)
+            if entry is not None:
+                return entry
+        return self.default
+
+    def stats(self):
+        return dict(
+            self.stats_counts,
+            enabled=self.path is not None,
+            summaries=len(self.snapshot),
+            refresh_seconds=self.refresh_seconds
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rebuild the market-research summaries from the startups and validations tables')
+    parser.add_argument('database', nargs='?', default=sqlite_path_from_env('MARKET_RESEARCH_DB'), help='SQLite database (default: from the environment)')
+    args = parser.parse_args()
+    if not args.database:
+        parser.error('no database given and neither MARKET_RESEARCH_DB nor a sqlite VALIDATION_STORE_URL is set')
+
+    engine = MarketResearch(args.database)
+    conn = engine._connect()
+    started = time.perf_counter()
+    rows = engine.rebuild(conn)
+    summaries = conn.execute('SELECT COUNT(*) FROM market_summaries').fetchone()[0]
+    conn.close()
+    print(f"✅ Summarized {rows} validations into {summaries} market summaries in {time.perf_counter() - started:.2f}s")
+
+
+# Global per-process engine; without a SQLite database it serves DEFAULT_MARKET_DATA
+market_research = MarketResearch(
+    sqlite_path_from_env('MARKET_RESEARCH_DB'),
+    refresh_seconds=float(os.environ.get('MARKET_RESEARCH_REFRESH_SECONDS', 5.0))
+)
+
+# Validations persisted to the same SQLite file update the summaries as they are written
+if (market_research.path is not None and validation_store is not None
+        and isinstance(validation_store.backend, SQLiteBackend)
+        and os.path.abspath(validation_store.backend.path) == os.path.abspath(market_research.path)):
+    validation_store.backend.listeners.append(market_research)
+
+
+if __name__ == '__main__':
+    main()
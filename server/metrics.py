@@ -0,0 +1,134 @@
+import threading
+import time
+from bisect import bisect_left
+
+# Upper bounds in seconds; scoring stages are tens of microseconds, whole requests milliseconds
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5
+)
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{name}="{value}"' for name, value in labels) + '}'
+
+
+class Histogram:
+    """Fixed-bucket histogram per label set; callers hold the registry lock"""
+
+    def __init__(self, name, help_text, label_name, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_name = label_name
+        self.buckets = buckets
+        self.series = {}  # label value -> [bucket counts..., sum, count]
+
+    def observe(self, label, seconds):
+        series = self.series.get(label)
+        if series is None:
+            series = self.series[label] = [0] * (len(self.buckets) + 1) + [0.0, 0]
+        series[bisect_left(self.buckets, seconds)] += 1
+        series[-2] += seconds
+        series[-1] += 1
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        for label, series in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f'{self.name}_bucket{format_labels(((self.label_name, label), ("le", le)))} {cumulative}')
+            lines.append(f'{self.name}_sum{format_labels(((self.label_name, label),))} {series[-2]!r}')
+            lines.append(f'{self.name}_count{format_labels(((self.label_name, label),))} {series[-1]}')
+        return lines
+
+
+class MetricsRegistry:
+    """Per-process counters, gauges and histograms rendered in Prometheus text format"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stage_seconds = Histogram(
+            'validator_stage_seconds', 'Time spent in each validate_startup_idea stage', 'stage'
+        )
+        self.request_seconds = Histogram(
+            'http_request_duration_seconds', 'API request latency', 'endpoint'
+        )
+        self.requests = {}  # (endpoint, method, status) -> count
+        self.in_flight = 0
+        self.collectors = []
+
+    def observe_stages(self, laps):
+        with self.lock:
+            for stage, seconds in laps:
+                self.stage_seconds.observe(stage, seconds)
+
+    def request_started(self):
+        with self.lock:
+            self.in_flight += 1
+
+    def request_finished(self, endpoint, method, status, seconds):
+        with self.lock:
+            self.in_flight -= 1
+            key = (endpoint, method, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            self.request_seconds.observe(endpoint, seconds)
+
+    def add_collector(self, name, help_text, metric_type, collect):
+        """Register a callable returning {label value or None: number}, sampled at scrape time"""
+        self.collectors.append((name, help_text, metric_type, collect))
+
+    def render(self):
+        with self.lock:
+            lines = self.stage_seconds.render() + self.request_seconds.render()
+            lines += ['# HELP http_requests_total API requests by endpoint, method and status',
+                      '# TYPE http_requests_total counter']
+            for (endpoint, method, status), count in sorted(self.requests.items()):
+                labels = (('endpoint', endpoint), ('method', method), ('status', status))
+                lines.append(f'http_requests_total{format_labels(labels)} {count}')
+            lines += ['# HELP http_requests_in_flight API requests currently being served',
+                      '# TYPE http_requests_in_flight gauge',
+                      f'http_requests_in_flight {self.in_flight}']
+
+        for name, help_text, metric_type, collect in self.collectors:
+            try:
+                samples = collect()
+            except Exception:
+                continue
+            lines += [f'# HELP {name} {help_text}', f'# TYPE {name} {metric_type}']
+            for labels, value in samples.items():
+                lines.append(f'{name}{format_labels(labels or ())} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+class StageTimer:
+    """Lap timer for one validation; laps are published to the registry in a single lock acquisition"""
+
+    def __init__(self, registry=None):
+        self.registry = registry
+        self.laps = []
+        self.started = self.last = time.perf_counter()
+
+    def lap(self, stage):
+        now = time.perf_counter()
+        self.laps.append((stage, now - self.last))
+        self.last = now
+
+    def publish(self):
+        if self.registry is not None:
+            self.registry.observe_stages(self.laps)
+
+    def as_dict(self):
+        """Stage durations in milliseconds, plus the total since the timer started"""
+        timings = {}
+        for stage, seconds in self.laps:
+            timings[stage] = round(timings.get(stage, 0) + seconds * 1000, 4)
+        timings['total'] = round((self.last - self.started) * 1000, 4)
+        return timings
+
+
+# Global per-process registry; behind the prefork server each worker reports its own numbers
+metrics = MetricsRegistry()
@@ -1,18 +1,95 @@
-import pandas as pd
-import numpy as np
-from sklearn.ensemble import RandomForestRegressor, GradientBoostingRegressor
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import nltk
-from textblob import TextBlob
-import pickle
-import json
+import os
 import re
+import time
 from datetime import datetime
 
+from keyword_matcher import KeywordMatcher
+from lazy_imports import lazy_import
+from metrics import StageTimer, metrics
+from response_templates import (
+    FEEDBACK, RECOMMENDATIONS, SCORE_CATEGORIES, SUGGESTIONS, SWOT_CATEGORIES, SWOT_LIMIT,
+    SWOT_MARKET_OPPORTUNITIES, SWOT_SIGNALS, score_level
+)
+from pattern_index import DEFAULT_PATTERNS, PATTERN_FEATURES, PatternLibrary
+from score_model import load_score_model
+from sentiment import get_sentiment_backend
+from similarity_index import SimilarityIndex
+from text_features import EMPTY_FEATURES, TextFeatures
+from validation_cache import FieldScoreCache, ValidationCache
+from validation_store import validation_store
+
+# Heavy dependencies are imported on first use so worker cold starts stay fast
+np = lazy_import('numpy')
+
+# Bump whenever scoring weights or formulas change; stored as validations.validation_version
+ALGORITHM_VERSION = '1.0'
+
+# Form fields submitted by the validation wizard, in the order they appear
+FORM_FIELDS = (
+    'problemStatement', 'solutionDescription', 'uniqueValueProposition',
+    'targetMarket', 'marketSize', 'customerSegments',
+    'revenueModel', 'pricingStrategy', 'keyMetrics',
+    'directCompetitors', 'indirectCompetitors', 'competitiveAdvantage',
+    'teamSize', 'foundersExperience', 'keySkills',
+    'currentStage', 'existingTraction', 'fundingNeeds'
+)
+
+# Free-text fields that are scored with calculate_text_quality
+TEXT_QUALITY_FIELDS = (
+    'problemStatement', 'solutionDescription', 'uniqueValueProposition',
+    'targetMarket', 'customerSegments', 'pricingStrategy', 'keyMetrics',
+    'competitiveAdvantage', 'foundersExperience', 'keySkills',
+    'existingTraction', 'fundingNeeds'
+)
+
+# Category scores, in result order
+SCORE_KEYS = ('problem_solution', 'market', 'business_model', 'competition', 'team', 'traction')
+
+# Category score -> the analyze_* method behind it and the form fields it reads, in argument order
+CATEGORY_ANALYZERS = {
+    'problem_solution': ('analyze_problem_solution_fit', ('problemStatement', 'solutionDescription', 'uniqueValueProposition')),
+    'market': ('analyze_market_opportunity', ('targetMarket', 'marketSize', 'customerSegments')),
+    'business_model': ('analyze_business_model', ('revenueModel', 'pricingStrategy', 'keyMetrics')),
+    'competition': ('analyze_competition', ('directCompetitors', 'indirectCompetitors', 'competitiveAdvantage')),
+    'team': ('analyze_team_strength', ('teamSize', 'foundersExperience', 'keySkills')),
+    'traction': ('analyze_traction_readiness', ('currentStage', 'existingTraction', 'fundingNeeds'))
+}
+
+# Form field -> the category scores that depend on it
+FIELD_CATEGORIES = {
+    field: tuple(key for key, (_, fields) in CATEGORY_ANALYZERS.items() if field in fields)
+    for field in FORM_FIELDS
+}
+
+# Inputs of the learned score model: the six category scores plus the categorical lookups
+MODEL_FEATURES = SCORE_KEYS + ('market_size', 'revenue_model', 'team_size', 'current_stage')
+
 class StartupMLValidator:
-    def __init__(self):
-        self.vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+    def __init__(self, result_cache=None, text_quality_cache=None, sentiment=None,
+                 similarity_index=None, duplicate_threshold=None, score_model=None, pattern_library=None,
+                 store=None, approximate_chars=None, index_batches=False):
+        self.sentiment = sentiment if sentiment is not None else get_sentiment_backend()
+        # Optional write-behind persistence of results into the validations table
+        self.store = store
+        # Optional learned model (see score_model.py) that adds learned_score to results
+        self.score_model = score_model
+        # Results scored with different sentiment backends or models must not share cache entries
+        self.cache_version = f'{ALGORITHM_VERSION}+{self.sentiment.name}'
+        if score_model is not None:
+            self.cache_version += f'+model:{score_model.model_id}'
+        # Text fields longer than this are scored from streaming statistics and a sample (see text_features)
+        self.approximate_chars = approximate_chars
+        if approximate_chars:
+            self.cache_version += f'+approximate:{approximate_chars}'
+        self.result_cache = result_cache if result_cache is not None else ValidationCache()
+        self.text_quality_cache = text_quality_cache if text_quality_cache is not None else FieldScoreCache()
+        # Problem/solution TF-IDF index of validated startups; near-duplicate
+        # short-circuiting is opt-in because only two of the 18 fields are compared
+        self.similarity_index = similarity_index if similarity_index is not None else SimilarityIndex()
+        self.duplicate_threshold = duplicate_threshold
+        # Batch and stream scoring only feed the index when asked to; a bulk re-score would
+        # otherwise churn the whole index and the updater would fall behind
+        self.index_batches = index_batches
         self.market_keywords = {
             'b2b': ['business', 'enterprise', 'company', 'corporate', 'organization', 'professional'],
             'b2c': ['consumer', 'customer', 'user', 'people', 'individual', 'personal'],
@@ -25,29 +102,66 @@ class StartupMLValidator:
             'healthtech': ['health', 'medical', 'healthcare', 'wellness', 'fitness'],
             'edtech': ['education', 'learning', 'teaching', 'training', 'course']
         }
+
+        self.problem_keywords = ['problem', 'issue', 'challenge', 'pain', 'difficulty', 'struggle']
+        self.value_keywords = ['unique', 'better', 'faster', 'cheaper', 'innovative', 'first', 'only']
+        self.diff_keywords = ['unique', 'different', 'better', 'faster', 'cheaper', 'innovative', 'proprietary']
+        self.tech_keywords = ['technical', 'engineering', 'development', 'programming', 'software']
+
+        # One matcher over every keyword list, built once: a longest-first substring scan per keyword,
+        # skipping keywords implied by a longer hit; analyzers read per-group counts
+        self.keyword_matcher = KeywordMatcher({
+            'problem': self.problem_keywords,
+            'value': self.value_keywords,
+            'differentiation': self.diff_keywords,
+            'technical': self.tech_keywords,
+            **{f'market:{market_type}': keywords for market_type, keywords in self.market_keywords.items()}
+        })
+
+        self.market_groups = tuple(f'market:{market_type}' for market_type in self.market_keywords)
+
+        self.market_size_scores = {
+            'local': 0.3,
+            'national': 0.6,
+            'international': 0.8,
+            'global': 1.0
+        }
+        self.revenue_model_scores = {
+            'subscription': 0.9,
+            'marketplace': 0.8,
+            'freemium': 0.7,
+            'one-time': 0.6,
+            'advertising': 0.5,
+            'licensing': 0.7,
+            'other': 0.4
+        }
+        self.team_size_scores = {
+            'solo': 0.5,
+            '2-3': 0.8,
+            '4-6': 1.0,
+            '7-10': 0.9,
+            '10+': 0.7
+        }
+        self.stage_scores = {
+            'idea': 0.3,
+            'prototype': 0.6,
+            'beta': 0.8,
+            'early-revenue': 0.9,
+            'growth': 1.0
+        }
         
-        self.successful_patterns = [
-            {
-                'problem_clarity': 0.9,
-                'solution_uniqueness': 0.8,
-                'market_size': 0.85,
-                'team_experience': 0.75,
-                'business_model_strength': 0.8,
-                'competitive_advantage': 0.7,
-                'success_score': 92
-            },
-            {
-                'problem_clarity': 0.85,
-                'solution_uniqueness': 0.9,
-                'market_size': 0.7,
-                'team_experience': 0.8,
-                'business_model_strength': 0.85,
-                'competitive_advantage': 0.8,
-                'success_score': 88
-            },
-            # Add more patterns based on successful startups
-        ]
+        # Reference success patterns, one row each, searched by weighted nearest neighbour
+        self.successful_patterns = pattern_library if pattern_library is not None else PatternLibrary(DEFAULT_PATTERNS)
+        self.cache_version += f'+patterns:{self.successful_patterns.fingerprint}'
     
+    def warm_up(self):
+        """Import deferred dependencies and touch lookup tables, e.g. before preforking workers"""
+        np.zeros(1)
+        self.sentiment.polarity('warm up')
+        self.keyword_matcher.hits('warm up')
+        self.similarity_index.warm_up()
+        self.successful_patterns.tree
+
     def preprocess_text(self, text):
         """Clean and preprocess text for analysis"""
         if not text:
@@ -58,46 +172,134 @@ class StartupMLValidator:
         return text.strip()
     
     def calculate_text_quality(self, text):
-        """Calculate quality metrics for text input"""
+        """Calculate quality metrics for text input, memoized per field text"""
         if not text:
             return 0
-        
-        blob = TextBlob(text)
-        
-        # Length factor (optimal length between 50-300 characters)
-        length_score = min(len(text) / 200, 1.0) if len(text) > 20 else len(text) / 20
-        
-        # Sentiment analysis (neutral to positive is better)
-        sentiment = blob.sentiment.polarity
-        sentiment_score = (sentiment + 1) / 2  # Convert to 0-1 range
-        
-        # Word diversity
-        words = text.split()
-        unique_words = len(set(words))
-        diversity_score = min(unique_words / len(words), 1.0) if words else 0
-        
-        return (length_score * 0.4 + sentiment_score * 0.3 + diversity_score * 0.3)
+        return self.text_features(text, memoize=isinstance(text, str)).quality
+
+    def score_text_quality(self, text):
+        """Compute the text quality score without consulting the memo"""
+        return self.text_features(text, memoize=False).quality
+
+    def text_features(self, text, memoize=True):
+        """TextFeatures for a field value, with its quality score filled in
+
+        Analyzers accept raw strings too and pass them through here, so features already
+        built for a field are returned as they are.
+        """
+        if isinstance(text, TextFeatures):
+            return text
+        if not text:
+            return EMPTY_FEATURES
+        features = TextFeatures(text, approximate=bool(self.approximate_chars) and len(text) > self.approximate_chars)
+
+        # Only the edited fields of a resubmitted form miss the memo
+        score = self.text_quality_cache.get(text) if memoize else None
+        if score is None:
+            # Length factor (optimal length between 50-300 characters)
+            length = features.length
+            length_score = min(length / 200, 1.0) if length > 20 else length / 20
+
+            # Sentiment analysis (neutral to positive is better)
+            # A long field's sentiment and diversity are read from evenly spaced windows of it
+            features.sentiment = self.sentiment.polarity(features.sample, features.lower)
+            sentiment_score = (features.sentiment + 1) / 2  # Convert to 0-1 range
+
+            # Word diversity
+            words = features.sample.split()
+            features.word_count = len(words)
+            features.unique_count = len(set(words))
+            diversity_score = min(features.unique_count / features.word_count, 1.0) if features.word_count else 0
+
+            score = (length_score * 0.4 + sentiment_score * 0.3 + diversity_score * 0.3)
+            if memoize:
+                self.text_quality_cache.set(text, score)
+        features.quality = score
+        return features
+
+    def approximated_fields(self, data):
+        """TEXT_QUALITY_FIELDS of a record long enough to be scored approximately"""
+        if not self.approximate_chars:
+            return []
+        return [field for field in TEXT_QUALITY_FIELDS
+                if isinstance(data.get(field), str) and len(data[field]) > self.approximate_chars]
+
+    def keyword_matches(self, features, groups):
+        """Keywords of the given groups found in a field, scanned once per group tuple"""
+        if not features:
+            return frozenset()
+        found = features.keywords.get(groups)
+        if found is None:
+            found = features.keywords[groups] = self.keyword_matcher.matches_lower(features.lower, groups)
+        return found
+
+    def keyword_hits(self, features, groups):
+        """Per-group keyword counts for a field's TextFeatures"""
+        return self.keyword_matcher.count(self.keyword_matches(features, groups), groups)
     
+    def calculate_text_quality_batch(self, texts):
+        """Vectorized calculate_text_quality over a list of texts"""
+        count = len(texts)
+        lengths = np.fromiter((len(text) for text in texts), dtype=float, count=count)
+        word_counts = np.zeros(count)
+        unique_counts = np.zeros(count)
+        sentiments = np.zeros(count)
+        memoized = np.full(count, np.nan)
+
+        # Tokenization and sentiment are inherently per-text; everything else is array math
+        for i, text in enumerate(texts):
+            if text:
+                score = self.text_quality_cache.get(text)
+                if score is not None:
+                    memoized[i] = score
+                    continue
+                words = text.split()
+                word_counts[i] = len(words)
+                unique_counts[i] = len(set(words))
+                sentiments[i] = self.sentiment.polarity(text)
+
+        length_score = np.where(lengths > 20, np.minimum(lengths / 200, 1.0), lengths / 20)
+        sentiment_score = (sentiments + 1) / 2
+        diversity_score = np.where(
+            word_counts > 0, np.minimum(unique_counts / np.maximum(word_counts, 1), 1.0), 0.0
+        )
+
+        quality = length_score * 0.4 + sentiment_score * 0.3 + diversity_score * 0.3
+        quality = np.where(lengths > 0, quality, 0.0)
+
+        computed = np.isnan(memoized) & (lengths > 0)
+        for i in np.flatnonzero(computed):
+            self.text_quality_cache.set(texts[i], float(quality[i]))
+        return np.where(computed | (lengths == 0), quality, memoized)
+
+    def keyword_hits_batch(self, texts, groups):
+        """Per-group keyword counts for each text, as {group: array} with one matcher pass per text"""
+        per_text = [self.keyword_matcher.hits(text, groups) for text in texts]
+        return {group: np.fromiter((hits[group] for hits in per_text), dtype=float, count=len(texts))
+                for group in groups}
+
     def analyze_problem_solution_fit(self, problem_statement, solution_description, value_proposition):
         """Analyze problem-solution fit using ML"""
         
+        problem_statement = self.text_features(problem_statement)
+        solution_description = self.text_features(solution_description)
+        value_proposition = self.text_features(value_proposition)
+
         # Text quality scores
-        problem_quality = self.calculate_text_quality(problem_statement)
-        solution_quality = self.calculate_text_quality(solution_description)
-        value_prop_quality = self.calculate_text_quality(value_proposition)
+        problem_quality = problem_statement.quality
+        solution_quality = solution_description.quality
+        value_prop_quality = value_proposition.quality
         
         # Problem clarity analysis
-        problem_keywords = ['problem', 'issue', 'challenge', 'pain', 'difficulty', 'struggle']
-        problem_clarity = sum(1 for word in problem_keywords if word in problem_statement.lower()) / len(problem_keywords)
+        problem_clarity = self.keyword_hits(problem_statement, ('problem',))['problem'] / len(self.problem_keywords)
         
         # Solution-problem alignment
-        problem_words = set(self.preprocess_text(problem_statement).split())
-        solution_words = set(self.preprocess_text(solution_description).split())
+        problem_words = problem_statement.term_set()
+        solution_words = solution_description.term_set()
         alignment = len(problem_words.intersection(solution_words)) / max(len(problem_words), 1)
         
         # Value proposition strength
-        value_keywords = ['unique', 'better', 'faster', 'cheaper', 'innovative', 'first', 'only']
-        value_strength = sum(1 for word in value_keywords if word in value_proposition.lower()) / len(value_keywords)
+        value_strength = self.keyword_hits(value_proposition, ('value',))['value'] / len(self.value_keywords)
         
         score = (problem_quality * 0.3 + solution_quality * 0.3 + value_prop_quality * 0.2 + 
                 problem_clarity * 0.1 + alignment * 0.05 + value_strength * 0.05) * 100
@@ -108,24 +310,21 @@ class StartupMLValidator:
         """Analyze market opportunity"""
         
         # Market size scoring
-        size_scores = {
-            'local': 0.3,
-            'national': 0.6,
-            'international': 0.8,
-            'global': 1.0
-        }
-        size_score = size_scores.get(market_size, 0.5)
+        size_score = self.market_size_scores.get(market_size, 0.5)
         
+        target_market = self.text_features(target_market)
+
         # Target market clarity
-        market_quality = self.calculate_text_quality(target_market)
+        market_quality = target_market.quality
         
         # Customer segment analysis
-        segments_quality = self.calculate_text_quality(customer_segments)
+        segments_quality = self.text_features(customer_segments).quality
         
         # Market type detection
+        market_hits = self.keyword_hits(target_market, self.market_groups)
         market_type_scores = []
         for market_type, keywords in self.market_keywords.items():
-            overlap = sum(1 for keyword in keywords if keyword in target_market.lower())
+            overlap = market_hits[f'market:{market_type}']
             market_type_scores.append(overlap / len(keywords))
         
         market_focus = max(market_type_scores) if market_type_scores else 0
@@ -137,22 +336,13 @@ class StartupMLValidator:
         """Analyze business model strength"""
         
         # Revenue model scoring
-        model_scores = {
-            'subscription': 0.9,
-            'marketplace': 0.8,
-            'freemium': 0.7,
-            'one-time': 0.6,
-            'advertising': 0.5,
-            'licensing': 0.7,
-            'other': 0.4
-        }
-        model_score = model_scores.get(revenue_model, 0.5)
+        model_score = self.revenue_model_scores.get(revenue_model, 0.5)
         
         # Pricing strategy quality
-        pricing_quality = self.calculate_text_quality(pricing_strategy)
+        pricing_quality = self.text_features(pricing_strategy).quality
         
         # Metrics definition quality
-        metrics_quality = self.calculate_text_quality(key_metrics) if key_metrics else 0.3
+        metrics_quality = self.text_features(key_metrics).quality if key_metrics else 0.3
         
         score = (model_score * 0.4 + pricing_quality * 0.4 + metrics_quality * 0.2) * 100
         return min(score, 100)
@@ -164,12 +354,13 @@ class StartupMLValidator:
         comp_awareness = 0.7 if direct_competitors else 0.3
         comp_awareness += 0.2 if indirect_competitors else 0
         
+        competitive_advantage = self.text_features(competitive_advantage)
+
         # Competitive advantage quality
-        advantage_quality = self.calculate_text_quality(competitive_advantage)
+        advantage_quality = competitive_advantage.quality
         
         # Differentiation keywords
-        diff_keywords = ['unique', 'different', 'better', 'faster', 'cheaper', 'innovative', 'proprietary']
-        diff_score = sum(1 for word in diff_keywords if word in competitive_advantage.lower()) / len(diff_keywords)
+        diff_score = self.keyword_hits(competitive_advantage, ('differentiation',))['differentiation'] / len(self.diff_keywords)
         
         score = (comp_awareness * 0.3 + advantage_quality * 0.5 + diff_score * 0.2) * 100
         return min(score, 100)
@@ -178,24 +369,21 @@ class StartupMLValidator:
         """Analyze team strength"""
         
         # Team size scoring
-        size_scores = {
-            'solo': 0.5,
-            '2-3': 0.8,
-            '4-6': 1.0,
-            '7-10': 0.9,
-            '10+': 0.7
-        }
-        size_score = size_scores.get(team_size, 0.6)
+        size_score = self.team_size_scores.get(team_size, 0.6)
         
+        founders_experience = self.text_features(founders_experience)
+        key_skills = self.text_features(key_skills)
+
         # Experience quality
-        experience_quality = self.calculate_text_quality(founders_experience)
+        experience_quality = founders_experience.quality
         
         # Skills analysis
-        skills_quality = self.calculate_text_quality(key_skills) if key_skills else 0.4
+        skills_quality = key_skills.quality if key_skills else 0.4
         
-        # Technical skills detection
-        tech_keywords = ['technical', 'engineering', 'development', 'programming', 'software']
-        tech_score = sum(1 for word in tech_keywords if word in (founders_experience + ' ' + (key_skills or '')).lower())
+        # Technical skills detection; technical keywords have no spaces, so scanning the two
+        # fields apart finds the same keywords as scanning them joined by a space
+        found = self.keyword_matches(founders_experience, ('technical',)) | self.keyword_matches(key_skills, ('technical',))
+        tech_score = self.keyword_matcher.count(found, ('technical',))['technical']
         tech_score = min(tech_score / 3, 1.0)
         
         score = (size_score * 0.25 + experience_quality * 0.4 + skills_quality * 0.25 + tech_score * 0.1) * 100
@@ -205,24 +393,27 @@ class StartupMLValidator:
         """Analyze execution readiness and traction"""
         
         # Stage scoring
-        stage_scores = {
-            'idea': 0.3,
-            'prototype': 0.6,
-            'beta': 0.8,
-            'early-revenue': 0.9,
-            'growth': 1.0
-        }
-        stage_score = stage_scores.get(current_stage, 0.4)
+        stage_score = self.stage_scores.get(current_stage, 0.4)
         
         # Traction quality
-        traction_quality = self.calculate_text_quality(existing_traction) if existing_traction else 0.2
+        traction_quality = self.text_features(existing_traction).quality if existing_traction else 0.2
         
         # Funding clarity
-        funding_quality = self.calculate_text_quality(funding_needs) if funding_needs else 0.5
+        funding_quality = self.text_features(funding_needs).quality if funding_needs else 0.5
         
         score = (stage_score * 0.4 + traction_quality * 0.4 + funding_quality * 0.2) * 100
         return min(score, 100)
     
+    def score_categories(self, data, keys=SCORE_KEYS, timer=None):
+        """Run the analyzers behind the given category scores, lapping timer after each"""
+        scores = {}
+        for key in keys:
+            method, fields = CATEGORY_ANALYZERS[key]
+            scores[key] = getattr(self, method)(*(data.get(field, '') for field in fields))
+            if timer is not None:
+                timer.lap(key)
+        return scores
+
     def calculate_investor_readiness(self, scores):
         """Calculate investor readiness based on all scores"""
         
@@ -256,258 +447,456 @@ class StartupMLValidator:
     
     def get_recommendations(self, scores, data):
         """Generate AI-powered recommendations"""
-        
-        recommendations = []
-        
-        if scores['problem_solution'] < 70:
-            recommendations.append({
-                'category': 'Problem-Solution Fit',
-                'priority': 'high',
-                'suggestion': 'Conduct customer interviews to better validate the problem and refine your solution.',
-                'action': 'Interview 20-30 potential customers about the problem severity'
-            })
-        
-        if scores['market'] < 60:
-            recommendations.append({
-                'category': 'Market Opportunity',
-                'priority': 'high',
-                'suggestion': 'Better define your target market and customer segments with specific demographics.',
-                'action': 'Create detailed customer personas and market sizing analysis'
-            })
-        
-        if scores['team'] < 65:
-            recommendations.append({
-                'category': 'Team Strength',
-                'priority': 'medium',
-                'suggestion': 'Consider adding team members with complementary skills or industry experience.',
-                'action': 'Identify key skill gaps and recruit advisors or co-founders'
-            })
-        
-        if scores['competition'] < 70:
-            recommendations.append({
-                'category': 'Competitive Advantage',
-                'priority': 'medium',
-                'suggestion': 'Strengthen your unique value proposition and competitive differentiation.',
-                'action': 'Analyze competitors more thoroughly and identify sustainable advantages'
-            })
-        
-        return recommendations
+        return [recommendation for key, threshold, recommendation in RECOMMENDATIONS if scores[key] < threshold]
 
     def get_feedback(self, category, score):
         """Generate feedback based on category and score"""
+        return FEEDBACK.get((category, score_level(score)), 'Analysis complete.')
 
-        feedback_templates = {
-            'problem_solution': {
-                'high': 'Strong problem identification with clear solution approach. The value proposition is well-defined.',
-                'medium': 'Good foundation, but needs more specific problem definition and solution clarity.',
-                'low': 'Problem-solution fit needs significant improvement. Consider customer interviews to validate assumptions.'
-            },
-            'market': {
-                'high': 'Good market understanding with clear target segments and sizing.',
-                'medium': 'Market opportunity is identified but needs more detailed analysis and validation.',
-                'low': 'Market analysis needs substantial improvement. Focus on defining specific customer segments.'
-            },
-            'business_model': {
-                'high': 'Solid revenue model with clear monetization strategy. Pricing approach is reasonable.',
-                'medium': 'Business model has potential but needs refinement in pricing and revenue streams.',
-                'low': 'Business model requires significant development. Consider multiple revenue streams and validate pricing.'
-            },
-            'competition': {
-                'high': 'Good competitive analysis with clear differentiation and sustainable advantages.',
-                'medium': 'Competitive landscape is understood but differentiation could be stronger.',
-                'low': 'Competitive analysis needs improvement. Focus on unique value proposition and defensibility.'
-            },
-            'team': {
-                'high': 'Strong team with relevant experience and complementary skills.',
-                'medium': 'Good foundational team but some skill gaps may need to be addressed.',
-                'low': 'Team needs strengthening. Consider adding expertise or advisory support.'
-            },
-            'traction': {
-                'high': 'Strong execution plan with realistic milestones and good progress indicators.',
-                'medium': 'Execution plan is developing but needs more specific milestones and validation.',
-                'low': 'Execution readiness needs improvement. Focus on MVP development and early validation.'
-            }
-        }
+    def get_suggestions(self, category, score):
+        """Generate suggestions based on category and score"""
+        # Return 2-4 relevant suggestions based on score
+        return SUGGESTIONS.get((category, score_level(score)), ())
 
-        if score >= 75:
-            level = 'high'
-        elif score >= 55:
-            level = 'medium'
+    def result_scores(self, result):
+        """Category scores (rounded) recovered from a formatted result"""
+        return {key: entry['score'] for (key, _), entry in zip(SCORE_CATEGORIES, result['scores'])}
+
+    def category_scores(self, data):
+        """Category scores from the form's cached result, else scored afresh without caching, indexing or persisting"""
+        cached = self.result_cache.get(ValidationCache.key_for(data, FORM_FIELDS, self.cache_version))
+        if cached is not None and cached.get('success'):
+            return self.result_scores(cached)
+        return self.score_categories(data)
+
+    def swot_signals(self, scores, data):
+        """SWOT_SIGNALS names that apply, from keyword-group hits, select fields and category scores"""
+        signals = []
+        levels = {key: score_level(round(scores[key])) for key in SCORE_KEYS}
+
+        # Analyzers score null fields as empty, so they read as empty here too
+        team_text = f"{data.get('foundersExperience') or ''} {data.get('keySkills') or ''}"
+        if self.keyword_matcher.hits(team_text, ('technical',))['technical']:
+            signals.append('technical_team')
         else:
-            level = 'low'
+            signals.append('no_technical_team')
+        value_text = f"{data.get('uniqueValueProposition') or ''} {data.get('competitiveAdvantage') or ''}"
+        if self.keyword_matcher.hits(value_text, ('differentiation',))['differentiation'] >= 2:
+            signals.append('differentiators')
+        if data.get('revenueModel') == 'subscription':
+            signals.append('recurring_revenue')
 
-        return feedback_templates.get(category, {}).get(level, 'Analysis complete.')
+        stage = data.get('currentStage')
+        if stage in ('early-revenue', 'growth'):
+            signals.append('revenue')
+        elif stage == 'idea':
+            signals.append('idea_stage')
+        if data.get('teamSize') == 'solo':
+            signals.append('solo_founder')
 
-    def get_suggestions(self, category, score):
-        """Generate suggestions based on category and score"""
+        competitors = re.split(r'[,;\n]+', (data.get('directCompetitors') or '').strip())
+        if not competitors[0]:
+            signals.append('unknown_competitors')
+        elif len(competitors) >= 3:
+            signals.append('crowded_market')
 
-        suggestion_templates = {
-            'problem_solution': [
-                'Conduct customer interviews to validate problem severity',
-                'Test solution assumptions with early prototypes',
-                'Quantify the problem impact with market research',
-                'Refine value proposition based on customer feedback'
-            ],
-            'market': [
-                'Define specific customer personas with demographics',
-                'Research total addressable market (TAM) size',
-                'Analyze market growth trends and dynamics',
-                'Validate market demand through surveys or interviews'
-            ],
-            'business_model': [
-                'Test pricing strategy with potential customers',
-                'Consider multiple revenue streams for diversification',
-                'Plan customer acquisition costs and channels',
-                'Develop unit economics and profitability models'
-            ],
-            'competition': [
-                'Strengthen unique value proposition and differentiators',
-                'Identify sustainable competitive moats',
-                'Monitor competitor strategies and positioning',
-                'Develop defensive strategies against competition'
-            ],
-            'team': [
-                'Consider bringing in technical co-founder or CTO',
-                'Build advisory board with industry experts',
-                'Plan key hiring priorities and skill development',
-                'Assess team gaps and recruitment needs'
-            ],
-            'traction': [
-                'Create detailed development roadmap with milestones',
-                'Establish key performance indicators (KPIs)',
-                'Plan for regulatory and compliance requirements',
-                'Develop MVP and gather early user feedback'
+        if levels['market'] == 'high':
+            signals.append('large_market')
+        market_size = data.get('marketSize')
+        if market_size in ('international', 'global'):
+            signals.append('global_reach')
+        elif market_size in ('local', 'national'):
+            signals.append('regional_market')
+
+        if levels['competition'] == 'low':
+            signals.append('strong_competitors')
+        if levels['business_model'] == 'low':
+            signals.append('pricing_pressure')
+        if levels['traction'] == 'low':
+            signals.append('runway')
+        return signals
+
+    def swot_analysis(self, scores, data):
+        """SWOT derived from the category scores plus keyword-group hits and select fields"""
+        swot = {'strengths': [], 'weaknesses': [], 'opportunities': [], 'threats': []}
+
+        # Strongest categories lead the strengths, weakest lead the weaknesses
+        ranked = sorted(SCORE_KEYS, key=lambda key: scores[key], reverse=True)
+        for key in ranked:
+            if score_level(round(scores[key])) == 'high':
+                swot['strengths'].append(SWOT_CATEGORIES[key][0])
+        for key in reversed(ranked):
+            if score_level(round(scores[key])) == 'low':
+                swot['weaknesses'].append(SWOT_CATEGORIES[key][1])
+
+        # The two market types named most in the target market or solution
+        market_text = f"{data.get('targetMarket') or ''} {data.get('solutionDescription') or ''}"
+        market_hits = self.keyword_matcher.hits(market_text, self.market_groups)
+        market_types = sorted((group for group in self.market_groups if market_hits[group]),
+                              key=lambda group: market_hits[group], reverse=True)
+        for group in market_types[:2]:
+            swot['opportunities'].append(SWOT_MARKET_OPPORTUNITIES[group[len('market:'):]])
+
+        signals = self.swot_signals(scores, data)
+        if {'market:fintech', 'market:healthtech'} & set(market_types):
+            signals.append('regulation')
+        if {'market:ai', 'market:saas', 'market:mobile'} & set(market_types):
+            signals.append('technology_shift')
+        for signal in signals:
+            quadrant, entry = SWOT_SIGNALS[signal]
+            swot[quadrant].append(entry)
+
+        # Never leave a quadrant empty
+        if not swot['strengths']:
+            best = ranked[0]
+            swot['strengths'].append(SWOT_CATEGORIES[best][0] if score_level(round(scores[best])) == 'medium'
+                                     else SWOT_SIGNALS['early_stage'][1])
+        if not swot['weaknesses']:
+            swot['weaknesses'].append(SWOT_CATEGORIES[ranked[-1]][1])
+        if not swot['opportunities']:
+            swot['opportunities'].append(SWOT_SIGNALS['partnerships'][1])
+        if not swot['threats']:
+            swot['threats'].append(SWOT_SIGNALS['economy'][1])
+
+        return {quadrant: entries[:SWOT_LIMIT] for quadrant, entries in swot.items()}
+
+    def categorical_features(self, data):
+        return [
+            self.market_size_scores.get(data.get('marketSize', ''), 0.5),
+            self.revenue_model_scores.get(data.get('revenueModel', ''), 0.5),
+            self.team_size_scores.get(data.get('teamSize', ''), 0.6),
+            self.stage_scores.get(data.get('currentStage', ''), 0.4)
+        ]
+
+    def model_features(self, scores, data):
+        """Feature vector (MODEL_FEATURES order) for one record's category scores"""
+        return [scores[key] for key in SCORE_KEYS] + self.categorical_features(data)
+
+    def model_feature_matrix(self, score_arrays, records):
+        """Feature matrix (MODEL_FEATURES order) for score_batch output"""
+        categorical = np.array([self.categorical_features(data) for data in records], dtype=float).reshape(len(records), 4)
+        return np.column_stack([score_arrays[key] for key in SCORE_KEYS] + [categorical])
+
+    def pattern_features(self, scores, data):
+        """Map one record's category scores onto the PATTERN_FEATURES dimensions"""
+        return [
+            scores['problem_solution'] / 100,
+            (scores['problem_solution'] + scores['competition']) / 200,
+            self.market_size_scores.get(data.get('marketSize', ''), 0.5),
+            scores['team'] / 100,
+            scores['business_model'] / 100,
+            scores['competition'] / 100
+        ]
+
+    def pattern_feature_matrix(self, score_arrays, records):
+        """Pattern features (PATTERN_FEATURES order) for score_batch output"""
+        return np.column_stack([
+            score_arrays['problem_solution'] / 100,
+            (score_arrays['problem_solution'] + score_arrays['competition']) / 200,
+            [self.market_size_scores.get(data.get('marketSize', ''), 0.5) for data in records],
+            score_arrays['team'] / 100,
+            score_arrays['business_model'] / 100,
+            score_arrays['competition'] / 100
+        ])
+
+    def nearest_patterns(self, features, k=5):
+        """k nearest success patterns for one feature vector (dict or sequence) or a 2-D batch
+
+        Returns [{'pattern', 'distance', 'success_score'}] for a single vector, or a list of
+        those lists for a batch.
+        """
+        if isinstance(features, dict):
+            features = [features[name] for name in PATTERN_FEATURES]
+        single = np.ndim(features) == 1
+        distances, indices = self.successful_patterns.query(features, k)
+        success_scores = self.successful_patterns.success_scores[indices]
+        matches = [
+            [
+                {'pattern': int(i), 'distance': round(float(d), 4), 'success_score': float(score)}
+                for i, d, score in zip(row_indices, row_distances, row_scores)
             ]
-        }
+            for row_indices, row_distances, row_scores in zip(indices, distances, success_scores)
+        ]
+        return matches[0] if single else matches
+
+    def format_result(self, scores, data, learned_score=None, pattern_score=None, timer=None):
+        """Build the API response from the six category scores"""
 
-        # Return 3-4 relevant suggestions based on score
-        suggestions = suggestion_templates.get(category, [])
-        if score >= 75:
-            return suggestions[:2]  # Fewer suggestions for high scores
-        elif score >= 55:
-            return suggestions[:3]  # Medium number for medium scores
+        # Calculate overall score
+        overall_score = sum(scores.values()) / len(scores)
+        
+        # Get investor readiness metrics
+        investor_metrics = self.calculate_investor_readiness(scores)
+        if timer is not None:
+            timer.lap('investor_readiness')
+        
+        # Generate recommendations
+        recommendations = self.get_recommendations(scores, data)
+        if timer is not None:
+            timer.lap('recommendations')
+        
+        # Determine viability level
+        if overall_score >= 75:
+            viability_level = 'High'
+        elif overall_score >= 55:
+            viability_level = 'Moderate'
         else:
-            return suggestions  # All suggestions for low scores
+            viability_level = 'Low'
+        
+        # Format scores for frontend from the shared (category, level) tables
+        formatted_scores = []
+        for key, name in SCORE_CATEGORIES:
+            level = score_level(scores[key])
+            formatted_scores.append({
+                'category': name,
+                'score': round(scores[key]),
+                'feedback': FEEDBACK[(key, level)],
+                'suggestions': SUGGESTIONS[(key, level)]
+            })
+
+        if timer is not None:
+            timer.lap('feedback')
+
+        result = {
+            'success': True,
+            'overall_score': round(overall_score),
+            'viability_level': viability_level,
+            'scores': formatted_scores,
+            'investor_readiness_score': investor_metrics['score'],
+            'founder_readiness_score': investor_metrics['founder_readiness'],
+            'clarity_score': investor_metrics['idea_clarity'],
+            'timestamp': datetime.now().isoformat()
+        }
+
+        # Similarity to the nearest reference success patterns
+        if pattern_score is None:
+            pattern_score = self.successful_patterns.score(self.pattern_features(scores, data))[0]
+        result['pattern_score'] = round(pattern_score)
+        if timer is not None:
+            timer.lap('pattern_match')
+
+        if self.score_model is not None:
+            if learned_score is None:
+                learned_score = self.score_model.predict_one(self.model_features(scores, data))
+            result['learned_score'] = max(0, min(100, round(learned_score)))
+            result['model_version'] = f'{self.score_model.validation_version}+{self.score_model.model_id}'
+            if timer is not None:
+                timer.lap('learned_score')
+
+        approximated = self.approximated_fields(data)
+        if approximated:
+            result['approximate'] = True
+            result['approximate_fields'] = approximated
+
+        return result
+
+    def persist(self, data, result, cache_key, processing_time_ms, recommendations=None):
+        """Hand a result and its recommendations to the validations store, if one is configured"""
+        if self.store is not None:
+            self.store.record(data, result, cache_key, ALGORITHM_VERSION, processing_time_ms, recommendations)
+
+    def validate_startup_idea(self, data, timer=None):
+        """Main validation function using ML analysis
+
+        Stage durations are recorded on timer; without one they go straight to the metrics registry.
+        """
+        owns_timer = timer is None
+        if owns_timer:
+            timer = StageTimer(metrics)
 
-    def validate_startup_idea(self, data):
-        """Main validation function using ML analysis"""
-        
         try:
-            # Extract and clean data
-            problem_statement = data.get('problemStatement', '')
-            solution_description = data.get('solutionDescription', '')
-            value_proposition = data.get('uniqueValueProposition', '')
-            target_market = data.get('targetMarket', '')
-            market_size = data.get('marketSize', '')
-            customer_segments = data.get('customerSegments', '')
-            revenue_model = data.get('revenueModel', '')
-            pricing_strategy = data.get('pricingStrategy', '')
-            key_metrics = data.get('keyMetrics', '')
-            direct_competitors = data.get('directCompetitors', '')
-            indirect_competitors = data.get('indirectCompetitors', '')
-            competitive_advantage = data.get('competitiveAdvantage', '')
-            team_size = data.get('teamSize', '')
-            founders_experience = data.get('foundersExperience', '')
-            key_skills = data.get('keySkills', '')
-            current_stage = data.get('currentStage', '')
-            existing_traction = data.get('existingTraction', '')
-            funding_needs = data.get('fundingNeeds', '')
-            
-            # Calculate individual scores
-            scores = {
-                'problem_solution': self.analyze_problem_solution_fit(
-                    problem_statement, solution_description, value_proposition
-                ),
-                'market': self.analyze_market_opportunity(
-                    target_market, market_size, customer_segments
-                ),
-                'business_model': self.analyze_business_model(
-                    revenue_model, pricing_strategy, key_metrics
-                ),
-                'competition': self.analyze_competition(
-                    direct_competitors, indirect_competitors, competitive_advantage
-                ),
-                'team': self.analyze_team_strength(
-                    team_size, founders_experience, key_skills
-                ),
-                'traction': self.analyze_traction_readiness(
-                    current_stage, existing_traction, funding_needs
-                )
-            }
-            
-            # Calculate overall score
-            overall_score = sum(scores.values()) / len(scores)
-            
-            # Get investor readiness metrics
-            investor_metrics = self.calculate_investor_readiness(scores)
-            
-            # Generate recommendations
-            recommendations = self.get_recommendations(scores, data)
-            
-            # Determine viability level
-            if overall_score >= 75:
-                viability_level = 'High'
-            elif overall_score >= 55:
-                viability_level = 'Moderate'
-            else:
-                viability_level = 'Low'
-            
-            # Format scores for frontend
-            formatted_scores = [
-                {
-                    'category': 'Problem-Solution Fit',
-                    'score': round(scores['problem_solution']),
-                    'feedback': self.get_feedback('problem_solution', scores['problem_solution']),
-                    'suggestions': self.get_suggestions('problem_solution', scores['problem_solution'])
-                },
-                {
-                    'category': 'Market Opportunity',
-                    'score': round(scores['market']),
-                    'feedback': self.get_feedback('market', scores['market']),
-                    'suggestions': self.get_suggestions('market', scores['market'])
-                },
-                {
-                    'category': 'Business Model',
-                    'score': round(scores['business_model']),
-                    'feedback': self.get_feedback('business_model', scores['business_model']),
-                    'suggestions': self.get_suggestions('business_model', scores['business_model'])
-                },
-                {
-                    'category': 'Competitive Advantage',
-                    'score': round(scores['competition']),
-                    'feedback': self.get_feedback('competition', scores['competition']),
-                    'suggestions': self.get_suggestions('competition', scores['competition'])
-                },
-                {
-                    'category': 'Team Strength',
-                    'score': round(scores['team']),
-                    'feedback': self.get_feedback('team', scores['team']),
-                    'suggestions': self.get_suggestions('team', scores['team'])
-                },
-                {
-                    'category': 'Execution Readiness',
-                    'score': round(scores['traction']),
-                    'feedback': self.get_feedback('traction', scores['traction']),
-                    'suggestions': self.get_suggestions('traction', scores['traction'])
-                }
-            ]
+            # Identical submissions are served from the result cache
+            cache_key = ValidationCache.key_for(data, FORM_FIELDS, self.cache_version)
+            cached = self.result_cache.get(cache_key)
+            timer.lap('cache_lookup')
+            if cached is not None:
+                # Only the first submission of a form is stored; a resubmission adds no row
+                return cached
+
+            if self.duplicate_threshold:
+                duplicate = self.similarity_index.find_duplicate(data, self.duplicate_threshold)
+                # The index only keeps keys; a duplicate whose result has left the cache is scored anew
+                duplicate_result = self.result_cache.get(duplicate['key']) if duplicate is not None else None
+                if duplicate_result is not None:
+                    result = dict(duplicate_result, near_duplicate_of={
+                        'id': duplicate['id'],
+                        'similarity': duplicate['similarity']
+                    })
+                    timer.lap('duplicate_lookup')
+                    # The duplicate's exact scores are gone, so its recommendations come from the rounded ones
+                    self.persist(data, result, cache_key, (time.perf_counter() - timer.started) * 1000,
+                                 self.get_recommendations(self.result_scores(result), data))
+                    return result
+                timer.lap('duplicate_lookup')
+
+            # Calculate individual scores, timing each analyzer
+            scores = self.score_categories(data, timer=timer)
+
+            result = self.format_result(scores, data, timer=timer)
+            self.result_cache.set(cache_key, dict(result))
+            self.similarity_index.add_async(cache_key, data)
+            self.persist(data, result, cache_key, (time.perf_counter() - timer.started) * 1000,
+                         self.get_recommendations(scores, data))
+            timer.lap('store')
+            return result
 
-            return {
-                'success': True,
-                'overall_score': round(overall_score),
-                'viability_level': viability_level,
-                'scores': formatted_scores,
-                'investor_readiness_score': investor_metrics['score'],
-                'founder_readiness_score': investor_metrics['founder_readiness'],
-                'clarity_score': investor_metrics['idea_clarity'],
-                'timestamp': datetime.now().isoformat()
-            }
-            
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e)
             }
 
+        finally:
+            if owns_timer:
+                timer.publish()
+
+    def score_batch(self, records):
+        """Compute the six category scores for a batch of records as NumPy arrays"""
+
+        def column(field):
+            return [data.get(field, '') for data in records]
+
+        def lookup(field, table, default):
+            return np.array([table.get(value, default) for value in column(field)])
+
+        def present(field):
+            return np.array([bool(value) for value in column(field)])
+
+        quality = {field: self.calculate_text_quality_batch(column(field)) for field in TEXT_QUALITY_FIELDS}
+
+        # Problem-solution fit
+        problem_clarity = self.keyword_hits_batch(column('problemStatement'), ('problem',))['problem'] / len(self.problem_keywords)
+        alignment = np.zeros(len(records))
+        for i, data in enumerate(records):
+            problem_words = set(self.preprocess_text(data.get('problemStatement', '')).split())
+            solution_words = set(self.preprocess_text(data.get('solutionDescription', '')).split())
+            alignment[i] = len(problem_words.intersection(solution_words)) / max(len(problem_words), 1)
+        value_strength = self.keyword_hits_batch(column('uniqueValueProposition'), ('value',))['value'] / len(self.value_keywords)
+        problem_solution = (quality['problemStatement'] * 0.3 + quality['solutionDescription'] * 0.3 +
+                            quality['uniqueValueProposition'] * 0.2 + problem_clarity * 0.1 +
+                            alignment * 0.05 + value_strength * 0.05) * 100
+
+        # Market opportunity
+        market_hits = self.keyword_hits_batch(column('targetMarket'), self.market_groups)
+        market_focus = np.zeros(len(records))
+        for market_type, keywords in self.market_keywords.items():
+            market_focus = np.maximum(market_focus, market_hits[f'market:{market_type}'] / len(keywords))
+        market = (lookup('marketSize', self.market_size_scores, 0.5) * 0.3 + quality['targetMarket'] * 0.3 +
+                  quality['customerSegments'] * 0.3 + market_focus * 0.1) * 100
+
+        # Business model
+        metrics_quality = np.where(present('keyMetrics'), quality['keyMetrics'], 0.3)
+        business_model = (lookup('revenueModel', self.revenue_model_scores, 0.5) * 0.4 +
+                          quality['pricingStrategy'] * 0.4 + metrics_quality * 0.2) * 100
+
+        # Competition
+        comp_awareness = np.where(present('directCompetitors'), 0.7, 0.3) + np.where(present('indirectCompetitors'), 0.2, 0)
+        diff_score = self.keyword_hits_batch(column('competitiveAdvantage'), ('differentiation',))['differentiation'] / len(self.diff_keywords)
+        competition = (comp_awareness * 0.3 + quality['competitiveAdvantage'] * 0.5 + diff_score * 0.2) * 100
+
+        # Team
+        skills_quality = np.where(present('keySkills'), quality['keySkills'], 0.4)
+        team_text = [experience + ' ' + (skills or '') for experience, skills in zip(column('foundersExperience'), column('keySkills'))]
+        tech_score = np.minimum(self.keyword_hits_batch(team_text, ('technical',))['technical'] / 3, 1.0)
+        team = (lookup('teamSize', self.team_size_scores, 0.6) * 0.25 + quality['foundersExperience'] * 0.4 +
+                skills_quality * 0.25 + tech_score * 0.1) * 100
+
+        # Traction
+        traction_quality = np.where(present('existingTraction'), quality['existingTraction'], 0.2)
+        funding_quality = np.where(present('fundingNeeds'), quality['fundingNeeds'], 0.5)
+        traction = (lookup('currentStage', self.stage_scores, 0.4) * 0.4 + traction_quality * 0.4 + funding_quality * 0.2) * 100
+
+        return {
+            'problem_solution': np.minimum(problem_solution, 100),
+            'market': np.minimum(market, 100),
+            'business_model': np.minimum(business_model, 100),
+            'competition': np.minimum(competition, 100),
+            'team': np.minimum(team, 100),
+            'traction': np.minimum(traction, 100)
+        }
+
+    def validate_batch(self, records):
+        """Validate many startup ideas in one call, returning one result per record"""
+
+        started = time.perf_counter()
+        results = [None] * len(records)
+
+        # Records with non-string fields take the single-record path so they fail the same way,
+        # and so do records with fields long enough to be scored approximately
+        batch_index = []
+        cache_keys = {}
+        recommendations = {}
+        # Repeats of a form within the batch get a copy of its first occurrence's result, as cache hits do
+        first_index = {}
+        repeats = []
+        for i, data in enumerate(records):
+            if (isinstance(data, dict) and all(isinstance(data.get(field, ''), str) for field in FORM_FIELDS)
+                    and not self.approximated_fields(data)):
+                cache_keys[i] = ValidationCache.key_for(data, FORM_FIELDS, self.cache_version)
+                if cache_keys[i] in first_index:
+                    repeats.append((i, first_index[cache_keys[i]]))
+                    continue
+                first_index[cache_keys[i]] = i
+                results[i] = self.result_cache.get(cache_keys[i])
+                if results[i] is None:
+                    batch_index.append(i)
+            else:
+                results[i] = self.validate_startup_idea(data)
+
+        if batch_index:
+            batch = [records[i] for i in batch_index]
+            try:
+                score_arrays = self.score_batch(batch)
+            except Exception as e:
+                for i in batch_index:
+                    results[i] = {'success': False, 'error': str(e)}
+                for i, first in repeats:
+                    results[i] = dict(results[first])
+                return results
+
+            pattern_scores = self.successful_patterns.score(self.pattern_feature_matrix(score_arrays, batch)).tolist()
+
+            learned = [None] * len(batch)
+            if self.score_model is not None:
+                learned = self.score_model.predict(self.model_feature_matrix(score_arrays, batch)).tolist()
+
+            columns = {key: values.tolist() for key, values in score_arrays.items()}
+            for position, i in enumerate(batch_index):
+                scores = {key: values[position] for key, values in columns.items()}
+                results[i] = self.format_result(scores, records[i], learned[position], pattern_scores[position])
+                if self.store is not None:
+                    recommendations[i] = self.get_recommendations(scores, records[i])
+                self.result_cache.set(cache_keys[i], dict(results[i]))
+                if self.index_batches:
+                    self.similarity_index.add_async(cache_keys[i], records[i])
+
+        for i, first in repeats:
+            results[i] = dict(results[first])
+
+        if self.store is not None and batch_index:
+            # The batch is scored as a whole, so each scored record is charged an equal share of its time;
+            # cache hits were stored when first scored
+            per_record_ms = (time.perf_counter() - started) * 1000 / len(batch_index)
+            for i in batch_index:
+                self.persist(records[i], results[i], cache_keys[i], per_record_ms, recommendations[i])
+
+        return results
+
 # Global validator instance
-ml_validator = StartupMLValidator()
+ml_validator = StartupMLValidator(
+    result_cache=ValidationCache(
+        max_entries=int(os.environ.get('VALIDATION_CACHE_SIZE', 1024)),
+        ttl_seconds=int(os.environ.get('VALIDATION_CACHE_TTL', 3600)),
+        db_path=os.environ.get('VALIDATION_CACHE_PATH')
+    ),
+    similarity_index=SimilarityIndex(
+        path=os.environ.get('SIMILARITY_INDEX_PATH'),
+        max_entries=int(os.environ.get('SIMILARITY_INDEX_SIZE', 10000))
+    ),
+    index_batches=os.environ.get('SIMILARITY_INDEX_BATCHES', '').lower() in ('1', 'true'),
+    duplicate_threshold=float(os.environ.get('SIMILARITY_DUPLICATE_THRESHOLD', 0)) or None,
+    score_model=load_score_model(os.environ.get('SCORE_MODEL_PATH'), ALGORITHM_VERSION, MODEL_FEATURES),
+    store=validation_store,
+    approximate_chars=int(os.environ.get('APPROXIMATE_TEXT_CHARS', 20000)) or None,
+    pattern_library=PatternLibrary.from_csv(os.environ['SUCCESS_PATTERNS_PATH']) if os.environ.get('SUCCESS_PATTERNS_PATH') else None
+)
@@ -0,0 +1,74 @@
+import csv
+import hashlib
+
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+spatial = lazy_import('scipy.spatial')
+
+# Dimensions of a success pattern, each in [0, 1]
+PATTERN_FEATURES = (
+    'problem_clarity', 'solution_uniqueness', 'market_size',
+    'team_experience', 'business_model_strength', 'competitive_advantage'
+)
+
+# Relative importance of each dimension in the distance between a submission and a pattern
+PATTERN_WEIGHTS = (0.2, 0.15, 0.2, 0.15, 0.15, 0.15)
+
+# Seed patterns used when no pattern library file is configured
+DEFAULT_PATTERNS = (
+    # problem_clarity, solution_uniqueness, market_size, team_experience, business_model_strength, competitive_advantage, success_score
+    (0.9, 0.8, 0.85, 0.75, 0.8, 0.7, 92),
+    (0.85, 0.9, 0.7, 0.8, 0.85, 0.8, 88),
+)
+
+
+class PatternLibrary:
+    """Reference success patterns as one contiguous matrix behind a KD-tree"""
+
+    def __init__(self, rows, weights=PATTERN_WEIGHTS):
+        self.rows = [tuple(float(value) for value in row) for row in rows]
+        self.weights = tuple(weights)
+        self.fingerprint = hashlib.blake2b(repr((self.rows, self.weights)).encode(), digest_size=4).hexdigest()
+        self.matrix = None
+        self.success_scores = None
+        self._tree = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    @classmethod
+    def from_csv(cls, path):
+        """Load patterns from a CSV with a header of PATTERN_FEATURES plus success_score"""
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = [
+                [float(row[name]) for name in PATTERN_FEATURES] + [float(row['success_score'])]
+                for row in csv.DictReader(f)
+            ]
+        return cls(rows)
+
+    @property
+    def tree(self):
+        # Matrix and tree are built on first query so importing the validator stays NumPy-free
+        if self._tree is None:
+            table = np.array(self.rows, dtype=np.float64).reshape(-1, len(PATTERN_FEATURES) + 1)
+            self.matrix = np.ascontiguousarray(table[:, :-1])
+            self.success_scores = np.ascontiguousarray(table[:, -1])
+            # Scaling each axis by sqrt(weight) turns the weighted distance into a plain Euclidean one
+            self.scale = np.sqrt(np.array(self.weights, dtype=np.float64))
+            self._tree = spatial.cKDTree(self.matrix * self.scale)
+        return self._tree
+
+    def query(self, features, k=5):
+        """Weighted distances and row indices of the k nearest patterns, shaped (n, k)"""
+        tree = self.tree
+        points = np.atleast_2d(np.asarray(features, dtype=np.float64)) * self.scale
+        k = min(k, len(self.rows))
+        distances, indices = tree.query(points, k=k, workers=-1)
+        return distances.reshape(len(points), k), indices.reshape(len(points), k)
+
+    def score(self, features, k=5):
+        """Inverse-distance-weighted success score of the k nearest patterns, one per row"""
+        distances, indices = self.query(features, k)
+        weights = 1.0 / (distances + 1e-6)
+        return (weights * self.success_scores[indices]).sum(axis=1) / weights.sum(axis=1)
@@ -0,0 +1,153 @@
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from string import Formatter
+
+# Add the server directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+# Pitch section -> template. Placeholders name a form field: {field} inserts it as is,
+# {field:N} its first N characters and {field.lower:N} the first N characters lower-cased
+PITCH_TEMPLATES = {
+    'executiveSummary': "Our startup addresses a critical market need by providing {solutionDescription.lower:100}... We're targeting {targetMarket.lower:50} with a proven {revenueModel} business model.",
+
+    'problemStatement': "The market faces a significant challenge: {problemStatement:200}... This problem affects thousands of potential customers daily, creating a substantial opportunity for disruption.",
+
+    'solutionOverview': "Our innovative solution: {solutionDescription:200}... We've designed this to be scalable, user-friendly, and directly address the core pain points identified in our market research.",
+
+    'marketOpportunity': "We're targeting {targetMarket:100}... The total addressable market is estimated at $2-5 billion, with strong growth indicators and limited direct competition in our specific niche.",
+
+    'businessModel': "Our {revenueModel} model ensures sustainable revenue growth. We've validated our pricing strategy through market research and early customer feedback, projecting strong unit economics.",
+
+    'competitiveAdvantage': "Our key differentiators include proprietary technology, first-mover advantage in our segment, and deep domain expertise. We've built sustainable moats through {solutionDescription:50}...",
+
+    'fundingRequirements': "Currently in {currentStage} stage, we're seeking $500K-2M to accelerate growth, expand our team, and scale our proven solution. Funds will be allocated primarily to product development and customer acquisition."
+}
+
+
+def load_templates(path):
+    """Read {section: template} from a JSON file"""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def parse_template(template):
+    """Split a template into (literal, placeholder) pairs; placeholders are (field, lower, length)"""
+    parts = []
+    for literal, name, spec, _ in Formatter().parse(template):
+        if name is None:
+            parts.append((literal, None))
+            continue
+        field, _, transform = name.partition('.')
+        if not field or transform not in ('', 'lower') or (spec and not spec.isdigit()):
+            raise ValueError(f'Unsupported placeholder {{{name}{":" + spec if spec else ""}}}')
+        parts.append((literal, (field, transform == 'lower', int(spec) if spec else None)))
+    return parts
+
+
+def compile_templates(templates):
+    """Compile {section: template} into one Python function that renders every section
+
+    Each placeholder value is computed once and shared between sections, and sections are
+    joined from constant literals, so rendering costs about as much as hand-written f-strings.
+    """
+    placeholders = []
+    sections = []
+    for section, template in templates.items():
+        pieces = []
+        for literal, placeholder in parse_template(template):
+            if literal:
+                pieces.append(repr(literal))
+            if placeholder is not None:
+                if placeholder not in placeholders:
+                    placeholders.append(placeholder)
+                pieces.append(f'v{placeholders.index(placeholder)}')
+        sections.append(f"{section!r}: ''.join(({', '.join(pieces or [repr('')])},))")
+
+    lines = ['def render(data):', '    get = data.get']
+    for i, (field, lower, length) in enumerate(placeholders):
+        # Only the prefix that is shown is lower-cased; s.lower()[:n] == s[:n].lower()[:n]
+        # because lower() never shortens a string
+        cut = f'[:{length}]' if length is not None else ''
+        lines.append(f"    v{i} = get({field!r}, ''){cut}{'.lower()' + cut if lower else ''}")
+    lines.append('    return {' + ', '.join(sections) + '}')
+
+    namespace = {}
+    exec(compile('\n'.join(lines), '<pitch templates>', 'exec'), namespace)
+    return namespace['render'], tuple(sorted({field for field, _, _ in placeholders}))
+
+
+class PitchEngine:
+    """Pitch drafts rendered by a function compiled once from the section templates"""
+
+    def __init__(self, templates=None):
+        self.templates = dict(templates if templates is not None else PITCH_TEMPLATES)
+        # Form fields the templates read
+        self.render, self.fields = compile_templates(self.templates)
+
+    def check(self, data):
+        """Error message for a record the templates cannot render, else None"""
+        if not isinstance(data, dict):
+            return 'Expected a JSON object'
+        for field in self.fields:
+            if not isinstance(data.get(field, ''), str):
+                return f"Field '{field}' must be a string"
+        return None
+
+    def generate(self, data):
+        """Pitch sections for one startup, as {'success': True, 'pitch_content': {...}} or an error"""
+        error = self.check(data)
+        if error is not None:
+            return {'success': False, 'error': error}
+
+        return {'success': True, 'pitch_content': self.render(data)}
+
+    def generate_batch(self, records):
+        """One result per record, in order; records are independent, so a cohort can be split across processes"""
+        return [self.generate(data) for data in records]
+
+
+def _generate_chunk(records):
+    return pitch_engine.generate_batch(records)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate pitch drafts for a cohort of startups')
+    parser.add_argument('input', help='NDJSON file of startup forms, one per line (- for stdin)')
+    parser.add_argument('-o', '--output', default='-', help='NDJSON file for pitches (default: stdout)')
+    parser.add_argument('--workers', type=int, default=1, help='processes to split the cohort across')
+    parser.add_argument('--chunk-size', type=int, default=500)
+    args = parser.parse_args()
+
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    with source:
+        records = [json.loads(line) for line in source if line.strip()]
+
+    chunks = [records[i:i + args.chunk_size] for i in range(0, len(records), args.chunk_size)]
+    if args.workers > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            results = [result for chunk in pool.map(_generate_chunk, chunks) for result in chunk]
+    else:
+        results = pitch_engine.generate_batch(records)
+
+    sink = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for result in results:
+            sink.write(json.dumps(result) + '\n')
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+    failed = sum(1 for result in results if not result['success'])
+    print(f"✅ Generated {len(results) - failed} pitches ({failed} failed)", file=sys.stderr)
+
+
+# Global engine; PITCH_TEMPLATES_PATH swaps in templates from a JSON file
+pitch_engine = PitchEngine(
+    templates=load_templates(os.environ['PITCH_TEMPLATES_PATH']) if os.environ.get('PITCH_TEMPLATES_PATH') else None
+)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,325 @@
+import hashlib
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+# Tokens charged per request, by Flask URL rule; scoring endpoints cost the most.
+# 0 exempts an endpoint (probes and metrics scrapes must never be throttled)
+ENDPOINT_COSTS = {
+    '/api/validate': 10,
+    '/api/validate/batch': 50,
+    '/api/validate/stream': 50,
+    '/api/validate/jobs': 50,
+    '/api/validate/jobs/<job_id>': 1,
+    '/api/validate/sessions': 10,
+    '/api/validate/sessions/<session_id>': 2,
+    '/api/similar': 5,
+    '/api/generate-pitch': 2,
+    '/api/generate-pitch/batch': 20,
+    '/api/generate-swot': 10,
+    '/api/founder-readiness': 5,
+    '/api/market-research': 1,
+    '/api/health': 1,
+    '/api/health/live': 0,
+    '/api/health/ready': 0,
+    '/api/metrics': 0
+}
+
+# Cost of API requests whose rule is not listed, e.g. unknown paths
+DEFAULT_COST = 1
+
+# Seconds a client at its concurrency cap is told to wait; nothing says when its requests finish
+CONCURRENCY_RETRY_AFTER = 1
+
+RATE_LIMIT_SQLITE_SCHEMA = (
+    '''CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+        client TEXT PRIMARY KEY,
+        tokens REAL NOT NULL,
+        updated_at REAL NOT NULL
+    )''',
+    '''CREATE TABLE IF NOT EXISTS rate_limit_leases (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        client TEXT NOT NULL,
+        expires_at REAL NOT NULL
+    )''',
+    'CREATE INDEX IF NOT EXISTS idx_rate_limit_leases_client ON rate_limit_leases(client)'
+)
+
+
+class RateLimited(Exception):
+    """Raised when a client is out of tokens ('rate') or at its in-flight cap ('concurrency')"""
+
+    def __init__(self, reason, retry_after):
+        super().__init__('Too many requests' if reason == 'rate' else 'Too many concurrent requests')
+        self.reason = reason
+        # Whole seconds, as the Retry-After header wants them
+        self.retry_after = max(1, math.ceil(retry_after))
+
+
+def refill(tokens, updated_at, now, rate, burst):
+    """Tokens in a bucket last left at tokens, updated_at; a clock stepping back refills nothing"""
+    return min(burst, tokens + max(now - updated_at, 0) * rate)
+
+
+class LocalBackend:
+    """Buckets and in-flight counts in this process's memory
+
+    Behind the prefork server every worker limits on its own, so a client gets up to
+    workers x burst; fine for one process, the development server and tests.
+    """
+
+    def __init__(self, max_clients=100000):
+        self.max_clients = max_clients
+        self.buckets = OrderedDict()  # client -> (tokens, updated_at), least recently seen first
+        self.active = {}              # client -> requests in flight
+        self.lock = threading.Lock()
+        self.clock = time.monotonic
+
+    def acquire(self, client, cost, rate, burst, max_concurrent, lease_seconds):
+        """Take cost tokens and an in-flight slot for client; returns the lease to release(), if any"""
+        now = self.clock()
+        with self.lock:
+            active = self.active.get(client, 0)
+            if max_concurrent and active >= max_concurrent:
+                raise RateLimited('concurrency', CONCURRENCY_RETRY_AFTER)
+
+            bucket = self.buckets.pop(client, None)
+            tokens = burst if bucket is None else refill(*bucket, now, rate, burst)
+            if tokens < cost:
+                self.buckets[client] = (tokens, now)
+                raise RateLimited('rate', (cost - tokens) / rate)
+            self.buckets[client] = (tokens - cost, now)
+            # An evicted client comes back with a full bucket, which only ever errs on the lenient side
+            while len(self.buckets) > self.max_clients:
+                self.buckets.popitem(last=False)
+
+            if not max_concurrent:
+                return None
+            self.active[client] = active + 1
+            return client
+
+    def release(self, lease):
+        if lease is None:
+            return
+        with self.lock:
+            active = self.active.pop(lease, 0) - 1
+            if active > 0:
+                self.active[lease] = active
+
+    def stats(self):
+        with self.lock:
+            return {'clients': len(self.buckets), 'in_flight': sum(self.active.values())}
+
+    def close(self):
+        pass
+
+
+class SQLiteBackend:
+    """Buckets and in-flight leases in a SQLite file shared by every worker on the host
+
+    Each acquire is one write transaction, so limits hold across preforked workers. Leases
+    expire after lease_seconds, which frees the slots of a worker killed mid-request.
+    """
+
+    # Stale rows are swept after this many acquires in a process
+    sweep_every = 1000
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = None
+        self.pid = None
+        self.lock = threading.Lock()
+        self.acquired = 0
+        self.clock = time.time  # shared between processes, so wall-clock time
+
+    def _connect(self):
+        # Connections do not survive fork, so each prefork worker opens its own
+        if self.conn is None or self.pid != os.getpid():
+            self.pid = os.getpid()
+            # Transactions are begun explicitly, as BEGIN IMMEDIATE
+            self.conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            for statement in RATE_LIMIT_SQLITE_SCHEMA:
+                self.conn.execute(statement)
+        return self.conn
+
+    def acquire(self, client, cost, rate, burst, max_concurrent, lease_seconds):
+        """Take cost tokens and an in-flight slot for client; returns the lease to release(), if any"""
+        with self.lock:
+            conn = self._connect()
+            # Take the write lock up front so no other worker reads the bucket in between
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                now = self.clock()
+                limited = self._take(conn, client, cost, rate, burst, max_concurrent, now)
+                lease = None
+                if limited is None and max_concurrent:
+                    lease = conn.execute(
+                        'INSERT INTO rate_limit_leases (client, expires_at) VALUES (?, ?)',
+                        (client, now + lease_seconds)
+                    ).lastrowid
+                self.acquired += 1
+                if self.acquired % self.sweep_every == 0:
+                    conn.execute('DELETE FROM rate_limit_leases WHERE expires_at <= ?', (now,))
+                    # Buckets idle long enough to have refilled are the same as no row at all
+                    conn.execute('DELETE FROM rate_limit_buckets WHERE updated_at <= ?', (now - burst / rate,))
+                conn.execute('COMMIT')
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+        if limited is not None:
+            raise limited
+        return lease
+
+    def _take(self, conn, client, cost, rate, burst, max_concurrent, now):
+        # The RateLimited to raise once the transaction is committed, or None
+        if max_concurrent:
+            conn.execute('DELETE FROM rate_limit_leases WHERE client = ? AND expires_at <= ?', (client, now))
+            active = conn.execute('SELECT COUNT(*) FROM rate_limit_leases WHERE client = ?', (client,)).fetchone()[0]
+            if active >= max_concurrent:
+                return RateLimited('concurrency', CONCURRENCY_RETRY_AFTER)
+
+        row = conn.execute('SELECT tokens, updated_at FROM rate_limit_buckets WHERE client = ?', (client,)).fetchone()
+        tokens = burst if row is None else refill(*row, now, rate, burst)
+        limited = None
+        if tokens < cost:
+            limited = RateLimited('rate', (cost - tokens) / rate)
+        else:
+            tokens -= cost
+        conn.execute(
+            'INSERT INTO rate_limit_buckets (client, tokens, updated_at) VALUES (?, ?, ?) '
+            'ON CONFLICT(client) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at',
+            (client, tokens, now)
+        )
+        return limited
+
+    def release(self, lease):
+        if lease is None:
+            return
+        with self.lock:
+            self._connect().execute('DELETE FROM rate_limit_leases WHERE id = ?', (lease,))
+
+    def stats(self):
+        with self.lock:
+            conn = self._connect()
+            return {
+                'clients': conn.execute('SELECT COUNT(*) FROM rate_limit_buckets').fetchone()[0],
+                'in_flight': conn.execute('SELECT COUNT(*) FROM rate_limit_leases WHERE expires_at > ?',
+                                          (self.clock(),)).fetchone()[0]
+            }
+
+    def close(self):
+        with self.lock:
+            if self.conn is not None and self.pid == os.getpid():
+                self.conn.close()
+            self.conn = None
+
+
+def key_digest(api_key):
+    """Digest an API key is compared and stored as, so keys are never kept as is"""
+    return hashlib.blake2b(api_key.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def backend_for(url):
+    """Backend for a RATE_LIMIT_BACKEND: empty or 'local', else sqlite:///path (or a bare path)"""
+    if not url or url == 'local':
+        return LocalBackend()
+    if url.startswith('sqlite:///'):
+        url = url[len('sqlite:///'):]
+    return SQLiteBackend(url)
+
+
+class RateLimiter:
+    """Per-client token buckets with endpoint costs and a cap on requests in flight
+
+    A client is its API key when it sends one of api_keys, else its address. Each request takes
+    its endpoint's cost in tokens; buckets hold up to burst tokens and refill at rate per second.
+    """
+
+    def __init__(self, backend=None, rate=50.0, burst=200.0, max_concurrent=8, lease_seconds=600,
+                 costs=None, default_cost=DEFAULT_COST, api_keys=()):
+        self.backend = backend if backend is not None else LocalBackend()
+        self.api_keys = frozenset(key_digest(api_key) for api_key in api_keys)
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrent = max_concurrent
+        self.lease_seconds = lease_seconds
+        self.costs = dict(costs if costs is not None else ENDPOINT_COSTS)
+        self.default_cost = default_cost
+        self.stats_counts = {'allowed': 0, 'rate': 0, 'concurrency': 0, 'errors': 0}
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return self.rate > 0
+
+    def client_for(self, api_key, address):
+        """Bucket key for a request: a configured API key's own bucket, else the caller's address
+
+        Unknown keys get the address bucket, so sending a fresh key per request buys nothing.
+        """
+        if api_key:
+            digest = key_digest(api_key)
+            if digest in self.api_keys:
+                return 'key:' + digest
+        return f'addr:{address or "unknown"}'
+
+    def cost(self, rule):
+        """Tokens charged for a request to the given URL rule; a burst-sized cost is always affordable"""
+        return min(self.costs.get(rule, self.default_cost), self.burst)
+
+    def acquire(self, client, rule):
+        """Admit a request or raise RateLimited; returns the lease to release() once it is done, if any"""
+        cost = self.cost(rule)
+        if not self.enabled or not cost:
+            return None
+        try:
+            lease = self.backend.acquire(client, cost, self.rate, self.burst, self.max_concurrent, self.lease_seconds)
+        except RateLimited as e:
+            with self.lock:
+                self.stats_counts[e.reason] += 1
+            raise
+        except Exception as e:
+            # An unavailable shared backend must not take the API down with it, so admit the request
+            with self.lock:
+                self.stats_counts['errors'] += 1
+            print(f"⚠️ Rate limiter backend failed, admitting request: {e}")
+            return None
+        with self.lock:
+            self.stats_counts['allowed'] += 1
+        return lease
+
+    def release(self, lease):
+        """Give back the in-flight slot of an admitted request"""
+        self.backend.release(lease)
+
+    def stats(self):
+        """Admission counters for this process, plus what the backend tracks"""
+        with self.lock:
+            counts = dict(self.stats_counts)
+        return dict(
+            counts,
+            enabled=self.enabled,
+            tokens_per_second=self.rate,
+            burst=self.burst,
+            max_concurrent=self.max_concurrent,
+            api_keys=len(self.api_keys),
+            backend=type(self.backend).__name__,
+            **(self.backend.stats() if self.enabled else {})
+        )
+
+
+# Global limiter, off unless RATE_LIMIT_PER_SECOND is set; RATE_LIMIT_BACKEND=sqlite:///path shares it across workers.
+# Behind a proxy, set TRUSTED_PROXIES (app.py) too, or every caller shares the proxy's bucket.
+# RATE_LIMIT_API_KEYS is a comma-separated list of keys that get a bucket of their own
+rate_limiter = RateLimiter(
+    backend=backend_for(os.environ.get('RATE_LIMIT_BACKEND', '')),
+    rate=float(os.environ.get('RATE_LIMIT_PER_SECOND', 0)),
+    burst=float(os.environ.get('RATE_LIMIT_BURST', 200)),
+    max_concurrent=int(os.environ.get('RATE_LIMIT_CONCURRENCY', 8)),
+    lease_seconds=float(os.environ.get('RATE_LIMIT_LEASE_SECONDS', 600)),
+    api_keys=[api_key.strip() for api_key in os.environ.get('RATE_LIMIT_API_KEYS', '').split(',') if api_key.strip()]
+)
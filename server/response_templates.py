@@ -0,0 +1,235 @@
+from types import MappingProxyType
+
+
+# Category key -> display name, in the order categories appear in a validation result
+SCORE_CATEGORIES = (
+    ('problem_solution', 'Problem-Solution Fit'),
+    ('market', 'Market Opportunity'),
+    ('business_model', 'Business Model'),
+    ('competition', 'Competitive Advantage'),
+    ('team', 'Team Strength'),
+    ('traction', 'Execution Readiness'),
+)
+
+LEVELS = ('high', 'medium', 'low')
+
+
+def score_level(score):
+    """Template level for a 0-100 category score"""
+    if score >= 75:
+        return 'high'
+    elif score >= 55:
+        return 'medium'
+    return 'low'
+
+
+_FEEDBACK = {
+    'problem_solution': {
+        'high': 'Strong problem identification with clear solution approach. The value proposition is well-defined.',
+        'medium': 'Good foundation, but needs more specific problem definition and solution clarity.',
+        'low': 'Problem-solution fit needs significant improvement. Consider customer interviews to validate assumptions.'
+    },
+    'market': {
+        'high': 'Good market understanding with clear target segments and sizing.',
+        'medium': 'Market opportunity is identified but needs more detailed analysis and validation.',
+        'low': 'Market analysis needs substantial improvement. Focus on defining specific customer segments.'
+    },
+    'business_model': {
+        'high': 'Solid revenue model with clear monetization strategy. Pricing approach is reasonable.',
+        'medium': 'Business model has potential but needs refinement in pricing and revenue streams.',
+        'low': 'Business model requires significant development. Consider multiple revenue streams and validate pricing.'
+    },
+    'competition': {
+        'high': 'Good competitive analysis with clear differentiation and sustainable advantages.',
+        'medium': 'Competitive landscape is understood but differentiation could be stronger.',
+        'low': 'Competitive analysis needs improvement. Focus on unique value proposition and defensibility.'
+    },
+    'team': {
+        'high': 'Strong team with relevant experience and complementary skills.',
+        'medium': 'Good foundational team but some skill gaps may need to be addressed.',
+        'low': 'Team needs strengthening. Consider adding expertise or advisory support.'
+    },
+    'traction': {
+        'high': 'Strong execution plan with realistic milestones and good progress indicators.',
+        'medium': 'Execution plan is developing but needs more specific milestones and validation.',
+        'low': 'Execution readiness needs improvement. Focus on MVP development and early validation.'
+    }
+}
+
+_SUGGESTIONS = {
+    'problem_solution': (
+        'Conduct customer interviews to validate problem severity',
+        'Test solution assumptions with early prototypes',
+        'Quantify the problem impact with market research',
+        'Refine value proposition based on customer feedback'
+    ),
+    'market': (
+        'Define specific customer personas with demographics',
+        'Research total addressable market (TAM) size',
+        'Analyze market growth trends and dynamics',
+        'Validate market demand through surveys or interviews'
+    ),
+    'business_model': (
+        'Test pricing strategy with potential customers',
+        'Consider multiple revenue streams for diversification',
+        'Plan customer acquisition costs and channels',
+        'Develop unit economics and profitability models'
+    ),
+    'competition': (
+        'Strengthen unique value proposition and differentiators',
+        'Identify sustainable competitive moats',
+        'Monitor competitor strategies and positioning',
+        'Develop defensive strategies against competition'
+    ),
+    'team': (
+        'Consider bringing in technical co-founder or CTO',
+        'Build advisory board with industry experts',
+        'Plan key hiring priorities and skill development',
+        'Assess team gaps and recruitment needs'
+    ),
+    'traction': (
+        'Create detailed development roadmap with milestones',
+        'Establish key performance indicators (KPIs)',
+        'Plan for regulatory and compliance requirements',
+        'Develop MVP and gather early user feedback'
+    )
+}
+
+# Fewer suggestions for high scores, all of them for low scores
+_SUGGESTION_COUNTS = {'high': 2, 'medium': 3, 'low': 4}
+
+# (category, level) -> feedback sentence
+FEEDBACK = MappingProxyType({
+    (category, level): text
+    for category, levels in _FEEDBACK.items()
+    for level, text in levels.items()
+})
+
+# (category, level) -> tuple of suggestions
+SUGGESTIONS = MappingProxyType({
+    (category, level): suggestions[:_SUGGESTION_COUNTS[level]]
+    for category, suggestions in _SUGGESTIONS.items()
+    for level in LEVELS
+})
+
+# (score key, threshold, recommendation); a recommendation applies when the score is below threshold.
+# The dicts are shared between results and must be treated as read-only
+RECOMMENDATIONS = (
+    ('problem_solution', 70, {
+        'category': 'Problem-Solution Fit',
+        'priority': 'high',
+        'suggestion': 'Conduct customer interviews to better validate the problem and refine your solution.',
+        'action': 'Interview 20-30 potential customers about the problem severity'
+    }),
+    ('market', 60, {
+        'category': 'Market Opportunity',
+        'priority': 'high',
+        'suggestion': 'Better define your target market and customer segments with specific demographics.',
+        'action': 'Create detailed customer personas and market sizing analysis'
+    }),
+    ('team', 65, {
+        'category': 'Team Strength',
+        'priority': 'medium',
+        'suggestion': 'Consider adding team members with complementary skills or industry experience.',
+        'action': 'Identify key skill gaps and recruit advisors or co-founders'
+    }),
+    ('competition', 70, {
+        'category': 'Competitive Advantage',
+        'priority': 'medium',
+        'suggestion': 'Strengthen your unique value proposition and competitive differentiation.',
+        'action': 'Analyze competitors more thoroughly and identify sustainable advantages'
+    }),
+)
+
+
+# SWOT entries per category: (strength for a high score, weakness for a low one)
+SWOT_CATEGORIES = MappingProxyType({
+    'problem_solution': ('Clear problem definition with a well-matched solution',
+                         'Problem-solution fit is not yet validated with customers'),
+    'market': ('Well-defined target market and customer segments',
+               'Target market and customer segments are loosely defined'),
+    'business_model': ('Solid revenue model with a clear pricing strategy',
+                       'Revenue model and pricing still need validation'),
+    'competition': ('Clear differentiation from identified competitors',
+                    'Differentiation from existing alternatives is weak'),
+    'team': ('Experienced founding team with relevant skills',
+             'Skill or experience gaps in the founding team'),
+    'traction': ('Early traction and a concrete execution plan',
+                 'Little traction or market validation so far')
+})
+
+# Opportunity per market type detected by the market:* keyword groups
+SWOT_MARKET_OPPORTUNITIES = MappingProxyType({
+    'b2b': 'Businesses keep increasing spend on productivity tools',
+    'b2c': 'Large consumer audience reachable through digital channels',
+    'marketplace': 'Network effects as both sides of the marketplace grow',
+    'saas': 'Continued migration of businesses to cloud software',
+    'ecommerce': 'Steady growth of online retail',
+    'mobile': 'Mobile-first usage keeps growing',
+    'ai': 'Emerging AI technology trends supporting the solution',
+    'fintech': 'Digital payments and financial services are expanding',
+    'healthtech': 'Rising investment in digital health and wellness',
+    'edtech': 'Ongoing shift toward online learning'
+})
+
+# Signal name -> (SWOT quadrant, entry), for signals read from keyword hits and select fields
+SWOT_SIGNALS = MappingProxyType({
+    'technical_team': ('strengths', 'Technical expertise within the founding team'),
+    'differentiators': ('strengths', 'Value proposition built on explicit differentiators'),
+    'recurring_revenue': ('strengths', 'Recurring revenue model with predictable income'),
+    'revenue': ('strengths', 'Already generating revenue'),
+    'no_technical_team': ('weaknesses', 'No technical expertise evident in the team'),
+    'solo_founder': ('weaknesses', 'Dependence on a single founder'),
+    'idea_stage': ('weaknesses', 'No product built yet'),
+    'unknown_competitors': ('weaknesses', 'Competitors have not been identified'),
+    'partnerships': ('opportunities', 'Potential for strategic partnerships and collaborations'),
+    'large_market': ('opportunities', 'Large and growing total addressable market'),
+    'global_reach': ('opportunities', 'International expansion possibilities'),
+    'regional_market': ('opportunities', 'Room to expand beyond the initial region'),
+    'strong_competitors': ('threats', 'Well-funded competitors entering the market'),
+    'crowded_market': ('threats', 'Crowded market with several direct competitors'),
+    'regulation': ('threats', 'Regulatory changes that could impact the business model'),
+    'pricing_pressure': ('threats', 'Pricing pressure from cheaper alternatives'),
+    'runway': ('threats', 'Risk of running out of runway before product-market fit'),
+    'technology_shift': ('threats', 'Rapid technological changes requiring constant adaptation'),
+    'economy': ('threats', 'Economic uncertainties affecting customer spending'),
+    'early_stage': ('strengths', 'Early enough to shape the product around customer feedback')
+})
+
+# Entries kept per SWOT quadrant
+SWOT_LIMIT = 4
+
+# Founder-readiness category key -> display name, in assessment order
+FOUNDER_CATEGORIES = (
+    ('entrepreneurial_mindset', 'Entrepreneurial Mindset'),
+    ('technical_skills', 'Technical Skills'),
+    ('business_acumen', 'Business Acumen'),
+    ('leadership_ability', 'Leadership Ability'),
+    ('financial_management', 'Financial Management'),
+    ('network_connections', 'Network & Connections'),
+)
+
+# Founder-readiness category -> (strength for a high score, improvement area for a low one, recommendation)
+FOUNDER_TEXTS = MappingProxyType({
+    'entrepreneurial_mindset': ('Strong entrepreneurial drive and vision',
+                                'Show more evidence of persistence through setbacks',
+                                'Run small, cheap experiments to test ideas before committing to them'),
+    'technical_skills': ('Good technical understanding of the solution',
+                         'Build or recruit technical depth for the product',
+                         'Partner with a technical co-founder or advisor'),
+    'business_acumen': ('Solid grasp of pricing, sales and business fundamentals',
+                        'Develop more comprehensive business strategy',
+                        'Build advisory board with complementary expertise'),
+    'leadership_ability': ('Clear communication and leadership skills',
+                           'Gain experience leading and growing a team',
+                           'Seek mentorship from experienced entrepreneurs'),
+    'financial_management': ('Disciplined financial planning and runway management',
+                             'Strengthen financial planning and management skills',
+                             'Consider taking a business finance course'),
+    'network_connections': ('Well connected with mentors, investors and partners',
+                            'Expand professional network and industry connections',
+                            'Join entrepreneur communities and accelerator programs')
+})
+
+# Entries kept per founder-readiness list
+FOUNDER_LIMIT = 3
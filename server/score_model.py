@@ -0,0 +1,247 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+# Add the server directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+sklearn_ensemble = lazy_import('sklearn.ensemble')
+
+MODEL_KINDS = ('gbr', 'rf')
+
+# validations columns the heuristic computes from the very features the model reads, so
+# learning them only reproduces the heuristic; targets must be observed outcomes
+HEURISTIC_COLUMNS = ('overall_score', 'viability_level', 'scores')
+
+
+class TreeEnsemble:
+    """Tree ensemble flattened into NumPy node arrays, so prediction needs no scikit-learn"""
+
+    def __init__(self, left, right, feature, threshold, value, roots, depth, base, meta):
+        # Leaves point to themselves with an infinite threshold, so every tree can be
+        # walked for exactly `depth` steps without checking for leaves
+        self.left = left
+        self.right = right
+        self.feature = feature
+        self.threshold = threshold
+        self.value = value
+        self.roots = roots
+        self.depth = depth
+        self.base = base
+        self.meta = meta
+
+    @property
+    def validation_version(self):
+        return self.meta['validation_version']
+
+    @property
+    def model_id(self):
+        return self.meta['model_id']
+
+    @classmethod
+    def from_sklearn(cls, model, meta):
+        """Flatten a fitted GradientBoostingRegressor or RandomForestRegressor"""
+        if hasattr(model, 'init_'):
+            trees = [estimator.tree_ for estimator in model.estimators_[:, 0]]
+            scale = model.learning_rate
+            base = float(model.init_.constant_.ravel()[0])
+        else:
+            trees = [estimator.tree_ for estimator in model.estimators_]
+            scale = 1.0 / len(trees)
+            base = 0.0
+
+        left, right, feature, threshold, value, roots = [], [], [], [], [], []
+        offset = 0
+        for tree in trees:
+            nodes = np.arange(tree.node_count)
+            leaf = tree.children_left == -1
+            left.append(np.where(leaf, nodes, tree.children_left) + offset)
+            right.append(np.where(leaf, nodes, tree.children_right) + offset)
+            feature.append(np.where(leaf, 0, tree.feature))
+            threshold.append(np.where(leaf, np.inf, tree.threshold))
+            value.append(tree.value[:, 0, 0] * scale)
+            roots.append(offset)
+            offset += tree.node_count
+
+        return cls(
+            left=np.concatenate(left).astype(np.int32),
+            right=np.concatenate(right).astype(np.int32),
+            feature=np.concatenate(feature).astype(np.int32),
+            threshold=np.concatenate(threshold),
+            value=np.concatenate(value),
+            roots=np.array(roots, dtype=np.int32),
+            depth=max(tree.max_depth for tree in trees),
+            base=base,
+            meta=meta
+        )
+
+    def predict(self, X):
+        """Predict a 2-D feature matrix, one row per record"""
+        # Trees compare float32 features against float64 thresholds, as scikit-learn does
+        X = np.asarray(X, dtype=np.float32)
+        rows = np.arange(len(X))[:, None]
+        node = np.broadcast_to(self.roots, (len(X), len(self.roots)))
+        for _ in range(self.depth):
+            go_left = X[rows, self.feature[node]] <= self.threshold[node]
+            node = np.where(go_left, self.left[node], self.right[node])
+        return self.base + self.value[node].sum(axis=1)
+
+    def predict_one(self, features):
+        """Predict a single feature vector; walks all trees at once"""
+        x = np.asarray(features, dtype=np.float32)
+        node = self.roots
+        for _ in range(self.depth):
+            node = np.where(x[self.feature[node]] <= self.threshold[node], self.left[node], self.right[node])
+        return self.base + float(self.value[node].sum())
+
+    def save(self, path):
+        """Write the flattened arrays and metadata atomically as an .npz archive"""
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez(
+                f, left=self.left, right=self.right, feature=self.feature, threshold=self.threshold,
+                value=self.value, roots=self.roots, depth=self.depth, base=self.base,
+                meta=json.dumps(self.meta)
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Load a model written by save(); no pickle and no scikit-learn involved"""
+        with np.load(path, allow_pickle=False) as archive:
+            return cls(
+                left=archive['left'], right=archive['right'], feature=archive['feature'],
+                threshold=archive['threshold'], value=archive['value'], roots=archive['roots'],
+                depth=int(archive['depth']), base=float(archive['base']),
+                meta=json.loads(str(archive['meta']))
+            )
+
+
+def load_score_model(path, validation_version, feature_names):
+    """Load the model at path if it was trained for this algorithm version and feature set, else None"""
+    if not path:
+        return None
+    try:
+        model = TreeEnsemble.load(path)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"⚠️ Could not load score model {path}: {e}")
+        return None
+    if model.validation_version != validation_version:
+        print(f"⚠️ Ignoring score model {path}: trained for validation_version "
+              f"{model.validation_version}, running {validation_version}")
+        return None
+    if model.meta.get('features') != list(feature_names):
+        print(f"⚠️ Ignoring score model {path}: trained on features {model.meta.get('features')}, "
+              f"running {list(feature_names)}")
+        return None
+    return model
+
+
+def train_model(X, y, kind='gbr', random_state=42):
+    """Fit a scikit-learn tree ensemble on a feature matrix and targets"""
+    if kind == 'rf':
+        model = sklearn_ensemble.RandomForestRegressor(
+            n_estimators=100, max_depth=8, min_samples_leaf=5, random_state=random_state, n_jobs=-1
+        )
+    else:
+        model = sklearn_ensemble.GradientBoostingRegressor(
+            n_estimators=150, max_depth=3, learning_rate=0.05, subsample=0.8, random_state=random_state
+        )
+    return model.fit(X, y)
+
+
+def iter_raw_rows(path):
+    if path.startswith('sqlite:///'):
+        # The local validations store written by validation_store.py
+        conn = sqlite3.connect(path[len('sqlite:///'):])
+        conn.row_factory = sqlite3.Row
+        try:
+            for row in conn.execute('SELECT * FROM validations'):
+                yield dict(row)
+        finally:
+            conn.close()
+        return
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def read_validation_rows(path):
+    """Read validations rows from an NDJSON export or sqlite:///path; the form input lives in analysis_data['input']"""
+    for row in iter_raw_rows(path):
+        analysis = row.get('analysis_data') or {}
+        if isinstance(analysis, str):
+            analysis = json.loads(analysis)
+        if isinstance(analysis.get('input'), dict):
+            yield row, analysis['input']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Train the learned validation score model')
+    parser.add_argument('rows', help='NDJSON export of validations rows, or sqlite:///path to a local store')
+    parser.add_argument('-o', '--output', default='score_model.npz')
+    parser.add_argument('--model', choices=MODEL_KINDS, default='gbr')
+    parser.add_argument('--target', required=True,
+                        help='outcome column to learn, e.g. one joined onto the exported rows')
+    parser.add_argument('--holdout', type=float, default=0.2, help='fraction of rows held out for evaluation')
+    args = parser.parse_args()
+    if args.target in HEURISTIC_COLUMNS:
+        parser.error(f"--target {args.target} is computed by the heuristic from the model's own features; "
+                     f"train on an observed outcome instead")
+
+    from ml_validator import ALGORITHM_VERSION, MODEL_FEATURES, ml_validator
+
+    # Targets written by another algorithm version are not comparable with today's features
+    records, targets = [], []
+    skipped = 0
+    for row, data in read_validation_rows(args.rows):
+        if row.get('validation_version', ALGORITHM_VERSION) != ALGORITHM_VERSION or row.get(args.target) is None:
+            skipped += 1
+            continue
+        records.append(data)
+        targets.append(float(row[args.target]))
+
+    if len(records) < 20:
+        sys.exit(f"❌ Need at least 20 usable rows to train, found {len(records)} ({skipped} skipped)")
+
+    X = ml_validator.model_feature_matrix(ml_validator.score_batch(records), records)
+    y = np.array(targets)
+
+    rng = np.random.default_rng(42)
+    order = rng.permutation(len(y))
+    n_test = int(len(y) * args.holdout)
+    test, train = order[:n_test], order[n_test:]
+
+    model = train_model(X[train], y[train], args.model)
+    meta = {
+        'validation_version': ALGORITHM_VERSION,
+        'model_id': datetime.now().strftime('%Y%m%d%H%M%S'),
+        'kind': args.model,
+        'target': args.target,
+        'features': list(MODEL_FEATURES),
+        'rows': len(train),
+        'trained_at': datetime.now().isoformat()
+    }
+    if n_test:
+        meta['holdout_mae'] = round(float(np.abs(model.predict(X[test]) - y[test]).mean()), 3)
+
+    engine = TreeEnsemble.from_sklearn(model, meta)
+    check = X[train[:200]]
+    if not np.allclose(engine.predict(check), model.predict(check)):
+        sys.exit("❌ Flattened model disagrees with scikit-learn; not saving")
+
+    engine.save(args.output)
+    print(f"✅ Trained {args.model} on {len(train)} rows ({skipped} skipped), "
+          f"holdout MAE {meta.get('holdout_mae', 'n/a')} -> {args.output}")
+
+
+if __name__ == '__main__':
+    main()
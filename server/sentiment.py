@@ -0,0 +1,213 @@
+import os
+import re
+import sys
+
+# Emoticons that survive pattern's tokenizer as standalone tokens, with their polarity
+EMOTICONS = {
+    '<3': 1.0, '\u2665': 1.0, '8-d': 1.0, 'x-d': 1.0, '>:d': 1.0, '>:p': 0.75,
+    'o.o': 0.05, '>:o': 0.05, 'o_o': 0.05, '\u00b0o\u00b0': 0.05,
+    '>.>': -0.25, '>:/': -0.25, '>:\\': -0.25
+}
+
+# Emoticons, lowercase words (with inner hyphens) and exclamation marks, in one regex pass
+TOKEN_RE = re.compile(
+    '(?:' + '|'.join(re.escape(e) for e in sorted(EMOTICONS, key=len, reverse=True)) + r')(?!\S)'
+    r"|[a-z0-9]+(?:-[a-z0-9]+)*|!"
+)
+
+NEGATIONS = frozenset(('no', 'not', "n't", 'never'))
+
+# Punctuation around a word that TOKEN_RE never keeps and that no emoticon starts with
+WORD_PUNCTUATION = '.,;:?()"\''
+
+
+def tokenize(lower):
+    """TOKEN_RE.findall(lower), without running the regex over plain words
+
+    No token spans whitespace, so each whitespace-separated chunk is tokenized on its own,
+    and a chunk that is one ASCII word once its outer punctuation is stripped is that word.
+    """
+    tokens = []
+    append = tokens.append
+    findall = TOKEN_RE.findall
+    for chunk in lower.split():
+        word = chunk.strip(WORD_PUNCTUATION)
+        if word.isalnum() and word.isascii():
+            append(word)
+        elif word:
+            tokens.extend(findall(chunk))
+    return tokens
+
+# Fixed corpus used to check the lexicon backend against TextBlob
+PARITY_CORPUS = [
+    'Small businesses struggle with slow, painful invoicing that wastes hours every week.',
+    'Our AI platform automates invoicing and is faster and cheaper than anything on the market!',
+    'A unique, innovative marketplace connecting local farmers with restaurants.',
+    'The current process is not good and customers are really unhappy with it.',
+    'We offer a simple subscription at $20 per month with a free tier.',
+    'Monthly recurring revenue, churn, customer acquisition cost and lifetime value.',
+    'QuickBooks, FreshBooks and Xero dominate but are too complex for freelancers.',
+    'Spreadsheets and manual email reminders.',
+    'Proprietary machine learning models trained on millions of real invoices.',
+    'Ten years of software engineering at a large bank, plus a successful exit.',
+    'Programming, sales, design and excellent communication skills.',
+    '100 beta users, 12 paying customers and a very strong waitlist.',
+    'Raising $500k seed to hire two engineers and grow marketing.',
+    'Healthcare is expensive, confusing and terribly frustrating for patients.',
+    'Never a bad experience: our users love the clean, beautiful interface.',
+    'Students find traditional courses boring and hard to follow.',
+    'An amazing, incredibly easy app for personal fitness tracking.',
+    'Existing tools are outdated, unreliable and poorly supported.',
+    'We are the first and only platform built for this niche.',
+    'Difficult regulatory environment with high compliance costs.',
+    "The app doesn't crash and isn't slow, it is not a bad idea <3",
+]
+PARITY_TOLERANCE = 0.01
+
+
+def load_lexicon():
+    """Import the precompiled lexicon table"""
+    from sentiment_lexicon import LEXICON
+    return LEXICON
+
+
+class LexiconSentiment:
+    """Polarity scorer over a precompiled lexicon, mirroring pattern's negation and modifier rules"""
+
+    name = 'lexicon'
+
+    def __init__(self, lexicon=None):
+        self.lexicon = lexicon if lexicon is not None else load_lexicon()
+        # Tokens that can change the result by themselves; any other word only matters while
+        # a negation or modifier is pending, which lasts a word or two
+        self.special = frozenset(self.lexicon) | NEGATIONS | frozenset(EMOTICONS) | {'!'}
+
+    def polarity(self, text, lower=None):
+        """Return polarity in [-1, 1] for text; lower is text.lower() when the caller already has it"""
+        lexicon = self.lexicon
+        special = self.special
+        assessments = []  # [polarity, intensity, negated]
+        modifier = None
+        negation = None
+
+        words = tokenize(lower if lower is not None else text.lower())
+        count = len(words)
+        # Walk from each special token through the plain words after it while state is pending,
+        # instead of through every word
+        for start in [i for i, word in enumerate(words) if word in special]:
+            i = start - 1
+            while True:
+                i += 1
+                if i == count:
+                    break
+                word = words[i]
+                if i != start and ((negation is None and modifier is None) or word in special):
+                    break
+                entry = lexicon.get(word)
+                if entry is not None:
+                    polarity, intensity, is_modifier = entry
+                    if modifier is None:
+                        assessments.append([polarity, intensity, False])
+                    else:
+                        # "really good": the modifier's intensity scales this word
+                        previous = assessments[-1]
+                        previous[0] = max(-1.0, min(polarity * previous[1], 1.0))
+                        previous[1] = intensity
+                    if negation is not None:
+                        assessments[-1][1] = 1.0 / assessments[-1][1]
+                        assessments[-1][2] = True
+                    modifier = word if is_modifier else None
+                    negation = word if word in NEGATIONS else None
+                else:
+                    if word in NEGATIONS:
+                        negation = word
+                    elif negation and len(word) > 1:
+                        negation = None
+                    if negation is not None and modifier is not None and modifier.endswith('ly'):
+                        # "really not good"
+                        assessments[-1][2] = True
+                        negation = None
+                    elif modifier and len(word) > 2:
+                        modifier = None
+                    if word == '!' and assessments:
+                        assessments[-1][0] = max(-1.0, min(assessments[-1][0] * 1.25, 1.0))
+                    elif word in EMOTICONS:
+                        assessments.append([EMOTICONS[word], 1.0, False])
+
+        if not assessments:
+            return 0.0
+        # "not good" = slightly bad, "not bad" = slightly good
+        total = sum(p * -0.5 if negated else p for p, _, negated in assessments)
+        return total / len(assessments)
+
+
+class TextBlobSentiment:
+    """Fallback backend that defers to TextBlob's pattern analyzer"""
+
+    name = 'textblob'
+
+    def __init__(self):
+        from textblob import TextBlob
+        self.TextBlob = TextBlob
+
+    def polarity(self, text, lower=None):
+        """Return polarity in [-1, 1] for text; TextBlob tokenizes the original, so lower is unused"""
+        return self.TextBlob(text).sentiment.polarity
+
+
+SENTIMENT_BACKENDS = {
+    'lexicon': LexiconSentiment,
+    'textblob': TextBlobSentiment
+}
+
+
+def get_sentiment_backend(name=None):
+    """Instantiate a sentiment backend by name, defaulting to SENTIMENT_BACKEND or the lexicon"""
+    name = name or os.environ.get('SENTIMENT_BACKEND', 'lexicon')
+    if name not in SENTIMENT_BACKENDS:
+        raise ValueError(f"Unknown sentiment backend '{name}' (choose from {', '.join(SENTIMENT_BACKENDS)})")
+    return SENTIMENT_BACKENDS[name]()
+
+
+def build_lexicon(path):
+    """Regenerate sentiment_lexicon.py from the en-sentiment.xml bundled with TextBlob"""
+    from textblob.en import sentiment as pattern_sentiment
+
+    pattern_sentiment.load()
+    lines = [
+        '# Generated by `python sentiment.py --build-lexicon` from pattern\'s en-sentiment.xml',
+        '# (BSD licensed, bundled with TextBlob). Entries are word: (polarity, intensity, is_modifier),',
+        '# using the part-of-speech-independent averages that TextBlob applies to raw strings.',
+        'LEXICON = {'
+    ]
+    for word in sorted(pattern_sentiment):
+        # Multi-word forms can never match a single token
+        if ' ' in word or word != word.lower():
+            continue
+        senses = pattern_sentiment[word]
+        polarity, _, intensity = senses[None]
+        is_modifier = 'RB' in senses
+        lines.append(f'    {word!r}: ({round(polarity, 4)!r}, {round(intensity, 4)!r}, {is_modifier}),')
+    lines.append('}')
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    return len(lines) - 5
+
+
+def check_parity(corpus=PARITY_CORPUS, tolerance=PARITY_TOLERANCE):
+    """Compare the lexicon backend with TextBlob on a fixed corpus; returns (ok, max_deviation)"""
+    lexicon = LexiconSentiment()
+    textblob = TextBlobSentiment()
+    deviations = [abs(lexicon.polarity(text) - textblob.polarity(text)) for text in corpus]
+    return max(deviations) <= tolerance, max(deviations)
+
+
+if __name__ == '__main__':
+    here = os.path.dirname(os.path.abspath(__file__))
+    if '--build-lexicon' in sys.argv:
+        count = build_lexicon(os.path.join(here, 'sentiment_lexicon.py'))
+        print(f'Wrote {count} lexicon entries')
+    else:
+        ok, deviation = check_parity()
+        print(f'Lexicon vs TextBlob max polarity deviation: {deviation:.4f} (tolerance {PARITY_TOLERANCE})')
+        sys.exit(0 if ok else 1)
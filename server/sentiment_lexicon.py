@@ -0,0 +1,2849 @@
+# Generated by `python sentiment.py --build-lexicon` from pattern's en-sentiment.xml
+# (BSD licensed, bundled with TextBlob). Entries are word: (polarity, intensity, is_modifier),
+# using the part-of-speech-independent averages that TextBlob applies to raw strings.
+LEXICON = {
+    '13th': (0.0, 1.0, False),
+    '13thly': (0.0, 1.0, True),
+    '20th': (0.0, 1.0, False),
+    '20thly': (0.0, 1.0, True),
+    '21st': (0.0, 1.0, False),
+    '21stly': (0.0, 1.0, True),
+    '2nd': (0.0, 1.0, False),
+    '2ndly': (0.0, 1.0, True),
+    '3rd': (0.0, 1.0, False),
+    '3rdly': (0.0, 1.0, True),
+    'abhorrent': (-0.7, 1.0, False),
+    'abhorrently': (-0.7, 1.0, True),
+    'able': (0.5, 1.0, False),
+    'ably': (0.5, 1.0, True),
+    'above': (0.0, 1.0, False),
+    'abovely': (0.0, 1.0, True),
+    'abridged': (0.1, 1.0, False),
+    'abridgedly': (0.1, 1.0, True),
+    'abrupt': (-0.125, 1.0, False),
+    'abruptly': (-0.125, 1.0, True),
+    'absence': (-0.0125, 1.0, False),
+    'absolute': (0.2, 1.0, False),
+    'absolutely': (0.2, 1.0, True),
+    'absorbed': (0.3, 1.0, False),
+    'absorbedly': (0.3, 1.0, True),
+    'absorbing': (0.2, 1.0, False),
+    'absorbingly': (0.2, 1.0, True),
+    'absurd': (-0.5, 1.0, False),
+    'absurdly': (-0.5, 1.0, True),
+    'abundant': (0.6, 1.0, False),
+    'abundantly': (0.6, 1.0, True),
+    'academic': (0.0, 1.0, False),
+    'academicly': (0.0, 1.0, True),
+    'accessible': (0.375, 1.0, False),
+    'accessibly': (0.375, 1.0, True),
+    'accomplished': (0.2, 1.0, False),
+    'accomplishedly': (0.2, 1.0, True),
+    'accurate': (0.4, 1.0, False),
+    'accurately': (0.4, 1.0, True),
+    'acquainted': (0.5, 1.0, False),
+    'acquaintedly': (0.5, 1.0, True),
+    'across-the-board': (0.1, 1.0, False),
+    'across-the-boardly': (0.1, 1.0, True),
+    'acting': (0.0, 1.0, False),
+    'actingly': (0.0, 1.0, True),
+    'action': (0.1, 1.0, False),
+    'active': (-0.1333, 1.0, False),
+    'actively': (-0.1333, 1.0, True),
+    'actual': (0.0, 1.0, False),
+    'actually': (0.0, 1.0, True),
+    'acuate': (0.1, 1.0, False),
+    'acuately': (0.1, 1.0, True),
+    'acute': (0.6, 1.0, False),
+    'acutely': (0.6, 1.0, True),
+    'adamant': (0.1, 1.0, False),
+    'adamantly': (0.1, 1.0, True),
+    'addicted': (-0.4, 1.0, False),
+    'addictedly': (-0.4, 1.0, True),
+    'addictive': (0.0, 1.0, False),
+    'addictively': (0.0, 1.0, True),
+    'addled': (-0.4667, 1.0, False),
+    'addledly': (-0.4667, 1.0, True),
+    'adept': (0.6, 1.0, False),
+    'adeptly': (0.6, 1.0, True),
+    'adequate': (0.3333, 1.0, False),
+    'adequately': (0.3333, 1.0, True),
+    'adjectival': (0.1, 1.0, False),
+    'adjectivally': (0.1, 1.0, True),
+    'administrable': (0.0, 1.0, False),
+    'administrably': (0.0, 1.0, True),
+    'adorable': (0.5, 1.0, False),
+    'adorably': (0.5, 1.0, True),
+    'adoring': (0.2, 1.0, False),
+    'adoringly': (0.2, 1.0, True),
+    'adult': (0.1, 1.0, False),
+    'adultly': (0.1, 1.0, True),
+    'advanced': (0.4, 1.0, False),
+    'advancedly': (0.4, 1.0, True),
+    'adventurous': (0.5, 1.0, False),
+    'adventurously': (0.5, 1.0, True),
+    'adversative': (-0.1, 1.0, False),
+    'adversatively': (-0.1, 1.0, True),
+    'advertent': (0.5, 1.0, False),
+    'advertently': (0.5, 1.0, True),
+    'aeriform': (-0.25, 1.0, False),
+    'aeriformly': (-0.25, 1.0, True),
+    'affable': (0.8, 1.0, False),
+    'affably': (0.8, 1.0, True),
+    'affirmative': (0.6, 1.0, False),
+    'affirmatively': (0.6, 1.0, True),
+    'affluent': (0.65, 1.0, False),
+    'affluently': (0.65, 1.0, True),
+    'afloat': (0.0, 1.0, False),
+    'afloatly': (0.0, 1.0, True),
+    'aforementioned': (0.0, 1.0, False),
+    'aforementionedly': (0.0, 1.0, True),
+    'afraid': (-0.6, 1.0, False),
+    'afraidly': (-0.6, 1.0, True),
+    'african': (0.0, 1.0, False),
+    'africanly': (0.0, 1.0, True),
+    'aged': (-0.1, 1.0, False),
+    'agedly': (-0.1, 1.0, True),
+    'aghast': (-0.6, 1.0, False),
+    'aghastly': (-0.6, 1.0, True),
+    'agile': (0.5, 1.0, False),
+    'agily': (0.5, 1.0, True),
+    'agitative': (-0.6, 1.0, False),
+    'agitatively': (-0.6, 1.0, True),
+    'aglow': (0.0, 1.0, False),
+    'aglowly': (0.0, 1.0, True),
+    'ahw': (0.3, 1.0, False),
+    'aired': (0.1, 1.0, False),
+    'airedly': (0.1, 1.0, True),
+    'airheaded': (0.5, 1.0, False),
+    'airheadedly': (0.5, 1.0, True),
+    'alarming': (-0.1, 1.0, False),
+    'alarmingly': (-0.1, 1.0, True),
+    'alas': (-0.4, 1.0, False),
+    'alcoholic': (-0.25, 1.0, False),
+    'alcoholicly': (-0.25, 1.0, True),
+    'algid': (-0.4, 1.0, False),
+    'algidly': (-0.4, 1.0, True),
+    'alien': (-0.25, 1.0, False),
+    'alienating': (-0.3, 1.0, False),
+    'alienatingly': (-0.3, 1.0, True),
+    'alienly': (-0.25, 1.0, True),
+    'alive': (0.1, 1.0, False),
+    'alively': (0.1, 1.0, True),
+    'all-around': (0.2, 1.0, False),
+    'all-aroundly': (0.2, 1.0, True),
+    'alleged': (-0.1, 1.0, False),
+    'allegedly': (-0.1, 1.0, True),
+    'alleviated': (0.5, 1.0, False),
+    'alleviatedly': (0.5, 1.0, True),
+    'allusions': (-0.1, 1.0, False),
+    'alternate': (0.0, 1.0, False),
+    'alternately': (0.0, 1.0, True),
+    'amateur': (-0.25, 1.0, False),
+    'amateurish': (-0.4, 1.0, False),
+    'amateurishly': (-0.4, 1.0, True),
+    'amateurly': (-0.25, 1.0, True),
+    'amatorily': (0.1, 1.0, True),
+    'amatory': (0.1, 1.0, False),
+    'amazing': (0.6, 1.0, False),
+    'amazingly': (0.6, 1.0, True),
+    'ambitious': (0.25, 1.0, False),
+    'ambitiously': (0.25, 1.0, True),
+    'amenable': (0.2, 1.0, False),
+    'amenably': (0.2, 1.0, True),
+    'american': (0.0, 1.0, False),
+    'americanly': (0.0, 1.0, True),
+    'amusing': (0.6, 1.0, False),
+    'amusingly': (0.6, 1.0, True),
+    'anger': (-0.7, 1.0, False),
+    'angered': (-0.75, 1.0, False),
+    'angeredly': (-0.75, 1.0, True),
+    'angrily': (-0.5, 1.0, True),
+    'angry': (-0.5, 1.0, False),
+    'annoyed': (-0.4, 1.0, False),
+    'annoyedly': (-0.4, 1.0, True),
+    'annoying': (-0.8, 1.0, False),
+    'annoyingly': (-0.8, 1.0, True),
+    'anxious': (-0.25, 1.0, False),
+    'anxiously': (-0.25, 1.0, True),
+    'aphonic': (-0.1, 1.0, False),
+    'aphonicly': (-0.1, 1.0, True),
+    'appalled': (-0.8, 1.0, False),
+    'appalledly': (-0.8, 1.0, True),
+    'appalling': (-0.35, 1.0, False),
+    'appallingly': (-0.35, 1.0, True),
+    'apparent': (0.05, 1.0, False),
+    'apparently': (0.05, 1.0, True),
+    'appealing': (0.5, 1.0, False),
+    'appealingly': (0.5, 1.0, True),
+    'appetizing': (0.2, 1.0, False),
+    'appetizingly': (0.2, 1.0, True),
+    'applaudable': (0.7, 1.0, False),
+    'applaudably': (0.7, 1.0, True),
+    'applicative': (0.4, 1.0, False),
+    'applicatively': (0.4, 1.0, True),
+    'apportioned': (0.3, 1.0, False),
+    'apportionedly': (0.3, 1.0, True),
+    'apposite': (0.4, 1.0, False),
+    'appositely': (0.4, 1.0, True),
+    'appreciated': (0.2, 1.0, False),
+    'appreciatedly': (0.2, 1.0, True),
+    'appreciative': (0.6, 1.0, False),
+    'appreciatively': (0.6, 1.0, True),
+    'approaching': (0.0, 1.0, False),
+    'approachingly': (0.0, 1.0, True),
+    'appropriate': (0.5, 1.0, False),
+    'appropriately': (0.5, 1.0, True),
+    'approximate': (-0.4, 1.0, False),
+    'approximately': (-0.4, 1.0, True),
+    'apt': (0.6, 1.0, False),
+    'aptly': (0.6, 1.0, True),
+    'arbitrarily': (-0.1, 1.0, True),
+    'arbitrary': (-0.1, 1.0, False),
+    'archaeological': (0.0, 1.0, False),
+    'archaeologically': (0.0, 1.0, True),
+    'arduous': (-0.35, 1.0, False),
+    'arduously': (-0.35, 1.0, True),
+    'aroused': (0.1, 1.0, False),
+    'arousedly': (0.1, 1.0, True),
+    'arrest': (-0.05, 1.0, False),
+    'artesian': (0.9, 1.0, False),
+    'artesianly': (0.9, 1.0, True),
+    'artificial': (-0.6, 1.0, False),
+    'artificially': (-0.6, 1.0, True),
+    'artistic': (0.3333, 1.0, False),
+    'artisticly': (0.3333, 1.0, True),
+    'ascetic': (-0.5, 1.0, False),
+    'asceticly': (-0.5, 1.0, True),
+    'ashen': (-0.5, 1.0, False),
+    'ashenly': (-0.5, 1.0, True),
+    'asian': (0.0, 1.0, False),
+    'asianly': (0.0, 1.0, True),
+    'askew': (-0.1, 1.0, False),
+    'askewly': (-0.1, 1.0, True),
+    'assumptive': (-0.5, 1.0, False),
+    'assumptively': (-0.5, 1.0, True),
+    'astonishing': (0.5, 1.0, False),
+    'astonishingly': (0.5, 1.0, True),
+    'astounding': (0.6, 1.0, False),
+    'astoundingly': (0.6, 1.0, True),
+    'astute': (0.55, 1.0, False),
+    'astutely': (0.55, 1.0, True),
+    'atmospheric': (0.0, 1.0, False),
+    'atmosphericly': (0.0, 1.0, True),
+    'atrocious': (-0.7, 1.0, False),
+    'atrociously': (-0.7, 1.0, True),
+    'attendant': (0.2, 1.0, False),
+    'attendantly': (0.2, 1.0, True),
+    'attention-getting': (0.4, 1.0, False),
+    'attention-gettingly': (0.4, 1.0, True),
+    'attentive': (0.4, 1.0, False),
+    'attentively': (0.4, 1.0, True),
+    'attractive': (0.8, 1.0, False),
+    'attractively': (0.8, 1.0, True),
+    'atypical': (0.0, 1.0, False),
+    'atypically': (0.0, 1.0, True),
+    'aureate': (0.2, 1.0, False),
+    'aureately': (0.2, 1.0, True),
+    'australian': (0.0, 1.0, False),
+    'australianly': (0.0, 1.0, True),
+    'authentic': (0.5, 1.0, False),
+    'authenticly': (0.5, 1.0, True),
+    'authoritative': (0.3, 1.0, False),
+    'authoritatively': (0.3, 1.0, True),
+    'autistic': (-0.2, 1.0, False),
+    'autisticly': (-0.2, 1.0, True),
+    'autobiographical': (0.0, 1.0, False),
+    'autobiographically': (0.0, 1.0, True),
+    'autonomous': (0.4, 1.0, False),
+    'autonomously': (0.4, 1.0, True),
+    'available': (0.4, 1.0, False),
+    'availably': (0.4, 1.0, True),
+    'average': (-0.15, 1.0, False),
+    'averagely': (-0.15, 1.0, True),
+    'avid': (0.25, 1.0, False),
+    'avidly': (0.25, 1.0, True),
+    'aware': (0.25, 1.0, False),
+    'awarely': (0.25, 1.0, True),
+    'awearily': (-0.5, 1.0, True),
+    'aweary': (-0.5, 1.0, False),
+    'awesome': (1.0, 1.0, False),
+    'awesomely': (1.0, 1.0, True),
+    'awful': (-1.0, 1.0, False),
+    'awfully': (-1.0, 1.0, True),
+    'awkward': (-0.6, 1.0, False),
+    'awkwardly': (-0.6, 1.0, True),
+    'aww': (0.3, 1.0, False),
+    'awww': (0.4, 1.0, False),
+    'awwww': (0.5, 1.0, False),
+    'axiomatic': (0.0, 1.0, False),
+    'axiomaticly': (0.0, 1.0, True),
+    'back': (0.0, 1.0, False),
+    'backly': (0.0, 1.0, True),
+    'bad': (-0.7, 1.0, False),
+    'badly': (-0.7, 1.0, True),
+    'badness': (-0.3, 1.0, False),
+    'balmily': (0.1, 1.0, True),
+    'balmy': (0.1, 1.0, False),
+    'banal': (-0.3, 1.0, False),
+    'banally': (-0.3, 1.0, True),
+    'banded': (0.0, 1.0, False),
+    'bandedly': (0.0, 1.0, True),
+    'bang-up': (0.4, 1.0, False),
+    'bang-uply': (0.4, 1.0, True),
+    'barbarian': (-0.7, 1.0, False),
+    'barbarianly': (-0.7, 1.0, True),
+    'barbarous': (0.0, 1.0, False),
+    'barbarously': (0.0, 1.0, True),
+    'bare': (0.05, 1.0, False),
+    'barely': (0.05, 1.0, True),
+    'base': (-0.8, 1.0, False),
+    'basely': (-0.8, 1.0, True),
+    'basic': (0.0, 1.0, False),
+    'basicly': (0.0, 1.0, True),
+    'bass': (-0.15, 1.0, False),
+    'bassly': (-0.15, 1.0, True),
+    'battleful': (-0.6, 1.0, False),
+    'battlefully': (-0.6, 1.0, True),
+    'beautiful': (0.85, 1.0, False),
+    'beautifully': (0.85, 1.0, True),
+    'becoming': (0.45, 1.0, False),
+    'becomingly': (0.45, 1.0, True),
+    'beefily': (0.2, 1.0, True),
+    'beefy': (0.2, 1.0, False),
+    'behind': (-0.4, 1.0, False),
+    'behindly': (-0.4, 1.0, True),
+    'believable': (0.5, 1.0, False),
+    'believably': (0.5, 1.0, True),
+    'beloved': (0.7, 1.0, False),
+    'belovedly': (0.7, 1.0, True),
+    'best': (1.0, 1.0, False),
+    'bestly': (1.0, 1.0, True),
+    'better': (0.5, 1.0, False),
+    'betterly': (0.5, 1.0, True),
+    'bewitching': (0.7, 1.0, False),
+    'bewitchingly': (0.7, 1.0, True),
+    'big': (0.0, 1.0, False),
+    'bigger': (0.0, 1.0, False),
+    'biggerly': (0.0, 1.0, True),
+    'bigly': (0.0, 1.0, True),
+    'biographic': (0.0, 1.0, False),
+    'biographicly': (0.0, 1.0, True),
+    'bitter': (-0.1, 1.0, False),
+    'bitterly': (-0.1, 1.0, True),
+    'bizarre': (0.4, 1.0, False),
+    'bizarrely': (0.4, 1.0, True),
+    'black': (-0.1667, 1.0, False),
+    'blackly': (-0.1667, 1.0, True),
+    'bland': (-0.1667, 1.0, False),
+    'blandly': (-0.1667, 1.0, True),
+    'blank': (0.0, 1.0, False),
+    'blankly': (0.0, 1.0, True),
+    'blasted': (-0.6, 1.0, False),
+    'blastedly': (-0.6, 1.0, True),
+    'blatant': (-0.5, 1.0, False),
+    'blatantly': (-0.5, 1.0, True),
+    'bleak': (-1.0, 1.0, False),
+    'bleakly': (-1.0, 1.0, True),
+    'blech': (-0.8, 1.0, False),
+    'blind': (-0.5, 1.0, False),
+    'blindly': (-0.5, 1.0, True),
+    'blonde': (0.0, 1.0, False),
+    'blondely': (0.0, 1.0, True),
+    'bloodily': (-0.8, 1.0, True),
+    'bloodstained': (-0.6, 1.0, False),
+    'bloodstainedly': (-0.6, 1.0, True),
+    'bloodthirstily': (-0.5, 1.0, True),
+    'bloodthirsty': (-0.5, 1.0, False),
+    'bloody': (-0.8, 1.0, False),
+    'blue': (0.0, 1.0, False),
+    'bluely': (0.0, 1.0, True),
+    'bodilily': (0.0, 1.0, True),
+    'bodily': (0.0, 1.0, False),
+    'bogged': (-0.2, 1.0, False),
+    'boilerplate': (-0.1, 1.0, False),
+    'bold': (0.3333, 1.0, False),
+    'boldly': (0.3333, 1.0, True),
+    'bonnily': (0.3, 1.0, True),
+    'bonny': (0.3, 1.0, False),
+    'bootleg': (-0.4, 1.0, False),
+    'bootlegly': (-0.4, 1.0, True),
+    'bored': (-0.5, 1.0, False),
+    'boredly': (-0.5, 1.0, True),
+    'boring': (-1.0, 1.0, False),
+    'boringly': (-1.0, 1.0, True),
+    'boundless': (-0.2, 1.0, False),
+    'boundlessly': (-0.2, 1.0, True),
+    'brainsick': (-0.5, 1.0, False),
+    'brainsickly': (-0.5, 1.0, True),
+    'brash': (-0.2, 1.0, False),
+    'brashly': (-0.2, 1.0, True),
+    'bravado': (-0.2, 1.0, False),
+    'brave': (0.8, 1.0, False),
+    'bravely': (0.8, 1.0, True),
+    'breathtaking': (1.0, 1.0, False),
+    'breathtakingly': (1.0, 1.0, True),
+    'brief': (0.0, 1.0, False),
+    'briefly': (0.0, 1.0, True),
+    'bright': (0.7, 1.0, False),
+    'brightly': (0.7, 1.0, True),
+    'brilliant': (0.9, 1.0, False),
+    'brilliantly': (0.9, 1.0, True),
+    'british': (0.0, 1.0, False),
+    'britishly': (0.0, 1.0, True),
+    'broad': (0.0625, 1.0, False),
+    'broad-minded': (0.0, 1.0, False),
+    'broad-mindedly': (0.0, 1.0, True),
+    'broadly': (0.0625, 1.0, True),
+    'broken': (-0.4, 1.0, False),
+    'brokenly': (-0.4, 1.0, True),
+    'brushed': (0.0, 1.0, False),
+    'brushedly': (0.0, 1.0, True),
+    'brutal': (-0.875, 1.0, False),
+    'brutally': (-0.875, 1.0, True),
+    'budding': (0.1, 1.0, False),
+    'buddingly': (0.1, 1.0, True),
+    'busily': (0.1, 1.0, True),
+    'busy': (0.1, 1.0, False),
+    'cacophonous': (-0.4, 1.0, False),
+    'cacophonously': (-0.4, 1.0, True),
+    'calculable': (-0.5, 1.0, False),
+    'calculably': (-0.5, 1.0, True),
+    'calm': (0.3, 1.0, False),
+    'calmly': (0.3, 1.0, True),
+    "can't": (-0.1, 1.0, False),
+    'candid': (0.6, 1.0, False),
+    'candidly': (0.6, 1.0, True),
+    'capable': (0.2, 1.0, False),
+    'capably': (0.2, 1.0, True),
+    'captivating': (0.5, 1.0, False),
+    'captivatingly': (0.5, 1.0, True),
+    'captive': (0.2, 1.0, False),
+    'captively': (0.2, 1.0, True),
+    'cardiac': (-0.05, 1.0, False),
+    'cardiacly': (-0.05, 1.0, True),
+    'careful': (-0.1, 1.0, False),
+    'carefully': (-0.1, 1.0, True),
+    'careless': (-0.5, 1.0, False),
+    'carelessly': (-0.5, 1.0, True),
+    'cast-iron': (0.9, 1.0, False),
+    'cast-ironly': (0.9, 1.0, True),
+    'casual': (-0.5, 1.0, False),
+    'casually': (-0.5, 1.0, True),
+    'catching': (0.6, 1.0, False),
+    'catchingly': (0.6, 1.0, True),
+    'catholic': (0.0, 1.0, False),
+    'catholicly': (0.0, 1.0, True),
+    'caustic': (-0.4, 1.0, False),
+    'causticly': (-0.4, 1.0, True),
+    'ceaseless': (-0.1, 1.0, False),
+    'ceaselessly': (-0.1, 1.0, True),
+    'celebrated': (0.35, 1.0, False),
+    'celebratedly': (0.35, 1.0, True),
+    'center': (-0.1, 1.0, False),
+    'centerly': (-0.1, 1.0, True),
+    'central': (0.0, 1.0, False),
+    'centrally': (0.0, 1.0, True),
+    'centric': (0.0, 1.0, False),
+    'centricly': (0.0, 1.0, True),
+    'ceremonial': (0.05, 1.0, False),
+    'ceremonially': (0.05, 1.0, True),
+    'certain': (0.2143, 1.0, False),
+    'certainly': (0.2143, 1.0, True),
+    'challenging': (0.5, 1.0, False),
+    'challengingly': (0.5, 1.0, True),
+    'changeless': (-0.05, 1.0, False),
+    'changelessly': (-0.05, 1.0, True),
+    'characteristic': (-0.0667, 1.0, False),
+    'characteristicly': (-0.0667, 1.0, True),
+    'charismatic': (0.5, 1.0, False),
+    'charismaticly': (0.5, 1.0, True),
+    'charitable': (0.6, 1.0, False),
+    'charitably': (0.6, 1.0, True),
+    'charming': (0.7, 1.0, False),
+    'charmingly': (0.7, 1.0, True),
+    'cheap': (0.4, 1.0, False),
+    'cheaply': (0.4, 1.0, True),
+    'cheerful': (0.4, 1.0, False),
+    'cheerfully': (0.4, 1.0, True),
+    'cheerily': (0.7, 1.0, True),
+    'cheery': (0.7, 1.0, False),
+    'cheesiest': (-0.4, 1.0, False),
+    'cheesily': (-0.5, 1.0, True),
+    'cheesy': (-0.5, 1.0, False),
+    'chicken': (-0.6, 1.0, False),
+    'chickenly': (-0.6, 1.0, True),
+    'childish': (-0.2, 1.0, False),
+    'childishly': (-0.2, 1.0, True),
+    'chillily': (-0.6, 1.0, True),
+    'chilling': (-0.5, 1.0, False),
+    'chillingly': (-0.5, 1.0, True),
+    'chilly': (-0.6, 1.0, False),
+    'chinese': (0.0, 1.0, False),
+    'chinesely': (0.0, 1.0, True),
+    'chitchat': (-0.2, 1.0, False),
+    'choppily': (-0.2, 1.0, True),
+    'choppy': (-0.2, 1.0, False),
+    'christian': (0.0, 1.0, False),
+    'christianly': (0.0, 1.0, True),
+    'chronological': (0.0, 1.0, False),
+    'chronologically': (0.0, 1.0, True),
+    'churning': (-0.5, 1.0, False),
+    'churningly': (-0.5, 1.0, True),
+    'cinematic': (0.0, 1.0, False),
+    'cinematicly': (0.0, 1.0, True),
+    'civilized': (0.4, 1.0, False),
+    'civilizedly': (0.4, 1.0, True),
+    'classic': (0.1667, 1.0, False),
+    'classical': (0.0, 1.0, False),
+    'classically': (0.0, 1.0, True),
+    'classicly': (0.1667, 1.0, True),
+    'classily': (0.1, 1.0, True),
+    'classy': (0.1, 1.0, False),
+    'claustrophobic': (-0.75, 1.0, False),
+    'claustrophobicly': (-0.75, 1.0, True),
+    'clean': (0.3667, 1.0, False),
+    'cleanlily': (0.3, 1.0, True),
+    'cleanly': (0.3667, 1.0, True),
+    'clear': (0.1, 1.0, False),
+    'clearly': (0.1, 1.0, True),
+    'clever': (0.1667, 1.0, False),
+    'cleverly': (0.1667, 1.0, True),
+    'closed': (-0.1, 1.0, False),
+    'closedly': (-0.1, 1.0, True),
+    'cloud-covered': (-0.2, 1.0, False),
+    'cloud-coveredly': (-0.2, 1.0, True),
+    'cloudless': (0.1, 1.0, False),
+    'cloudlessly': (0.1, 1.0, True),
+    'cluelessness': (-0.1, 1.0, False),
+    'clumsily': (-0.3, 1.0, True),
+    'clumsy': (-0.3, 1.0, False),
+    'coarse': (0.0, 1.0, False),
+    'coarsely': (0.0, 1.0, True),
+    'cockily': (-0.2, 1.0, True),
+    'cocky': (-0.2, 1.0, False),
+    'coherent': (0.5, 1.0, False),
+    'coherently': (0.5, 1.0, True),
+    'cold': (-0.6, 1.0, False),
+    'coldly': (-0.6, 1.0, True),
+    'collectible': (-0.5, 1.0, False),
+    'collectibly': (-0.5, 1.0, True),
+    'colorful': (0.3, 1.0, False),
+    'colorfully': (0.3, 1.0, True),
+    'colossal': (0.3, 1.0, False),
+    'colossally': (0.3, 1.0, True),
+    'coma': (-0.1, 1.0, False),
+    'come-at-able': (0.3, 1.0, False),
+    'come-at-ably': (0.3, 1.0, True),
+    'comfortable': (0.4, 1.0, False),
+    'comfortably': (0.4, 1.0, True),
+    'comic': (0.25, 1.0, False),
+    'comical': (0.5, 1.0, False),
+    'comically': (0.5, 1.0, True),
+    'comicly': (0.25, 1.0, True),
+    'commercial': (0.0, 1.0, False),
+    'commercialism': (-0.1, 1.0, False),
+    'commercially': (0.0, 1.0, True),
+    'common': (-0.3, 1.0, False),
+    'commonly': (-0.3, 1.0, True),
+    'compelling': (0.3, 1.0, False),
+    'compellingly': (0.3, 1.0, True),
+    'competent': (0.5, 1.0, False),
+    'competently': (0.5, 1.0, True),
+    'complained': (-0.3, 1.0, False),
+    'complaint': (-0.3, 1.0, False),
+    'complete': (0.1, 1.0, False),
+    'completely': (0.1, 1.0, True),
+    'complex': (-0.3, 1.0, False),
+    'complexly': (-0.3, 1.0, True),
+    'complicated': (-0.5, 1.0, False),
+    'complicatedly': (-0.5, 1.0, True),
+    'complimentarily': (0.3, 1.0, True),
+    'complimentary': (0.3, 1.0, False),
+    'comprehensible': (0.4, 1.0, False),
+    'comprehensibly': (0.4, 1.0, True),
+    'concavo-convex': (0.0, 1.0, False),
+    'concavo-convexly': (0.0, 1.0, True),
+    'conceivable': (0.1, 1.0, False),
+    'conceivably': (0.1, 1.0, True),
+    'conceptional': (0.0, 1.0, False),
+    'conceptionally': (0.0, 1.0, True),
+    'concise': (0.1, 1.0, False),
+    'concisely': (0.1, 1.0, True),
+    'concrete': (0.15, 1.0, False),
+    'concretely': (0.15, 1.0, True),
+    'confident': (0.5, 1.0, False),
+    'confidently': (0.5, 1.0, True),
+    'confirmed': (0.4, 1.0, False),
+    'confirmedly': (0.4, 1.0, True),
+    'confused': (-0.4, 1.0, False),
+    'confusedly': (-0.4, 1.0, True),
+    'confusing': (-0.3, 1.0, False),
+    'confusingly': (-0.3, 1.0, True),
+    'conscious': (0.1, 1.0, False),
+    'consciously': (0.1, 1.0, True),
+    'consecrated': (0.2, 1.0, False),
+    'consecratedly': (0.2, 1.0, True),
+    'considerable': (0.1, 1.0, False),
+    'considerably': (0.1, 1.0, True),
+    'consistent': (0.25, 1.0, False),
+    'consistently': (0.25, 1.0, True),
+    'constant': (0.0, 1.0, False),
+    'constantly': (0.0, 1.0, True),
+    'consummate': (0.95, 1.0, False),
+    'consummately': (0.95, 1.0, True),
+    'contemporarily': (0.1667, 1.0, True),
+    'contemporary': (0.1667, 1.0, False),
+    'contestable': (-0.4, 1.0, False),
+    'contestably': (-0.4, 1.0, True),
+    'contingent': (-0.1, 1.0, False),
+    'contingently': (-0.1, 1.0, True),
+    'contrived': (-0.5, 1.0, False),
+    'contrivedly': (-0.5, 1.0, True),
+    'controversial': (0.55, 1.0, False),
+    'controversially': (0.55, 1.0, True),
+    'conventional': (-0.1429, 1.0, False),
+    'conventionally': (-0.1429, 1.0, True),
+    'convex': (0.2, 1.0, False),
+    'convexly': (0.2, 1.0, True),
+    'convincing': (0.5, 1.0, False),
+    'convincingly': (0.5, 1.0, True),
+    'cool': (0.35, 1.0, False),
+    'coolly': (0.35, 1.0, True),
+    'coriaceous': (-0.3, 1.0, False),
+    'coriaceously': (-0.3, 1.0, True),
+    'corporate': (0.0, 1.0, False),
+    'corporately': (0.0, 1.0, True),
+    'corpulent': (-0.5, 1.0, False),
+    'corpulently': (-0.5, 1.0, True),
+    'corrupt': (-0.5, 1.0, False),
+    'corruptible': (-0.6, 1.0, False),
+    'corruptibly': (-0.6, 1.0, True),
+    'corruptly': (-0.5, 1.0, True),
+    'cosmopolitan': (0.0, 1.0, False),
+    'cosmopolitanly': (0.0, 1.0, True),
+    'countless': (0.0, 1.0, False),
+    'countlessly': (0.0, 1.0, True),
+    'courteous': (0.6, 1.0, False),
+    'courteously': (0.6, 1.0, True),
+    'cow': (-0.1333, 1.0, False),
+    'cozily': (-0.2, 1.0, True),
+    'cozy': (-0.2, 1.0, False),
+    'craftily': (0.4, 1.0, True),
+    'crafty': (0.4, 1.0, False),
+    'crap': (-0.8, 1.0, False),
+    'crazily': (-0.6, 1.0, True),
+    'crazy': (-0.6, 1.0, False),
+    'creative': (0.5, 1.0, False),
+    'creatively': (0.5, 1.0, True),
+    'credible': (0.4, 1.0, False),
+    'credibly': (0.4, 1.0, True),
+    'creepily': (-0.5, 1.0, True),
+    'creepy': (-0.5, 1.0, False),
+    'criminal': (-0.4, 1.0, False),
+    'criminally': (-0.4, 1.0, True),
+    'crisp': (0.25, 1.0, False),
+    'crisply': (0.25, 1.0, True),
+    'critical': (0.0, 1.0, False),
+    'critically': (0.0, 1.0, True),
+    'crooked': (0.0, 1.0, False),
+    'crookedly': (0.0, 1.0, True),
+    'cross': (0.0, 1.0, False),
+    'crossly': (0.0, 1.0, True),
+    'crucial': (0.0, 1.0, False),
+    'crucially': (0.0, 1.0, True),
+    'cruddily': (-0.9, 1.0, True),
+    'cruddy': (-0.9, 1.0, False),
+    'crude': (-0.7, 1.0, False),
+    'crudely': (-0.7, 1.0, True),
+    'cruel': (-1.0, 1.0, False),
+    'cruelly': (-1.0, 1.0, True),
+    'crushed': (-0.1, 1.0, False),
+    'crushedly': (-0.1, 1.0, True),
+    'crushing': (0.4, 1.0, False),
+    'crushingly': (0.4, 1.0, True),
+    'crying': (-0.2, 1.0, False),
+    'cryingly': (-0.2, 1.0, True),
+    'culinarily': (0.0, 1.0, True),
+    'culinary': (0.0, 1.0, False),
+    'cultural': (0.1, 1.0, False),
+    'culturally': (0.1, 1.0, True),
+    'cunning': (0.0, 1.0, False),
+    'cunningly': (0.0, 1.0, True),
+    'curious': (-0.1, 1.0, False),
+    'curiously': (-0.1, 1.0, True),
+    'current': (0.0, 1.0, False),
+    'currently': (0.0, 1.0, True),
+    'cursive': (0.0, 1.0, False),
+    'cursively': (0.0, 1.0, True),
+    'cushily': (0.9, 1.0, True),
+    'cushy': (0.9, 1.0, False),
+    'cute': (0.5, 1.0, False),
+    'cutely': (0.5, 1.0, True),
+    'cutting': (-0.6, 1.0, False),
+    'cuttingly': (-0.6, 1.0, True),
+    'cynical': (-0.6, 1.0, False),
+    'cynically': (-0.6, 1.0, True),
+    'dailily': (0.0, 1.0, True),
+    'daily': (0.0, 1.0, False),
+    'daintily': (0.9, 1.0, True),
+    'dainty': (0.9, 1.0, False),
+    'dangerous': (-0.6, 1.0, False),
+    'dangerously': (-0.6, 1.0, True),
+    'dark': (-0.15, 1.0, False),
+    'darkly': (-0.15, 1.0, True),
+    'dazed': (-0.5, 1.0, False),
+    'dazedly': (-0.5, 1.0, True),
+    'dazzling': (0.75, 1.0, False),
+    'dazzlingly': (0.75, 1.0, True),
+    'dead': (-0.2, 1.0, False),
+    'deadlily': (-0.8333, 1.0, True),
+    'deadly': (-0.2, 1.0, True),
+    'deadpan': (-0.55, 1.0, False),
+    'deadpanly': (-0.55, 1.0, True),
+    'debauched': (-0.8, 1.0, False),
+    'debauchedly': (-0.8, 1.0, True),
+    'decent': (0.1667, 1.0, False),
+    'decently': (0.1667, 1.0, True),
+    'decreased': (-0.4, 1.0, False),
+    'decreasedly': (-0.4, 1.0, True),
+    'deep': (0.0, 1.0, False),
+    'deeply': (0.0, 1.0, True),
+    'defecates': (-0.1, 1.0, False),
+    'defenseless': (-0.4, 1.0, False),
+    'defenselessly': (-0.4, 1.0, True),
+    'deficient': (-0.4, 1.0, False),
+    'deficiently': (-0.4, 1.0, True),
+    'definite': (0.0, 1.0, False),
+    'definitely': (0.0, 1.0, True),
+    'deft': (0.6, 1.0, False),
+    'deftly': (0.6, 1.0, True),
+    'delicate': (-0.3, 1.0, False),
+    'delicately': (-0.3, 1.0, True),
+    'delicious': (1.0, 1.0, False),
+    'deliciously': (1.0, 1.0, True),
+    'delighted': (0.7, 1.0, False),
+    'delightedly': (0.7, 1.0, True),
+    'delightful': (1.0, 1.0, False),
+    'delightfully': (1.0, 1.0, True),
+    'deluxe': (0.6, 1.0, False),
+    'deluxely': (0.6, 1.0, True),
+    'denominational': (0.0, 1.0, False),
+    'denominationally': (0.0, 1.0, True),
+    'deplorable': (-0.6, 1.0, False),
+    'deplorably': (-0.6, 1.0, True),
+    'depress': (-0.0667, 1.0, False),
+    'depressing': (-0.6, 1.0, False),
+    'depressingly': (-0.6, 1.0, True),
+    'deserving': (0.6, 1.0, False),
+    'deservingly': (0.6, 1.0, True),
+    'desperate': (-0.6, 1.0, False),
+    'desperately': (-0.6, 1.0, True),
+    'destroy': (-0.2, 1.0, False),
+    'destroying': (-0.2, 1.0, False),
+    'destructive': (-0.6, 1.0, False),
+    'destructively': (-0.6, 1.0, True),
+    'detailed': (0.4, 1.0, False),
+    'detailedly': (0.4, 1.0, True),
+    'devastating': (-1.0, 1.0, False),
+    'devastatingly': (-1.0, 1.0, True),
+    'developed': (0.1, 1.0, False),
+    'developedly': (0.1, 1.0, True),
+    'devoid': (-0.1, 1.0, False),
+    'dextral': (0.0, 1.0, False),
+    'dextrally': (0.0, 1.0, True),
+    'dialectal': (-0.2, 1.0, False),
+    'dialectally': (-0.2, 1.0, True),
+    'diaphanous': (-0.2, 1.0, False),
+    'diaphanously': (-0.2, 1.0, True),
+    'didactic': (-0.5, 1.0, False),
+    'didacticly': (-0.5, 1.0, True),
+    'different': (0.0, 1.0, False),
+    'differently': (0.0, 1.0, True),
+    'difficult': (-0.5, 1.0, False),
+    'difficultly': (-0.5, 1.0, True),
+    'diffident': (-0.2, 1.0, False),
+    'diffidently': (-0.2, 1.0, True),
+    'digital': (0.0, 1.0, False),
+    'digitally': (0.0, 1.0, True),
+    'dim': (0.1, 1.0, False),
+    'dim-witted': (-0.6, 1.0, False),
+    'dim-wittedly': (-0.6, 1.0, True),
+    'dimly': (0.1, 1.0, True),
+    'direct': (0.1, 1.0, False),
+    'directly': (0.1, 1.0, True),
+    'dirtily': (-0.6, 1.0, True),
+    'dirty': (-0.6, 1.0, False),
+    'disabled': (-0.2, 1.0, False),
+    'disabledly': (-0.2, 1.0, True),
+    'disappointed': (-0.75, 1.0, False),
+    'disappointedly': (-0.75, 1.0, True),
+    'disappointing': (-0.6, 1.0, False),
+    'disappointingly': (-0.6, 1.0, True),
+    'disappointment': (-0.6, 1.0, False),
+    'disastrous': (-0.7, 1.0, False),
+    'disastrously': (-0.7, 1.0, True),
+    'disbelieving': (-0.1, 1.0, False),
+    'disbelievingly': (-0.1, 1.0, True),
+    'discourteous': (-0.65, 1.0, False),
+    'discourteously': (-0.65, 1.0, True),
+    'diseased': (-0.6, 1.0, False),
+    'diseasedly': (-0.6, 1.0, True),
+    'disgusted': (-1.0, 1.0, False),
+    'disgustedly': (-1.0, 1.0, True),
+    'disgusting': (-1.0, 1.0, False),
+    'disgustingly': (-1.0, 1.0, True),
+    'dishonest': (-0.3, 1.0, False),
+    'dishonestly': (-0.3, 1.0, True),
+    'disliked': (-0.2, 1.0, False),
+    'dislikedly': (-0.2, 1.0, True),
+    'dispossessed': (-0.1, 1.0, False),
+    'dispossessedly': (-0.1, 1.0, True),
+    'distant': (-0.1, 1.0, False),
+    'distantly': (-0.1, 1.0, True),
+    'distasteful': (-0.5, 1.0, False),
+    'distastefully': (-0.5, 1.0, True),
+    'distinct': (0.3, 1.0, False),
+    'distinctly': (0.3, 1.0, True),
+    'distraught': (-0.6, 1.0, False),
+    'distraughtly': (-0.6, 1.0, True),
+    'disturbing': (-0.5, 1.0, False),
+    'disturbingly': (-0.5, 1.0, True),
+    'diurnal': (0.0, 1.0, False),
+    'diurnally': (0.0, 1.0, True),
+    'documentarily': (0.0, 1.0, True),
+    'documentary': (0.0, 1.0, False),
+    'domestic': (0.0, 1.0, False),
+    'domesticly': (0.0, 1.0, True),
+    'double': (0.0, 1.0, False),
+    'doubly': (0.0, 1.0, True),
+    'doubtful': (-0.8, 1.0, False),
+    'doubtfully': (-0.8, 1.0, True),
+    'dowdily': (-0.5, 1.0, True),
+    'dowdy': (-0.5, 1.0, False),
+    'down': (-0.1556, 1.0, False),
+    'downly': (-0.1556, 1.0, True),
+    'drag': (-0.1, 1.0, False),
+    'dramatic': (-0.4333, 1.0, False),
+    'dramaticly': (-0.4333, 1.0, True),
+    'dreadful': (-1.0, 1.0, False),
+    'dreadfully': (-1.0, 1.0, True),
+    'dried': (-0.2, 1.0, False),
+    'driedly': (-0.2, 1.0, True),
+    'drily': (-0.0667, 1.0, True),
+    'drowned': (-0.1, 1.0, False),
+    'drunk': (-0.5, 1.0, False),
+    'drunkly': (-0.5, 1.0, True),
+    'dry': (-0.0667, 1.0, False),
+    'dudsville': (-0.2, 1.0, False),
+    'due': (-0.125, 1.0, False),
+    'duely': (-0.125, 1.0, True),
+    'duh': (-0.3, 1.0, False),
+    'duhhh': (-0.5, 1.0, False),
+    'duhhhh': (-0.5, 1.0, False),
+    'dull': (-0.2917, 1.0, False),
+    'dullly': (-0.2917, 1.0, True),
+    'dulls': (-0.1, 1.0, False),
+    'dumb': (-0.375, 1.0, False),
+    'dumbly': (-0.375, 1.0, True),
+    'dustily': (-0.4, 1.0, True),
+    'dusty': (-0.4, 1.0, False),
+    'duuuh': (-0.5, 1.0, False),
+    'dynamic': (0.0, 1.0, False),
+    'dynamicly': (0.0, 1.0, True),
+    'earlier': (0.0, 1.0, False),
+    'earlierly': (0.0, 1.0, True),
+    'earlily': (0.1, 1.0, True),
+    'early': (0.1, 1.0, False),
+    'easily': (0.4333, 1.0, True),
+    'easy': (0.4333, 1.0, False),
+    'eccentric': (0.0, 1.0, False),
+    'eccentricly': (0.0, 1.0, True),
+    'ecological': (0.4, 1.0, False),
+    'ecologically': (0.4, 1.0, True),
+    'economic': (0.2, 1.0, False),
+    'economical': (0.3, 1.0, False),
+    'economically': (0.3, 1.0, True),
+    'economicly': (0.2, 1.0, True),
+    'edgily': (-0.3, 1.0, True),
+    'edgy': (-0.3, 1.0, False),
+    'educational': (0.25, 1.0, False),
+    'educationally': (0.25, 1.0, True),
+    'eerie': (-0.5, 1.0, False),
+    'eeriely': (-0.5, 1.0, True),
+    'effective': (0.6, 1.0, False),
+    'effectively': (0.6, 1.0, True),
+    'effing': (-0.5, 1.0, False),
+    'effingly': (-0.5, 1.0, True),
+    'egoistic': (-0.8, 1.0, False),
+    'egoisticly': (-0.8, 1.0, True),
+    'elaborate': (0.5, 1.0, False),
+    'elaborately': (0.5, 1.0, True),
+    'elect': (0.8, 1.0, False),
+    'electly': (0.8, 1.0, True),
+    'elegant': (0.5, 1.0, False),
+    'elegantly': (0.5, 1.0, True),
+    'elementarily': (0.3, 1.0, True),
+    'elementary': (0.3, 1.0, False),
+    'emotional': (0.0, 1.0, False),
+    'emotionally': (0.0, 1.0, True),
+    'empirical': (0.1, 1.0, False),
+    'empirically': (0.1, 1.0, True),
+    'emptily': (-0.1, 1.0, True),
+    'empty': (-0.1, 1.0, False),
+    'endearing': (0.5, 1.0, False),
+    'endearingly': (0.5, 1.0, True),
+    'endless': (-0.125, 1.0, False),
+    'endlessly': (-0.125, 1.0, True),
+    'energetic': (0.5, 1.0, False),
+    'energeticly': (0.5, 1.0, True),
+    'engaging': (0.4, 1.0, False),
+    'engagingly': (0.4, 1.0, True),
+    'english': (0.0, 1.0, False),
+    'englishly': (0.0, 1.0, True),
+    'engrossing': (0.6, 1.0, False),
+    'engrossingly': (0.6, 1.0, True),
+    'enigmatic': (0.1, 1.0, False),
+    'enigmaticly': (0.1, 1.0, True),
+    'enjoy': (0.4, 1.0, False),
+    'enjoyable': (0.5, 1.0, False),
+    'enjoyably': (0.5, 1.0, True),
+    'enjoyed': (0.5, 1.0, False),
+    'enjoying': (0.5, 1.0, False),
+    'enlightening': (0.3, 1.0, False),
+    'enlighteningly': (0.3, 1.0, True),
+    'enormous': (0.0, 1.0, False),
+    'enormously': (0.0, 1.0, True),
+    'enough': (0.0, 1.0, False),
+    'enoughly': (0.0, 1.0, True),
+    'entertaining': (0.5, 1.0, False),
+    'entertainingly': (0.5, 1.0, True),
+    'enthusiastic': (0.6, 1.0, False),
+    'enthusiasticly': (0.6, 1.0, True),
+    'entire': (0.0, 1.0, False),
+    'entirely': (0.0, 1.0, True),
+    'epic': (0.1, 1.0, False),
+    'epicly': (0.1, 1.0, True),
+    'equal': (0.0, 1.0, False),
+    'equally': (0.0, 1.0, True),
+    'erotic': (0.7, 1.0, False),
+    'eroticly': (0.7, 1.0, True),
+    'erroneous': (-0.5, 1.0, False),
+    'erroneously': (-0.5, 1.0, True),
+    'erstwhile': (0.0, 1.0, False),
+    'erstwhily': (0.0, 1.0, True),
+    'erudite': (0.1, 1.0, False),
+    'eruditely': (0.1, 1.0, True),
+    'especially': (0.0, 2.0, True),
+    'essential': (0.0, 1.0, False),
+    'essentially': (0.0, 1.0, True),
+    'ethical': (0.2, 1.0, False),
+    'ethically': (0.2, 1.0, True),
+    'european': (0.0, 1.0, False),
+    'europeanly': (0.0, 1.0, True),
+    'everydaily': (-0.2, 1.0, True),
+    'everyday': (-0.2, 1.0, False),
+    'evident': (0.25, 1.0, False),
+    'evidently': (0.25, 1.0, True),
+    'evil': (-1.0, 1.0, False),
+    'evilly': (-1.0, 1.0, True),
+    'exact': (0.25, 1.0, False),
+    'exactly': (0.25, 1.0, True),
+    'exaggerated': (-0.5, 1.0, False),
+    'exaggeratedly': (-0.5, 1.0, True),
+    'excellent': (1.0, 1.0, False),
+    'excellently': (1.0, 1.0, True),
+    'exceptional': (0.6667, 1.0, False),
+    'exceptionally': (0.6667, 1.0, True),
+    'excessive': (-0.25, 1.0, False),
+    'excessively': (-0.25, 1.0, True),
+    'excited': (0.375, 1.0, False),
+    'excitedly': (0.375, 1.0, True),
+    'exciting': (0.3, 1.0, False),
+    'excitingly': (0.3, 1.0, True),
+    'excruciatingly': (-0.1, 1.3, True),
+    'excuse': (-0.05, 1.0, False),
+    'exhausted': (-0.4, 1.0, False),
+    'exhaustedly': (-0.4, 1.0, True),
+    'exhausting': (-0.4, 1.0, False),
+    'exhaustingly': (-0.4, 1.0, True),
+    'exhilarating': (0.7, 1.0, False),
+    'exhilaratingly': (0.7, 1.0, True),
+    'exotic': (0.5, 1.0, False),
+    'exoticly': (0.5, 1.0, True),
+    'expected': (-0.1, 1.0, False),
+    'expectedly': (-0.1, 1.0, True),
+    'expensive': (-0.5, 1.0, False),
+    'expensively': (-0.5, 1.0, True),
+    'experienced': (0.8, 1.0, False),
+    'experiencedly': (0.8, 1.0, True),
+    'experimental': (0.1, 1.0, False),
+    'experimentally': (0.1, 1.0, True),
+    'exploitative': (-0.3, 1.0, False),
+    'exploitatively': (-0.3, 1.0, True),
+    'expressive': (0.8, 1.0, False),
+    'expressively': (0.8, 1.0, True),
+    'exquisite': (1.0, 1.0, False),
+    'exquisitely': (1.0, 1.0, True),
+    'extensive': (0.0, 1.0, False),
+    'extensively': (0.0, 1.0, True),
+    'external': (0.0, 1.0, False),
+    'externally': (0.0, 1.0, True),
+    'extinct': (-0.4, 1.0, False),
+    'extinctly': (-0.4, 1.0, True),
+    'extra': (0.0, 1.0, False),
+    'extraly': (0.0, 1.0, True),
+    'extraordinarily': (0.3333, 1.0, True),
+    'extraordinary': (0.3333, 1.0, False),
+    'extreme': (-0.125, 1.0, False),
+    'extremely': (-0.125, 1.0, True),
+    'exuberant': (0.05, 1.0, False),
+    'exuberantly': (0.05, 1.0, True),
+    'f*cking': (-0.6, 1.0, True),
+    'fabled': (0.7, 1.0, False),
+    'fabledly': (0.7, 1.0, True),
+    'fabricated': (0.0, 1.0, False),
+    'fabricatedly': (0.0, 1.0, True),
+    'fabulous': (0.4, 1.0, False),
+    'fabulously': (0.4, 1.0, True),
+    'facial': (0.0, 1.0, False),
+    'facially': (0.0, 1.0, True),
+    'fail': (-0.5, 1.0, False),
+    'failed': (-0.5, 1.0, False),
+    'fails': (-0.5, 1.0, False),
+    'failure': (-0.3167, 1.0, False),
+    'faint': (-0.5, 1.0, False),
+    'faintly': (-0.5, 1.0, True),
+    'fair': (0.7, 1.0, False),
+    'fairly': (0.7, 1.0, True),
+    'fake': (-0.5, 1.0, False),
+    'fakely': (-0.5, 1.0, True),
+    'false': (-0.4, 1.0, False),
+    'falsely': (-0.4, 1.0, True),
+    'familiar': (0.375, 1.0, False),
+    'familiarly': (0.375, 1.0, True),
+    'famous': (0.5, 1.0, False),
+    'famously': (0.5, 1.0, True),
+    'fanatic': (-0.3, 1.0, False),
+    'fanaticly': (-0.3, 1.0, True),
+    'fantastic': (0.4, 1.0, False),
+    'fantasticly': (0.4, 1.0, True),
+    'far': (0.1, 1.0, False),
+    'far-out': (0.4, 1.0, False),
+    'far-outly': (0.4, 1.0, True),
+    'farce': (-0.4, 1.0, False),
+    'farcical': (-0.4, 1.0, False),
+    'farcically': (-0.4, 1.0, True),
+    'farly': (0.1, 1.0, True),
+    'farthermost': (0.0, 1.0, False),
+    'farthermostly': (0.0, 1.0, True),
+    'fascinating': (0.7, 1.0, False),
+    'fascinatingly': (0.7, 1.0, True),
+    'fast': (0.2, 1.0, False),
+    'fastly': (0.2, 1.0, True),
+    'fattily': (-0.2, 1.0, True),
+    'fatty': (-0.2, 1.0, False),
+    'faultless': (1.0, 1.0, False),
+    'faultlessly': (1.0, 1.0, True),
+    'favored': (0.8, 1.0, False),
+    'favoredly': (0.8, 1.0, True),
+    'favorite': (0.5, 1.0, False),
+    'favoritely': (0.5, 1.0, True),
+    'fearful': (-0.9, 1.0, False),
+    'fearfully': (-0.9, 1.0, True),
+    'feeble': (-0.5, 1.0, False),
+    'feebly': (-0.5, 1.0, True),
+    'felicitous': (0.7, 1.0, False),
+    'felicitously': (0.7, 1.0, True),
+    'female': (0.0, 1.0, False),
+    'femaly': (0.0, 1.0, True),
+    'feverish': (-0.1, 1.0, False),
+    'feverishly': (-0.1, 1.0, True),
+    'few': (-0.2, 1.0, False),
+    'fewly': (-0.2, 1.0, True),
+    'fictional': (0.0, 1.0, False),
+    'fictionally': (0.0, 1.0, True),
+    'fiendish': (-0.6, 1.0, False),
+    'fiendishly': (-0.6, 1.0, True),
+    'fiftieth': (0.1, 1.0, False),
+    'fiftiethly': (0.1, 1.0, True),
+    'filled': (0.4, 1.0, False),
+    'filledly': (0.4, 1.0, True),
+    'filthily': (-0.8, 1.0, True),
+    'filthy': (-0.8, 1.0, False),
+    'final': (0.0, 1.0, False),
+    'finally': (0.0, 1.0, True),
+    'financial': (0.0, 1.0, False),
+    'financially': (0.0, 1.0, True),
+    'fine': (0.4167, 1.0, False),
+    'fine-looking': (0.6, 1.0, False),
+    'fine-lookingly': (0.6, 1.0, True),
+    'finely': (0.4167, 1.0, True),
+    'firm': (-0.2, 1.0, False),
+    'firmly': (-0.2, 1.0, True),
+    'first': (0.25, 1.0, False),
+    'first-string': (0.6, 1.0, False),
+    'first-stringly': (0.6, 1.0, True),
+    'firstly': (0.25, 1.0, True),
+    'fit': (0.4, 1.0, False),
+    'fitly': (0.4, 1.0, True),
+    'fitting': (0.5, 1.0, False),
+    'fittingly': (0.5, 1.0, True),
+    'fixed': (0.1, 1.0, False),
+    'fixedly': (0.1, 1.0, True),
+    'flashily': (-0.5, 1.0, True),
+    'flashy': (-0.5, 1.0, False),
+    'flat': (-0.025, 1.0, False),
+    'flatly': (-0.025, 1.0, True),
+    'flawed': (-0.5, 1.0, False),
+    'flawedly': (-0.5, 1.0, True),
+    'flawless': (1.0, 1.0, False),
+    'flawlessly': (1.0, 1.0, True),
+    'flily': (0.8, 1.0, True),
+    'flippant': (0.4, 1.0, False),
+    'flippantly': (0.4, 1.0, True),
+    'fluff': (-0.1, 1.0, False),
+    'fluffily': (-0.2, 1.0, True),
+    'fluffy': (-0.2, 1.0, False),
+    'fluid': (0.0, 1.0, False),
+    'fluidly': (0.0, 1.0, True),
+    'fly': (0.8, 1.0, False),
+    'following': (0.0, 1.0, False),
+    'followingly': (0.0, 1.0, True),
+    'forced': (-0.3, 1.0, False),
+    'forcedly': (-0.3, 1.0, True),
+    'forcible': (0.5, 1.0, False),
+    'forcibly': (0.5, 1.0, True),
+    'foreign': (-0.125, 1.0, False),
+    'foreignly': (-0.125, 1.0, True),
+    'forgetful': (-0.1, 1.0, False),
+    'forgetfully': (-0.1, 1.0, True),
+    'forgettable': (-0.5, 1.0, False),
+    'forgettably': (-0.5, 1.0, True),
+    'former': (0.0, 1.0, False),
+    'formerly': (0.0, 1.0, True),
+    'formulaic': (0.0, 1.0, False),
+    'formulaicly': (0.0, 1.0, True),
+    'fortunate': (0.4, 1.0, False),
+    'fortunately': (0.4, 1.0, True),
+    'fourth': (0.0, 1.0, False),
+    'fourthly': (0.0, 1.0, True),
+    'fragile': (0.0, 1.0, False),
+    'fragily': (0.0, 1.0, True),
+    'free': (0.4, 1.0, False),
+    'free-thinking': (0.0, 1.0, False),
+    'free-thinkingly': (0.0, 1.0, True),
+    'freely': (0.4, 1.0, True),
+    'freestanding': (0.0, 1.0, False),
+    'freestandingly': (0.0, 1.0, True),
+    'french': (0.0, 1.0, False),
+    'frenchly': (0.0, 1.0, True),
+    'frequent': (0.1, 1.0, False),
+    'frequently': (0.1, 1.0, True),
+    'fresh': (0.3, 1.0, False),
+    'freshly': (0.3, 1.0, True),
+    'friendlily': (0.375, 1.0, True),
+    'friendly': (0.375, 1.0, False),
+    'frightening': (-0.5, 1.0, False),
+    'frighteningly': (-0.5, 1.0, True),
+    'frigid': (-0.9, 1.0, False),
+    'frigidly': (-0.9, 1.0, True),
+    'fringily': (0.3, 1.0, True),
+    'fringy': (0.3, 1.0, False),
+    'frostbitten': (-0.5, 1.0, False),
+    'frostbittenly': (-0.5, 1.0, True),
+    'frustrated': (-0.7, 1.0, False),
+    'frustratedly': (-0.7, 1.0, True),
+    'frustrating': (-0.4, 1.0, False),
+    'frustratingly': (-0.4, 1.0, True),
+    'fuck': (-0.4, 1.0, False),
+    'fucked': (-0.6, 1.0, False),
+    'fuckedly': (-0.6, 1.0, True),
+    'fucking': (-0.6, 1.0, True),
+    'full': (0.35, 1.0, False),
+    'full-bodied': (-0.1, 1.0, False),
+    'full-bodiedly': (-0.1, 1.0, True),
+    'full-fledged': (0.6, 1.0, False),
+    'full-fledgedly': (0.6, 1.0, True),
+    'full-length': (0.0333, 1.0, False),
+    'full-lengthly': (0.0333, 1.0, True),
+    'fullly': (0.35, 1.0, True),
+    'fun': (0.3, 1.0, False),
+    'funnily': (0.25, 1.0, True),
+    'funny': (0.25, 1.0, False),
+    'further': (0.0, 1.0, False),
+    'furtherly': (0.0, 1.0, True),
+    'furtive': (-0.1, 1.0, False),
+    'furtively': (-0.1, 1.0, True),
+    'future': (0.0, 1.0, False),
+    'futurely': (0.0, 1.0, True),
+    'gaily': (0.4167, 1.0, True),
+    'game': (-0.4, 1.0, False),
+    'gamechanger': (0.3, 1.0, False),
+    'gamely': (-0.4, 1.0, True),
+    'gargantuan': (-0.05, 1.0, False),
+    'gargantuanly': (-0.05, 1.0, True),
+    'gawkily': (-0.55, 1.0, True),
+    'gawky': (-0.55, 1.0, False),
+    'gay': (0.4167, 1.0, False),
+    'general': (0.05, 1.0, False),
+    'generally': (0.05, 1.0, True),
+    'generic': (0.0, 1.0, False),
+    'genericly': (0.0, 1.0, True),
+    'gentle': (0.2, 1.0, False),
+    'gently': (0.2, 1.0, True),
+    'genuine': (0.4, 1.0, False),
+    'genuinely': (0.4, 1.0, True),
+    'german': (0.0, 1.0, False),
+    'germanly': (0.0, 1.0, True),
+    'gettable': (0.1, 1.0, False),
+    'gettably': (0.1, 1.0, True),
+    'giant': (0.0, 1.0, False),
+    'giantly': (0.0, 1.0, True),
+    'gifted': (0.5, 1.0, False),
+    'giftedly': (0.5, 1.0, True),
+    'gimmickily': (-0.2, 1.0, True),
+    'gimmicky': (-0.2, 1.0, False),
+    'glad': (0.5, 1.0, False),
+    'gladly': (0.5, 1.0, True),
+    'global': (0.0, 1.0, False),
+    'globally': (0.0, 1.0, True),
+    'gloom': (-0.1333, 1.0, False),
+    'glueily': (-0.4, 1.0, True),
+    'gluey': (-0.4, 1.0, False),
+    'godforsaken': (-0.4, 1.0, False),
+    'godforsakenly': (-0.4, 1.0, True),
+    'golden': (0.3, 1.0, False),
+    'goldenly': (0.3, 1.0, True),
+    'good': (0.7, 1.0, False),
+    'goodly': (0.7, 1.0, True),
+    'goody-goodily': (-0.5, 1.0, True),
+    'goody-goody': (-0.5, 1.0, False),
+    'goofily': (0.5, 1.0, True),
+    'goofy': (0.5, 1.0, False),
+    'gorgeous': (0.7, 1.0, False),
+    'gorgeously': (0.7, 1.0, True),
+    'gorily': (-0.5, 1.0, True),
+    'gory': (-0.5, 1.0, False),
+    'grand': (0.5, 1.0, False),
+    'grandiloquent': (-0.6, 1.0, False),
+    'grandiloquently': (-0.6, 1.0, True),
+    'grandly': (0.5, 1.0, True),
+    'graphic': (0.0, 1.0, False),
+    'graphicly': (0.0, 1.0, True),
+    'gratuitous': (-0.5, 1.0, False),
+    'gratuitously': (-0.5, 1.0, True),
+    'great': (0.8, 1.0, False),
+    'greater': (0.5, 1.0, False),
+    'greaterly': (0.5, 1.0, True),
+    'greatest': (1.0, 1.0, False),
+    'greatestly': (1.0, 1.0, True),
+    'greatly': (0.8, 1.0, True),
+    'greek': (0.0, 1.0, False),
+    'greekly': (0.0, 1.0, True),
+    'green': (-0.2, 1.0, False),
+    'greenly': (-0.2, 1.0, True),
+    'greily': (-0.05, 1.0, True),
+    'grey': (-0.05, 1.0, False),
+    'grief': (-0.8, 1.0, False),
+    'grievous': (-0.8, 1.0, False),
+    'grievously': (-0.8, 1.0, True),
+    'grim': (-1.0, 1.0, False),
+    'grimly': (-1.0, 1.0, True),
+    'gripping': (0.5, 1.0, False),
+    'grippingly': (0.5, 1.0, True),
+    'grittily': (0.0, 1.0, True),
+    'gritty': (0.0, 1.0, False),
+    'gross': (0.0, 1.0, False),
+    'grossly': (0.0, 1.0, True),
+    'grotesque': (-0.55, 1.0, False),
+    'grotesquely': (-0.55, 1.0, True),
+    'grr': (-0.7, 1.0, False),
+    'grrr': (-0.7, 1.0, False),
+    'grrrr': (-0.7, 1.0, False),
+    'grudging': (-0.6, 1.0, False),
+    'grudgingly': (-0.6, 1.0, True),
+    'gruesome': (-1.0, 1.0, False),
+    'gruesomely': (-1.0, 1.0, True),
+    'guarded': (0.4, 1.0, False),
+    'guardedly': (0.4, 1.0, True),
+    'guiltily': (-0.5, 1.0, True),
+    'guilty': (-0.5, 1.0, False),
+    'haha': (0.2, 1.0, False),
+    'hahaha': (0.2, 1.0, False),
+    'hahahaha': (0.2, 1.0, False),
+    'hahahahaha': (0.2, 1.0, False),
+    'half': (-0.1667, 1.0, False),
+    'halfly': (-0.1667, 1.0, True),
+    'hand-held': (0.0, 1.0, False),
+    'hand-heldly': (0.0, 1.0, True),
+    'handily': (0.6, 1.0, True),
+    'handsome': (0.5, 1.0, False),
+    'handsomely': (0.5, 1.0, True),
+    'handy': (0.6, 1.0, False),
+    'haphazard': (-0.6, 1.0, False),
+    'haphazardly': (-0.6, 1.0, True),
+    'hapless': (-0.6, 1.0, False),
+    'haplessly': (-0.6, 1.0, True),
+    'happily': (0.8, 1.0, True),
+    'happiness': (0.7, 1.0, False),
+    'happy': (0.8, 1.0, False),
+    'hard': (-0.2917, 1.0, False),
+    'harder': (-0.1, 1.0, False),
+    'harderly': (-0.1, 1.0, True),
+    'hardly': (-0.2917, 1.0, True),
+    'harsh': (-0.2, 1.0, False),
+    'harshly': (-0.2, 1.0, True),
+    'hate': (-0.8, 1.0, False),
+    'hated': (-0.9, 1.0, False),
+    'hazardous': (0.6, 1.0, False),
+    'hazardously': (0.6, 1.0, True),
+    'healthily': (0.5, 1.0, True),
+    'healthy': (0.5, 1.0, False),
+    'heartfelt': (0.0, 1.0, False),
+    'heartfeltly': (0.0, 1.0, True),
+    'heavily': (-0.2, 1.0, True),
+    'heavy': (-0.2, 1.0, False),
+    'heroic': (0.7, 1.0, False),
+    'heroicly': (0.7, 1.0, True),
+    'hidden': (-0.1667, 1.0, False),
+    'hiddenly': (-0.1667, 1.0, True),
+    'high': (0.16, 1.0, False),
+    'higher': (0.25, 1.0, False),
+    'higherly': (0.25, 1.0, True),
+    'highly': (0.16, 1.0, True),
+    'hilarious': (0.5, 1.0, False),
+    'hilariously': (0.5, 1.0, True),
+    'hindered': (-0.2, 1.0, False),
+    'historic': (0.0, 1.0, False),
+    'historical': (0.0, 1.0, False),
+    'historically': (0.0, 1.0, True),
+    'historicly': (0.0, 1.0, True),
+    'hit-and-miss': (-0.2, 1.0, False),
+    'hollow': (-0.1, 1.0, False),
+    'hollowly': (-0.2, 1.0, True),
+    'honest': (0.6, 1.0, False),
+    'honest-to-god': (-0.5, 1.0, False),
+    'honest-to-godly': (-0.5, 1.0, True),
+    'honestly': (0.6, 1.0, True),
+    'horrible': (-1.0, 1.0, False),
+    'horribly': (-1.0, 1.0, True),
+    'horrific': (-1.0, 1.0, False),
+    'horrificly': (-1.0, 1.0, True),
+    'horrifying': (-0.9, 1.0, False),
+    'horrifyingly': (-0.9, 1.0, True),
+    'hot': (0.25, 1.0, False),
+    'hotly': (0.25, 1.0, True),
+    'huge': (0.4, 1.0, False),
+    'hugely': (0.4, 1.0, True),
+    'human': (0.0, 1.0, False),
+    'humanly': (0.0, 1.0, True),
+    'humble': (-0.2, 1.0, False),
+    'humbly': (-0.2, 1.0, True),
+    'humorous': (0.5, 1.0, False),
+    'humorously': (0.5, 1.0, True),
+    'hysterical': (-1.0, 1.0, False),
+    'hysterically': (-1.0, 1.0, True),
+    'icily': (-0.1, 1.0, True),
+    'ickily': (-0.3, 1.0, True),
+    'icky': (-0.3, 1.0, False),
+    'iconic': (0.5, 1.0, False),
+    'iconicly': (0.5, 1.0, True),
+    'icy': (-0.1, 1.0, False),
+    'ideal': (0.9, 1.0, False),
+    'ideally': (0.9, 1.0, True),
+    'identifiable': (0.1, 1.0, False),
+    'identifiably': (0.1, 1.0, True),
+    'idiocy': (-0.3, 1.0, False),
+    'idiot': (-0.8, 1.0, False),
+    'idiotic': (-0.6667, 1.0, False),
+    'idioticly': (-0.6667, 1.0, True),
+    'idiots': (-0.8, 1.0, False),
+    'ill': (-0.5, 1.0, False),
+    'illegal': (-0.5, 1.0, False),
+    'illegally': (-0.5, 1.0, True),
+    'illly': (-0.5, 1.0, True),
+    'imaginative': (0.6, 1.0, False),
+    'imaginatively': (0.6, 1.0, True),
+    'imbecile': (-0.8, 1.0, False),
+    'imitation': (-0.1333, 1.0, False),
+    'immanent': (-0.1, 1.0, False),
+    'immanently': (-0.1, 1.0, True),
+    'immense': (0.0, 1.0, False),
+    'immensely': (0.0, 1.0, True),
+    'impassive': (-0.4, 1.0, False),
+    'impassively': (-0.4, 1.0, True),
+    'impatient': (-0.2, 1.0, False),
+    'impatiently': (-0.2, 1.0, True),
+    'impeccable': (0.75, 1.0, False),
+    'impeccably': (0.75, 1.0, True),
+    'imperceptible': (-0.2, 1.0, False),
+    'imperceptibly': (-0.2, 1.0, True),
+    'implicated': (-0.4, 1.0, False),
+    'implicatedly': (-0.4, 1.0, True),
+    'important': (0.4, 1.0, False),
+    'importantly': (0.4, 1.0, True),
+    'impossible': (-0.6667, 1.0, False),
+    'impossibly': (-0.6667, 1.0, True),
+    'impressed': (1.0, 1.0, False),
+    'impressedly': (1.0, 1.0, True),
+    'impressive': (1.0, 1.0, False),
+    'impressively': (1.0, 1.0, True),
+    'inapposite': (-0.8, 1.0, False),
+    'inappositely': (-0.8, 1.0, True),
+    'inarticulate': (-0.1, 1.0, False),
+    'inarticulately': (-0.1, 1.0, True),
+    'inauspicious': (-0.5, 1.0, False),
+    'inauspiciously': (-0.5, 1.0, True),
+    'incalculable': (0.0, 1.0, False),
+    'incalculably': (0.0, 1.0, True),
+    'incoherent': (-0.2, 1.0, False),
+    'incoherently': (-0.2, 1.0, True),
+    'incomparable': (0.4, 1.0, False),
+    'incomparably': (0.4, 1.0, True),
+    'incompetent': (-0.35, 1.0, False),
+    'incompetently': (-0.4, 1.0, True),
+    'inconsistencies': (-0.1, 1.0, False),
+    'inconvenient': (-0.6, 1.0, False),
+    'inconveniently': (-0.6, 1.0, True),
+    'incorruptible': (0.5, 1.0, False),
+    'incorruptibly': (0.5, 1.0, True),
+    'incredible': (0.9, 1.0, False),
+    'incredibly': (0.9, 1.0, True),
+    'incurable': (-0.5, 1.0, False),
+    'incurably': (-0.5, 1.0, True),
+    'indecipherable': (-0.55, 1.0, False),
+    'indecipherably': (-0.55, 1.0, True),
+    'independent': (0.0, 1.0, False),
+    'independently': (0.0, 1.0, True),
+    'indie': (0.0, 1.0, False),
+    'indiely': (0.0, 1.0, True),
+    'indispensable': (0.4, 1.0, False),
+    'indispensably': (0.4, 1.0, True),
+    'individual': (0.0, 1.0, False),
+    'individually': (0.0, 1.0, True),
+    'indomitable': (0.0, 1.0, False),
+    'indomitably': (0.0, 1.0, True),
+    'ineluctable': (-0.1, 1.0, False),
+    'ineluctably': (-0.1, 1.0, True),
+    'inevitable': (0.0, 1.0, False),
+    'inevitably': (0.0, 1.0, True),
+    'inexpedient': (-0.5, 1.0, False),
+    'inexpediently': (-0.5, 1.0, True),
+    'inexperienced': (-0.1, 1.0, False),
+    'inexperiencedly': (-0.1, 1.0, True),
+    'inexplicable': (-0.6, 1.0, False),
+    'inexplicably': (-0.6, 1.0, True),
+    'inexpressible': (0.05, 1.0, False),
+    'inexpressibly': (0.05, 1.0, True),
+    'infamous': (-0.5, 1.0, False),
+    'infamously': (-0.5, 1.0, True),
+    'infantile': (-0.4, 1.0, False),
+    'infantily': (-0.4, 1.0, True),
+    'infatuated': (-0.2, 1.0, False),
+    'inflexible': (-0.4, 1.0, False),
+    'inflexibly': (-0.4, 1.0, True),
+    'infuriating': (-0.6, 1.0, False),
+    'ingenious': (0.5, 1.0, False),
+    'ingeniously': (0.5, 1.0, True),
+    'inhumane': (-0.9, 1.0, False),
+    'inhumanely': (-0.9, 1.0, True),
+    'initial': (0.0, 1.0, False),
+    'initially': (0.0, 1.0, True),
+    'inner': (0.0, 1.0, False),
+    'innerly': (0.0, 1.0, True),
+    'innocent': (0.5, 1.0, False),
+    'innocently': (0.5, 1.0, True),
+    'innovative': (0.5, 1.0, False),
+    'innovatively': (0.5, 1.0, True),
+    'insane': (-1.0, 1.0, False),
+    'insanely': (-1.0, 1.0, True),
+    'insecure': (-0.5, 1.0, False),
+    'insecurely': (-0.5, 1.0, True),
+    'inspirational': (0.5, 1.0, False),
+    'inspirationally': (0.5, 1.0, True),
+    'inspiring': (0.5, 1.0, False),
+    'inspiringly': (0.5, 1.0, True),
+    'instant': (0.0, 1.0, False),
+    'instantly': (0.0, 1.0, True),
+    'insulting': (-1.0, 1.0, False),
+    'insultingly': (-1.0, 1.0, True),
+    'intellectual': (0.3, 1.0, False),
+    'intellectually': (0.3, 1.0, True),
+    'intelligent': (0.8, 1.0, False),
+    'intelligently': (0.8, 1.0, True),
+    'intelligentsia': (-0.1, 1.0, False),
+    'intense': (0.2, 1.0, False),
+    'intensely': (0.2, 1.0, True),
+    'interested': (0.25, 1.0, False),
+    'interestedly': (0.25, 1.0, True),
+    'interesting': (0.5, 1.0, False),
+    'interestingly': (0.5, 1.0, True),
+    'internal': (0.0, 1.0, False),
+    'internally': (0.0, 1.0, True),
+    'international': (0.0, 1.0, False),
+    'internationally': (0.0, 1.0, True),
+    'intimate': (0.2, 1.0, False),
+    'intimately': (0.2, 1.0, True),
+    'intriguing': (0.3, 1.0, False),
+    'intriguingly': (0.3, 1.0, True),
+    'inventive': (0.5, 1.0, False),
+    'inventively': (0.5, 1.0, True),
+    'irish': (0.0, 1.0, False),
+    'irishly': (0.0, 1.0, True),
+    'ironic': (0.2, 1.0, False),
+    'ironicly': (0.2, 1.0, True),
+    'irrelevant': (-0.5, 1.0, False),
+    'irrelevantly': (-0.5, 1.0, True),
+    'irritating': (-0.4, 1.0, False),
+    'irritatingly': (-0.4, 1.0, True),
+    "isn't": (-0.2, 1.0, False),
+    'italian': (0.0, 1.0, False),
+    'italianly': (0.0, 1.0, True),
+    'jackass': (-0.5, 1.0, False),
+    'jackasses': (-0.5, 1.0, False),
+    'jail': (-0.1, 1.0, False),
+    'jammed': (-0.1, 1.0, False),
+    'jammedly': (-0.1, 1.0, True),
+    'japanese': (0.0, 1.0, False),
+    'japanesely': (0.0, 1.0, True),
+    'jewish': (0.0, 1.0, False),
+    'jewishly': (0.0, 1.0, True),
+    'joy': (0.8, 1.0, False),
+    'justified': (0.4, 1.0, False),
+    'justifiedly': (0.4, 1.0, True),
+    'juvenile': (-0.25, 1.0, False),
+    'juvenily': (-0.25, 1.0, True),
+    'keily': (0.0, 1.0, True),
+    'key': (0.0, 1.0, False),
+    'killed': (-0.2, 1.0, False),
+    'kind': (0.6, 1.0, False),
+    'kindly': (0.6, 1.0, True),
+    'lame': (-0.5, 1.0, False),
+    'lamely': (-0.5, 1.0, True),
+    'large': (0.2143, 1.0, False),
+    'largely': (0.2143, 1.0, True),
+    'larger': (0.0, 1.0, False),
+    'largerly': (0.0, 1.0, True),
+    'last': (0.0, 1.0, False),
+    'lasting': (0.0, 1.0, False),
+    'lastingly': (0.0, 1.0, True),
+    'lastly': (0.0, 1.0, True),
+    'late': (-0.3, 1.0, False),
+    'lately': (-0.3, 1.0, True),
+    'later': (0.0, 1.0, False),
+    'laterly': (0.0, 1.0, True),
+    'latest': (0.5, 1.0, False),
+    'latestly': (0.5, 1.0, True),
+    'latter': (0.0, 1.0, False),
+    'latterly': (0.0, 1.0, True),
+    'laugh': (0.3, 1.0, False),
+    'laughable': (-0.5, 1.0, False),
+    'laughably': (-0.5, 1.0, True),
+    'laughed': (0.7, 1.0, False),
+    'lawful': (0.0, 1.0, False),
+    'lawfully': (0.0, 1.0, True),
+    'lazily': (-0.25, 1.0, True),
+    'lazy': (-0.25, 1.0, False),
+    'leaden': (-0.2, 1.0, False),
+    'leadenly': (-0.2, 1.0, True),
+    'least': (-0.3, 1.0, False),
+    'leastly': (-0.3, 1.0, True),
+    'left': (0.0, 1.0, False),
+    'leftist': (-0.05, 1.0, False),
+    'leftistly': (-0.05, 1.0, True),
+    'leftly': (0.0, 1.0, True),
+    'legal': (0.2, 1.0, False),
+    'legally': (0.2, 1.0, True),
+    'legendarily': (1.0, 1.0, True),
+    'legendary': (1.0, 1.0, False),
+    'legible': (0.2, 1.0, False),
+    'legibly': (0.2, 1.0, True),
+    'lenient': (0.5, 1.0, False),
+    'leniently': (0.5, 1.0, True),
+    'less': (-0.1667, 1.0, False),
+    'lesser': (0.0, 1.0, False),
+    'lesserly': (0.0, 1.0, True),
+    'lessly': (-0.1667, 1.0, True),
+    'liable': (-0.1, 1.0, False),
+    'liably': (-0.1, 1.0, True),
+    'licentious': (0.4, 1.0, False),
+    'licentiously': (0.4, 1.0, True),
+    'lifelike': (0.3, 1.0, False),
+    'lifelikely': (0.3, 1.0, True),
+    'lifelong': (-0.1, 1.0, False),
+    'lifelongly': (-0.1, 1.0, True),
+    'light': (0.4, 1.0, False),
+    'light-hearted': (0.5, 1.0, False),
+    'light-heartedly': (0.5, 1.0, True),
+    'lightly': (0.4, 1.0, True),
+    'likable': (0.5, 1.0, False),
+    'likably': (0.5, 1.0, True),
+    'liked': (0.6, 1.0, False),
+    'likedly': (0.6, 1.0, True),
+    'likelily': (0.0, 1.0, True),
+    'likely': (0.0, 1.0, False),
+    'limited': (-0.0714, 1.0, False),
+    'limitedly': (-0.0714, 1.0, True),
+    'limp': (-0.2, 1.0, False),
+    'limply': (-0.2, 1.0, True),
+    'linguistic': (0.1, 1.0, False),
+    'linguisticly': (0.1, 1.0, True),
+    'literarily': (0.1, 1.0, True),
+    'literary': (0.1, 1.0, False),
+    'little': (-0.1875, 1.0, False),
+    'littly': (-0.1875, 1.0, True),
+    'live': (0.1364, 1.0, False),
+    'livelily': (0.6667, 1.0, True),
+    'lively': (0.1364, 1.0, True),
+    'lmao': (0.6, 1.0, False),
+    'local': (0.0, 1.0, False),
+    'locally': (0.0, 1.0, True),
+    'logical': (0.25, 1.0, False),
+    'logically': (0.25, 1.0, True),
+    'lol': (0.8, 1.0, False),
+    'lolol': (0.8, 1.0, False),
+    'lonelily': (-0.1, 1.0, True),
+    'lonely': (-0.1, 1.0, False),
+    'long': (-0.05, 1.0, False),
+    'long-winded': (-0.2, 1.0, False),
+    'long-windedly': (-0.2, 1.0, True),
+    'longly': (-0.05, 1.0, True),
+    'loose': (-0.0769, 1.0, False),
+    'loosely': (-0.0769, 1.0, True),
+    'losers': (-0.2, 1.0, False),
+    'loses': (-0.3, 1.0, False),
+    'loud': (0.1, 1.0, False),
+    'loudly': (0.1, 1.0, True),
+    'lousily': (-0.5, 1.0, True),
+    'lousy': (-0.5, 1.0, False),
+    'lovable': (0.5, 1.0, False),
+    'lovably': (0.5, 1.0, True),
+    'love': (0.5, 1.0, False),
+    'loved': (0.7, 1.0, False),
+    'lovedly': (0.7, 1.0, True),
+    'lovelily': (0.5, 1.0, True),
+    'lovely': (0.5, 1.0, False),
+    'loving': (0.6, 1.0, False),
+    'lovingly': (0.6, 1.0, True),
+    'low': (0.0, 1.0, False),
+    'lowly': (0.0, 1.0, True),
+    'loyal': (0.3333, 1.0, False),
+    'loyally': (0.3333, 1.0, True),
+    'luckily': (0.3333, 1.0, True),
+    'lucky': (0.3333, 1.0, False),
+    'lush': (0.1, 1.0, False),
+    'lushly': (0.1, 1.0, True),
+    'lyric': (0.25, 1.0, False),
+    'lyricly': (0.25, 1.0, True),
+    'mad': (-0.625, 1.0, False),
+    'madly': (-0.625, 1.0, True),
+    'magic': (0.5, 1.0, False),
+    'magical': (0.5, 1.0, False),
+    'magically': (0.5, 1.0, True),
+    'magicly': (0.5, 1.0, True),
+    'magnificent': (1.0, 1.0, False),
+    'magnificently': (1.0, 1.0, True),
+    'main': (0.1667, 1.0, False),
+    'mainly': (0.1667, 1.0, True),
+    'major': (0.0625, 1.0, False),
+    'majorly': (0.0625, 1.0, True),
+    'maladroit': (-0.4667, 1.0, False),
+    'maladroitly': (-0.4667, 1.0, True),
+    'male': (0.0, 1.0, False),
+    'malevolent': (-0.8, 1.0, False),
+    'malevolently': (-0.8, 1.0, True),
+    'maly': (0.0, 1.0, True),
+    'manily': (0.5, 1.0, True),
+    'mannerlily': (0.5, 1.0, True),
+    'mannerly': (0.5, 1.0, False),
+    'manorial': (0.0, 1.0, False),
+    'manorially': (0.0, 1.0, True),
+    'manque': (0.1, 1.0, False),
+    'manquely': (0.1, 1.0, True),
+    'many': (0.5, 1.0, False),
+    'many-sided': (0.0, 1.0, False),
+    'many-sidedly': (0.0, 1.0, True),
+    'marked': (0.1, 1.0, False),
+    'markedly': (0.1, 1.0, True),
+    'married': (0.25, 1.0, False),
+    'marriedly': (0.25, 1.0, True),
+    'martial': (0.0, 1.0, False),
+    'martially': (0.0, 1.0, True),
+    'marvelous': (1.0, 1.0, False),
+    'marvelously': (1.0, 1.0, True),
+    'masculine': (0.1, 1.0, False),
+    'masculinely': (0.1, 1.0, True),
+    'massive': (0.0, 1.0, False),
+    'massively': (0.0, 1.0, True),
+    'masterful': (1.0, 1.0, False),
+    'masterfully': (1.0, 1.0, True),
+    'mathematical': (0.0, 1.0, False),
+    'mathematically': (0.0, 1.0, True),
+    'mature': (0.1, 1.0, False),
+    'maturely': (0.1, 1.0, True),
+    'meager': (-0.6, 1.0, False),
+    'meagerly': (-0.6, 1.0, True),
+    'mean': (-0.3125, 1.0, False),
+    'meaningful': (0.5, 1.0, False),
+    'meaningfully': (0.5, 1.0, True),
+    'meaningless': (-0.5, 1.0, False),
+    'meaninglessly': (-0.5, 1.0, True),
+    'meanly': (-0.3125, 1.0, True),
+    'measlily': (-0.5667, 1.0, True),
+    'measly': (-0.5667, 1.0, False),
+    'medical': (0.0, 1.0, False),
+    'medically': (0.0, 1.0, True),
+    'medicative': (0.1, 1.0, False),
+    'medicatively': (0.1, 1.0, True),
+    'medieval': (0.0, 1.0, False),
+    'medievally': (0.0, 1.0, True),
+    'mediocre': (-0.5, 1.0, False),
+    'mediocrely': (-0.5, 1.0, True),
+    'mediocrity': (-0.2, 1.0, False),
+    'melodrama': (-0.3, 1.0, False),
+    'memorable': (0.5, 1.0, False),
+    'memorably': (0.5, 1.0, True),
+    'menacing': (-1.0, 1.0, False),
+    'menacingly': (-1.0, 1.0, True),
+    'mental': (-0.1, 1.0, False),
+    'mentally': (-0.1, 1.0, True),
+    'merciless': (-0.7, 1.0, False),
+    'mercilessly': (-0.7, 1.0, True),
+    'mere': (-0.5, 1.0, False),
+    'merely': (-0.5, 1.0, True),
+    'mesmerizing': (0.3, 1.0, False),
+    'mess': (-0.175, 1.0, False),
+    'messily': (-0.2, 1.0, True),
+    'messy': (-0.2, 1.0, False),
+    'metaphorical': (0.0, 1.0, False),
+    'metaphorically': (0.0, 1.0, True),
+    'mexican': (0.0, 1.0, False),
+    'mexicanly': (0.0, 1.0, True),
+    'mid': (0.0, 1.0, False),
+    'middle': (0.0, 1.0, False),
+    'middly': (0.0, 1.0, True),
+    'midly': (0.0, 1.0, True),
+    'mightily': (0.4, 1.0, True),
+    'mighty': (0.4, 1.0, False),
+    'mild': (0.3333, 1.0, False),
+    'mildly': (0.3333, 1.0, True),
+    'militarily': (-0.1, 1.0, True),
+    'military': (-0.1, 1.0, False),
+    'mind-boggling': (0.5, 1.0, False),
+    'mind-bogglingly': (0.5, 1.0, True),
+    'mindless': (-0.2, 1.0, False),
+    'mindlessly': (-0.2, 1.0, True),
+    'minimal': (-0.1, 1.0, False),
+    'minimally': (-0.1, 1.0, True),
+    'minor': (-0.05, 1.0, False),
+    'minorly': (-0.05, 1.0, True),
+    'minus': (-0.1, 1.0, False),
+    'minusly': (-0.1, 1.0, True),
+    'miserable': (-1.0, 1.0, False),
+    'miserably': (-1.0, 1.0, True),
+    'misfire': (-0.2, 1.0, False),
+    'misplaced': (-0.2, 1.0, False),
+    'misplacedly': (-0.2, 1.0, True),
+    'missing': (-0.2, 1.0, False),
+    'missingly': (-0.2, 1.0, True),
+    'mixed': (0.0, 1.0, False),
+    'mixedly': (0.0, 1.0, True),
+    'mod': (0.2, 1.0, False),
+    'moderate': (0.0, 1.0, False),
+    'moderately': (0.0, 1.0, True),
+    'modern': (0.2, 1.0, False),
+    'modernly': (0.2, 1.0, True),
+    'modest': (0.1, 1.0, False),
+    'modestly': (0.1, 1.0, True),
+    'modly': (0.2, 1.0, True),
+    'monkey': (-0.05, 1.0, False),
+    'monosyllabic': (-0.1, 1.0, False),
+    'monosyllabicly': (-0.1, 1.0, True),
+    'moral': (0.0, 1.0, False),
+    'moralizing': (-0.3, 1.0, False),
+    'morally': (0.0, 1.0, True),
+    'more': (0.5, 1.0, False),
+    'morely': (0.5, 1.0, True),
+    'moron': (-0.8, 1.0, False),
+    'morons': (-0.8, 1.0, False),
+    'most': (0.5, 1.0, False),
+    'mostly': (0.5, 1.0, True),
+    'motleily': (0.6, 1.0, True),
+    'motley': (0.6, 1.0, False),
+    'mouth-watering': (0.7, 1.0, False),
+    'mouth-wateringly': (0.7, 1.0, True),
+    'much': (0.2, 1.0, True),
+    'muggily': (-0.6, 1.0, True),
+    'muggy': (-0.6, 1.0, False),
+    'multilateral': (0.1, 1.0, False),
+    'multilaterally': (0.1, 1.0, True),
+    'multiple': (0.0, 1.0, False),
+    'multiply': (0.0, 1.0, True),
+    'mundane': (-0.1667, 1.0, False),
+    'mundanely': (-0.1667, 1.0, True),
+    'musical': (0.0, 1.0, False),
+    'musically': (0.0, 1.0, True),
+    'muzak': (-0.05, 1.0, False),
+    'mysterious': (0.0, 1.0, False),
+    'mysteriously': (0.0, 1.0, True),
+    'naive': (-0.3, 1.0, False),
+    'naively': (-0.3, 1.0, True),
+    'naked': (0.0, 1.0, False),
+    'nakedly': (0.0, 1.0, True),
+    'nameless': (-0.5, 1.0, False),
+    'namelessly': (-0.5, 1.0, True),
+    'narrow': (-0.2, 1.0, False),
+    'narrowly': (-0.2, 1.0, True),
+    'nastily': (-1.0, 1.0, True),
+    'nasty': (-1.0, 1.0, False),
+    'natural': (0.1, 1.0, False),
+    'naturalistic': (0.4, 1.0, False),
+    'naturalisticly': (0.4, 1.0, True),
+    'naturally': (0.1, 1.0, True),
+    'naughtily': (-0.15, 1.0, True),
+    'naughty': (-0.15, 1.0, False),
+    'nauseated': (-0.4, 1.0, False),
+    'nauseatedly': (-0.4, 1.0, True),
+    'near': (0.1, 1.0, False),
+    'nearly': (0.1, 1.0, True),
+    'necessarily': (0.0, 1.0, True),
+    'necessary': (0.0, 1.0, False),
+    'needless': (-0.5, 1.0, False),
+    'needlessly': (-0.5, 1.0, True),
+    'negative': (-0.3, 1.0, False),
+    'negatively': (-0.3, 1.0, True),
+    'nerve-racking': (-0.4, 1.0, False),
+    'nerve-rackingly': (-0.4, 1.0, True),
+    'net': (0.0, 1.0, False),
+    'netly': (0.0, 1.0, True),
+    'new': (0.1364, 1.0, False),
+    'newly': (0.1364, 1.0, True),
+    'next': (0.0, 1.0, False),
+    'nextly': (0.0, 1.0, True),
+    'nice': (0.6, 1.0, False),
+    'nicely': (0.6, 1.0, True),
+    'noble': (0.6, 1.0, False),
+    'nobly': (0.6, 1.0, True),
+    'nonviolent': (0.4, 1.0, False),
+    'nonviolently': (0.4, 1.0, True),
+    'normal': (0.15, 1.0, False),
+    'normally': (0.15, 1.0, True),
+    'norwegian': (0.0, 1.0, False),
+    'norwegianly': (0.0, 1.0, True),
+    'nostalgic': (-0.5, 1.0, False),
+    'nostalgicly': (-0.5, 1.0, True),
+    'notable': (0.5, 1.0, False),
+    'notably': (0.5, 1.0, True),
+    'numb': (-0.6, 1.0, False),
+    'numbly': (-0.6, 1.0, True),
+    'numerous': (0.0, 1.0, False),
+    'numerously': (0.0, 1.0, True),
+    'obedient': (0.4, 1.0, False),
+    'obediently': (0.4, 1.0, True),
+    'objective': (0.0, 1.0, False),
+    'objectively': (0.0, 1.0, True),
+    'obsessed': (-0.5, 1.0, False),
+    'obsessedly': (-0.5, 1.0, True),
+    'obstacles': (-0.05, 1.0, False),
+    'obvious': (0.0, 1.0, False),
+    'obviously': (0.0, 1.0, True),
+    'occasional': (0.0, 1.0, False),
+    'occasionally': (0.0, 1.0, True),
+    'odd': (-0.1667, 1.0, False),
+    'oddly': (-0.1667, 1.0, True),
+    'offbeat': (-0.5, 1.0, False),
+    'offbeatly': (-0.5, 1.0, True),
+    'offers': (0.1, 1.0, False),
+    'ok': (0.5, 1.0, False),
+    'okaily': (0.5, 1.0, True),
+    'okay': (0.5, 1.0, False),
+    'okly': (0.5, 1.0, True),
+    'old': (0.1, 1.0, False),
+    'older': (0.1667, 1.0, False),
+    'olderly': (0.1667, 1.0, True),
+    'oldly': (0.1, 1.0, True),
+    'onlily': (0.0, 1.0, True),
+    'only': (0.0, 1.0, False),
+    'oozes': (-0.2, 1.0, False),
+    'open': (0.0, 1.0, False),
+    'open-minded': (0.4, 1.0, False),
+    'open-mindedly': (0.4, 1.0, True),
+    'openly': (0.0, 1.0, True),
+    'opposite': (0.0, 1.0, False),
+    'oppositely': (0.0, 1.0, True),
+    'optimum': (0.7, 1.0, False),
+    'optimumly': (0.7, 1.0, True),
+    'ordinarily': (-0.25, 1.0, True),
+    'ordinary': (-0.25, 1.0, False),
+    'original': (0.375, 1.0, False),
+    'originally': (0.375, 1.0, True),
+    'orthodox': (-0.2, 1.0, False),
+    'orthodoxly': (-0.2, 1.0, True),
+    'other': (-0.125, 1.0, False),
+    'otherly': (-0.125, 1.0, True),
+    'outdated': (-0.4, 1.0, False),
+    'outdatedly': (-0.4, 1.0, True),
+    'outraged': (-0.9, 1.0, False),
+    'outrageous': (-1.0, 1.0, False),
+    'outrageously': (-1.0, 1.0, True),
+    'outside': (0.0, 1.0, False),
+    'outsidely': (0.0, 1.0, True),
+    'outstanding': (0.5, 1.0, False),
+    'outstandingly': (0.5, 1.0, True),
+    'over-the-top': (-0.5, 1.0, False),
+    'over-the-toply': (-0.5, 1.0, True),
+    'overall': (0.0, 1.0, False),
+    'overallly': (0.0, 1.0, True),
+    'overboard': (-0.25, 1.0, True),
+    'overexcited': (-0.4, 1.0, False),
+    'overexcitedly': (-0.4, 1.0, True),
+    'overwhelming': (0.5, 1.0, False),
+    'overwhelmingly': (0.5, 1.0, True),
+    'own': (0.6, 1.0, False),
+    'ownly': (0.6, 1.0, True),
+    'painful': (-0.7, 1.0, False),
+    'painfully': (-0.7, 1.0, True),
+    'pale': (-0.21, 1.0, False),
+    'palpable': (0.0, 1.0, False),
+    'palpably': (0.0, 1.0, True),
+    'paly': (-0.12, 1.0, True),
+    'parade': (-0.25, 1.0, False),
+    'parallel': (0.0, 1.0, False),
+    'parallelly': (0.0, 1.0, True),
+    'partial': (-0.1, 1.0, False),
+    'partially': (-0.1, 1.0, True),
+    'particular': (0.1667, 1.0, False),
+    'particularly': (0.1667, 1.0, True),
+    'passionate': (-0.05, 1.0, False),
+    'passionately': (-0.05, 1.0, True),
+    'past': (-0.25, 1.0, False),
+    'pastly': (-0.25, 1.0, True),
+    'pathetic': (-1.0, 1.0, False),
+    'patheticly': (-1.0, 1.0, True),
+    'peaceful': (0.25, 1.0, False),
+    'peacefully': (0.25, 1.0, True),
+    'peakily': (0.1, 1.0, True),
+    'peaky': (0.1, 1.0, False),
+    'peevish': (-0.4, 1.0, False),
+    'peevishly': (-0.4, 1.0, True),
+    'pepperily': (-0.1, 1.0, True),
+    'peppery': (-0.1, 1.0, False),
+    'perfect': (1.0, 1.0, False),
+    'perfectly': (1.0, 1.0, True),
+    'perpetually': (-0.05, 1.0, True),
+    'perplexed': (0.4, 1.0, False),
+    'perplexedly': (0.4, 1.0, True),
+    'personal': (0.0, 1.0, False),
+    'personally': (0.0, 1.0, True),
+    'phantasmagoric': (0.0, 1.0, False),
+    'phantasmagoricly': (0.0, 1.0, True),
+    'phenomenal': (0.5, 1.0, False),
+    'phenomenally': (0.5, 1.0, True),
+    'philosophic': (0.2, 1.0, False),
+    'philosophical': (0.0, 1.0, False),
+    'philosophically': (0.0, 1.0, True),
+    'philosophicly': (0.2, 1.0, True),
+    'physical': (0.0, 1.0, False),
+    'physically': (0.0, 1.0, True),
+    'pinheads': (-0.3, 1.0, False),
+    'pink': (-0.1, 1.0, False),
+    'pinkly': (-0.1, 1.0, True),
+    'pious': (0.0, 1.0, False),
+    'piously': (0.0, 1.0, True),
+    'pity': (-0.1, 1.0, False),
+    'pivotal': (0.5, 1.0, False),
+    'pivotally': (0.5, 1.0, True),
+    'placid': (-0.3, 1.0, False),
+    'placidly': (-0.3, 1.0, True),
+    'plain': (-0.2143, 1.0, False),
+    'plainly': (-0.2143, 1.0, True),
+    'platitudes': (-0.2, 1.0, False),
+    'plausible': (0.5, 1.0, False),
+    'plausibly': (0.5, 1.0, True),
+    'pleasant': (0.7333, 1.0, False),
+    'pleasantly': (0.7333, 1.0, True),
+    'pleased': (0.5, 1.0, False),
+    'pleasedly': (0.5, 1.0, True),
+    'pleonastic': (-0.5, 1.0, False),
+    'pleonasticly': (-0.5, 1.0, True),
+    'plod': (-0.2, 1.0, False),
+    'plodding': (-0.3, 1.0, False),
+    'poetic': (0.375, 1.0, False),
+    'poeticly': (0.375, 1.0, True),
+    'poignant': (0.0, 1.0, False),
+    'poignantly': (0.0, 1.0, True),
+    'pointless': (-0.25, 1.0, False),
+    'pointlessly': (-0.25, 1.0, True),
+    'polar': (-0.0833, 1.0, False),
+    'polarly': (-0.0833, 1.0, True),
+    'political': (0.0, 1.0, False),
+    'politically': (0.0, 1.0, True),
+    'poor': (-0.4, 1.0, False),
+    'poorly': (-0.4, 1.0, True),
+    'popular': (0.6, 1.0, False),
+    'popularly': (0.6, 1.0, True),
+    'positive': (0.2273, 1.0, False),
+    'positively': (0.2273, 1.0, True),
+    'possible': (0.0, 1.0, False),
+    'possibly': (0.0, 1.0, True),
+    'potent': (0.5, 1.0, False),
+    'potential': (0.0, 1.0, False),
+    'potentially': (0.0, 1.0, True),
+    'potently': (0.5, 1.0, True),
+    'powerful': (0.3, 1.0, False),
+    'powerfully': (0.3, 1.0, True),
+    'powerless': (-0.5, 1.0, False),
+    'powerlessly': (-0.5, 1.0, True),
+    'preachily': (-0.2, 1.0, True),
+    'preachy': (-0.2, 1.0, False),
+    'precious': (0.5, 1.0, False),
+    'preciously': (0.5, 1.0, True),
+    'precise': (0.4, 1.0, False),
+    'precisely': (0.4, 1.0, True),
+    'predictable': (-0.2, 1.0, False),
+    'predictably': (-0.2, 1.0, True),
+    'pregnant': (0.3333, 1.0, False),
+    'pregnantly': (0.3333, 1.0, True),
+    'present': (0.0, 1.0, False),
+    'presently': (0.0, 1.0, True),
+    'pretentious': (-0.3, 1.0, False),
+    'pretentiously': (-0.3, 1.0, True),
+    'prettily': (0.25, 1.0, True),
+    'pretty': (0.25, 1.0, False),
+    'previous': (-0.1667, 1.0, False),
+    'previously': (-0.1667, 1.0, True),
+    'priceless': (1.0, 1.0, False),
+    'pricelessly': (1.0, 1.0, True),
+    'primarily': (0.4, 1.0, True),
+    'primary': (0.4, 1.0, False),
+    'prior': (0.0, 1.0, False),
+    'priorly': (0.0, 1.0, True),
+    'prissy': (-0.3, 1.0, False),
+    'private': (0.0, 1.0, False),
+    'privately': (0.0, 1.0, True),
+    'professional': (0.1, 1.0, False),
+    'professionally': (0.1, 1.0, True),
+    'profitering': (-0.3, 1.0, False),
+    'profound': (0.0833, 1.0, False),
+    'profoundly': (0.0833, 1.0, True),
+    'prolix': (-0.6, 1.0, False),
+    'prolixly': (-0.6, 1.0, True),
+    'prominent': (0.5, 1.0, False),
+    'prominently': (0.5, 1.0, True),
+    'promising': (0.2, 1.0, False),
+    'promisingly': (0.2, 1.0, True),
+    'propaganda': (-0.1, 1.0, False),
+    'proper': (0.0, 1.0, False),
+    'properly': (0.0, 1.0, True),
+    'proud': (0.8, 1.0, False),
+    'proudly': (0.8, 1.0, True),
+    'proves': (0.3, 1.0, False),
+    'psychological': (0.0, 1.0, False),
+    'psychologically': (0.0, 1.0, True),
+    'psychotic': (-0.5, 1.0, False),
+    'psychoticly': (-0.5, 1.0, True),
+    'public': (0.0, 1.0, False),
+    'publicly': (0.0, 1.0, True),
+    'pure': (0.2143, 1.0, False),
+    'purely': (0.2143, 1.0, True),
+    'putative': (-0.0667, 1.0, False),
+    'putatively': (-0.0667, 1.0, True),
+    'questionable': (-0.5, 1.0, False),
+    'questionably': (-0.5, 1.0, True),
+    'quick': (0.3333, 1.0, False),
+    'quickly': (0.3333, 1.0, True),
+    'quiet': (0.0, 1.0, False),
+    'quietly': (0.0, 1.0, True),
+    'quirkily': (0.0, 1.0, True),
+    'quirky': (0.0, 1.0, False),
+    'quixotic': (0.2, 1.0, False),
+    'quixoticly': (0.2, 1.0, True),
+    'rancorous': (-0.8, 1.0, False),
+    'rancorously': (-0.8, 1.0, True),
+    'random': (-0.5, 1.0, False),
+    'randomly': (-0.5, 1.0, True),
+    'rank': (-0.8, 1.0, False),
+    'rankly': (-0.8, 1.0, True),
+    'rare': (0.3, 1.0, False),
+    'rarely': (0.3, 1.0, True),
+    'raucous': (-0.3, 1.0, False),
+    'raucously': (-0.3, 1.0, True),
+    'raunchily': (-0.5, 1.0, True),
+    'raunchy': (-0.5, 1.0, False),
+    'raw': (-0.2308, 1.0, False),
+    'rawly': (-0.2308, 1.0, True),
+    'readily': (0.2, 1.0, True),
+    'ready': (0.2, 1.0, False),
+    'real': (0.2, 1.5, True),
+    'realistic': (0.1667, 1.0, False),
+    'realisticly': (0.1667, 1.0, True),
+    'really': (0.2, 1.0, True),
+    'reasonable': (0.2, 1.0, False),
+    'reasonably': (0.2, 1.0, True),
+    'recent': (0.0, 1.0, False),
+    'recently': (0.0, 1.0, True),
+    'recognizable': (0.25, 1.0, False),
+    'recognizably': (0.25, 1.0, True),
+    'red': (0.0, 1.0, False),
+    'redeeming': (0.5, 1.0, False),
+    'redeemingly': (0.5, 1.0, True),
+    'redly': (0.0, 1.0, True),
+    'redoubtable': (0.6, 1.0, False),
+    'redoubtably': (0.6, 1.0, True),
+    'redundant': (-0.2, 1.0, False),
+    'redundantly': (-0.2, 1.0, True),
+    'refreshing': (0.5, 1.0, False),
+    'refreshingly': (0.5, 1.0, True),
+    'regrets': (-0.1, 1.0, False),
+    'regular': (0.0, 1.0, False),
+    'regularly': (0.0, 1.0, True),
+    'regurgitates': (-0.3, 1.0, False),
+    'rehash': (-0.05, 1.0, False),
+    'related': (0.0, 1.0, False),
+    'relatedly': (0.0, 1.0, True),
+    'relative': (0.0, 1.0, False),
+    'relatively': (0.0, 1.0, True),
+    'relevant': (0.4, 1.0, False),
+    'relevantly': (0.4, 1.0, True),
+    'religious': (0.0, 1.0, False),
+    'religiously': (0.0, 1.0, True),
+    'remarkable': (0.75, 1.0, False),
+    'remarkably': (0.75, 1.0, True),
+    'reminiscent': (0.0, 1.0, False),
+    'reminiscently': (0.0, 1.0, True),
+    'remote': (-0.1, 1.0, False),
+    'remotely': (-0.1, 1.0, True),
+    'repellent': (-0.9, 1.0, False),
+    'repellently': (-0.9, 1.0, True),
+    'repetitive': (-0.25, 1.0, False),
+    'repetitively': (-0.25, 1.0, True),
+    'reputable': (0.5, 1.0, False),
+    'reputably': (0.5, 1.0, True),
+    'resourceful': (0.6, 1.0, False),
+    'resourcefully': (0.6, 1.0, True),
+    'respectable': (0.5, 1.0, False),
+    'respectably': (0.5, 1.0, True),
+    'respectful': (0.5, 1.0, False),
+    'respectfully': (0.5, 1.0, True),
+    'respective': (0.0, 1.0, False),
+    'respectively': (0.0, 1.0, True),
+    'responsible': (0.2, 1.0, False),
+    'responsibly': (0.2, 1.0, True),
+    'retard': (-0.9, 1.0, False),
+    'retarded': (-0.8, 1.0, False),
+    'retardedly': (-0.8, 1.0, True),
+    'retards': (-0.9, 1.0, False),
+    'rewarding': (0.5, 1.0, False),
+    'rewardingly': (0.5, 1.0, True),
+    'rich': (0.375, 1.0, False),
+    'richly': (0.375, 1.0, True),
+    'ridiculous': (-0.3333, 1.0, False),
+    'ridiculously': (-0.3333, 1.0, True),
+    'right': (0.2857, 1.0, False),
+    'right-minded': (0.1, 1.0, False),
+    'right-mindedly': (0.1, 1.0, True),
+    'rightist': (-0.2, 1.0, False),
+    'rightistly': (-0.2, 1.0, True),
+    'rightly': (0.2857, 1.0, True),
+    'rip-off': (-0.4, 1.0, False),
+    'risk-free': (0.4, 1.0, False),
+    'risk-freely': (0.4, 1.0, True),
+    'riveting': (0.5, 1.0, False),
+    'rivetingly': (0.5, 1.0, True),
+    'robotic': (-0.1, 1.0, False),
+    'roboticly': (-0.1, 1.0, True),
+    'rofl': (0.8, 1.0, False),
+    'rohypnol': (-0.1, 1.0, False),
+    'romantic': (0.0, 1.0, False),
+    'romanticly': (0.0, 1.0, True),
+    'rose': (0.6, 1.0, False),
+    'rosely': (0.6, 1.0, True),
+    'rough': (-0.1, 1.0, False),
+    'roughage': (-0.1, 1.0, False),
+    'roughly': (-0.1, 1.0, True),
+    'round': (-0.2, 1.0, False),
+    'roundly': (-0.2, 1.0, True),
+    'rude': (-0.3, 1.0, False),
+    'rudely': (-0.3, 1.0, True),
+    'ruins': (-0.15, 1.0, False),
+    'rural': (0.0, 1.0, False),
+    'rurally': (0.0, 1.0, True),
+    'russian': (0.0, 1.0, False),
+    'russianly': (0.0, 1.0, True),
+    'ruthless': (-1.0, 1.0, False),
+    'ruthlessly': (-1.0, 1.0, True),
+    'sad': (-0.5, 1.0, False),
+    'sadism': (-0.05, 1.0, False),
+    'sadly': (-0.5, 1.0, True),
+    'safe': (0.5, 1.0, False),
+    'safely': (0.5, 1.0, True),
+    'same': (0.0, 1.0, False),
+    'samely': (0.0, 1.0, True),
+    'sarcastic': (0.1, 1.0, False),
+    'sarcasticly': (0.1, 1.0, True),
+    'satisfied': (0.5, 1.0, False),
+    'satisfiedly': (0.5, 1.0, True),
+    'satisfying': (0.5, 1.0, False),
+    'satisfyingly': (0.5, 1.0, True),
+    'satisyfing': (0.6, 1.0, False),
+    'satisyfingly': (0.6, 1.0, True),
+    'scareily': (-0.5, 1.0, True),
+    'scarey': (-0.5, 1.0, False),
+    'scarily': (-0.5, 1.0, True),
+    'scary': (-0.5, 1.0, False),
+    'scathing': (-0.6, 1.0, False),
+    'scathingly': (-0.6, 1.0, True),
+    'scum': (-0.3, 1.0, False),
+    'seamless': (0.1, 1.0, False),
+    'seamlessly': (0.1, 1.0, True),
+    'seasoned': (0.25, 1.0, False),
+    'seasonedly': (0.25, 1.0, True),
+    'sec': (-0.1, 1.0, False),
+    'secly': (-0.1, 1.0, True),
+    'second': (0.0, 1.0, False),
+    'secondarily': (-0.3, 1.0, True),
+    'secondary': (-0.3, 1.0, False),
+    'secondhand': (-0.1, 1.0, False),
+    'secondhandly': (-0.1, 1.0, True),
+    'secondly': (0.0, 1.0, True),
+    'secret': (-0.4, 1.0, False),
+    'secretly': (-0.4, 1.0, True),
+    'secure': (0.4, 1.0, False),
+    'securely': (0.4, 1.0, True),
+    'seizures': (-0.05, 1.0, False),
+    'self-acting': (0.0, 1.0, False),
+    'self-actingly': (0.0, 1.0, True),
+    'selfish': (-0.5, 1.0, False),
+    'selfishly': (-0.5, 1.0, True),
+    'sensational': (0.6667, 1.0, False),
+    'sensationally': (0.6667, 1.0, True),
+    'sensitive': (0.1, 1.0, False),
+    'sensitively': (0.1, 1.0, True),
+    'sentimental': (-0.25, 1.0, False),
+    'sentimentally': (-0.25, 1.0, True),
+    'serious': (-0.3333, 1.0, False),
+    'seriously': (-0.3333, 1.0, True),
+    'sermon': (-0.225, 1.0, False),
+    'several': (0.0, 1.0, False),
+    'severally': (0.0, 1.0, True),
+    'sexily': (0.5, 1.0, True),
+    'sexual': (0.5, 1.0, False),
+    'sexually': (0.5, 1.0, True),
+    'sexy': (0.5, 1.0, False),
+    'shadily': (-0.25, 1.0, True),
+    'shady': (-0.25, 1.0, False),
+    'shakily': (-0.3333, 1.0, True),
+    'shaky': (-0.3333, 1.0, False),
+    'shallow': (-0.3333, 1.0, False),
+    'shallowly': (-0.3333, 1.0, True),
+    'sham': (-0.2, 1.0, False),
+    'shapeless': (-0.2, 1.0, False),
+    'shapelessly': (-0.2, 1.0, True),
+    'sharp': (-0.125, 1.0, False),
+    'sharply': (-0.125, 1.0, True),
+    'sheer': (0.0, 1.0, False),
+    'sheerly': (0.0, 1.0, True),
+    'shily': (-0.5, 1.0, True),
+    'shit': (-0.2, 1.0, False),
+    'shocked': (-0.7, 1.0, False),
+    'shockedly': (-0.7, 1.0, True),
+    'shocking': (-1.0, 1.0, False),
+    'shockingly': (-1.0, 1.0, True),
+    'shoddily': (-0.3, 1.0, True),
+    'shoddy': (-0.3, 1.0, False),
+    'short': (0.0, 1.0, False),
+    'shortly': (0.0, 1.0, True),
+    "shouldn't": (-0.1, 1.0, False),
+    'showerily': (-0.2, 1.0, True),
+    'showery': (-0.2, 1.0, False),
+    'shriekily': (-0.4, 1.0, True),
+    'shrieky': (-0.4, 1.0, False),
+    'shrill': (-0.4, 1.0, False),
+    'shrillly': (-0.4, 1.0, True),
+    'shy': (-0.5, 1.0, False),
+    'sick': (-0.7143, 1.0, False),
+    'sickening': (-0.9, 1.0, False),
+    'sickeningly': (-0.9, 1.0, True),
+    'sickly': (-0.7143, 1.0, True),
+    'significant': (0.375, 1.0, False),
+    'significantly': (0.375, 1.0, True),
+    'silent': (0.0, 1.0, False),
+    'silently': (0.0, 1.0, True),
+    'sillily': (-0.5, 1.0, True),
+    'silly': (-0.5, 1.0, False),
+    'similar': (0.0, 1.0, False),
+    'similarly': (0.0, 1.0, True),
+    'simple': (0.0, 1.0, False),
+    'simplistic': (-0.5, 1.0, False),
+    'simplisticly': (-0.5, 1.0, True),
+    'simply': (0.0, 1.0, True),
+    'sincere': (0.5, 1.0, False),
+    'sincerely': (0.5, 1.0, True),
+    'single': (-0.0714, 1.0, False),
+    'singly': (-0.0714, 1.0, True),
+    'sinister': (-0.5, 1.0, False),
+    'sinisterly': (-0.5, 1.0, True),
+    'sinks': (-0.1, 1.0, False),
+    'sixth-grade': (-0.05, 1.0, False),
+    'sixth-gradely': (-0.05, 1.0, True),
+    'skeptical': (-0.5, 1.0, False),
+    'skeptically': (-0.5, 1.0, True),
+    'skilled': (0.5, 1.0, False),
+    'skilledly': (0.5, 1.0, True),
+    'skittish': (0.7, 1.0, False),
+    'skittishly': (0.7, 1.0, True),
+    'slick': (-0.25, 1.0, False),
+    'slickly': (-0.25, 1.0, True),
+    'slight': (-0.1667, 1.0, False),
+    'slightly': (-0.1667, 1.0, True),
+    'slipping': (-0.1, 1.0, False),
+    'slippingly': (-0.1, 1.0, True),
+    'sloppily': (-0.4167, 1.0, True),
+    'sloppy': (-0.4167, 1.0, False),
+    'slow': (-0.3, 1.0, False),
+    'slowly': (-0.3, 1.0, True),
+    'small': (-0.25, 1.0, False),
+    'smaller': (0.0, 1.0, False),
+    'smallerly': (0.0, 1.0, True),
+    'smallly': (-0.25, 1.0, True),
+    'smart': (0.2143, 1.0, False),
+    'smartly': (0.2143, 1.0, True),
+    'smile': (0.3, 1.0, False),
+    'smiled': (0.6, 1.0, False),
+    'smooth': (0.4, 1.0, False),
+    'smoothly': (0.4, 1.0, True),
+    'sober': (0.1, 1.0, False),
+    'soberly': (0.1, 1.0, True),
+    'social': (0.0333, 1.0, False),
+    'socially': (0.0333, 1.0, True),
+    'soft': (0.1, 1.0, False),
+    'soft-boiled': (-0.1, 1.0, False),
+    'soft-boiledly': (-0.1, 1.0, True),
+    'softly': (0.1, 1.0, True),
+    'sole': (0.0, 1.0, False),
+    'solicitous': (0.3, 1.0, False),
+    'solicitously': (0.3, 1.0, True),
+    'solid': (0.0, 1.0, False),
+    'solidly': (0.0, 1.0, True),
+    'soly': (0.0, 1.0, True),
+    'sophisticated': (0.5, 1.0, False),
+    'sophisticatedly': (0.5, 1.0, True),
+    'sophomoric': (-0.2, 1.0, False),
+    'sophomoricly': (-0.2, 1.0, True),
+    'sorrily': (-0.5, 1.0, True),
+    'sorry': (-0.5, 1.0, False),
+    'sound': (0.4, 1.0, False),
+    'soundly': (0.4, 1.0, True),
+    'sour': (-0.15, 1.0, False),
+    'soured': (-0.3, 1.0, False),
+    'souredly': (-0.3, 1.0, True),
+    'sourly': (-0.2, 1.0, True),
+    'southern': (0.0, 1.0, False),
+    'southernly': (0.0, 1.0, True),
+    'spanish': (0.0, 1.0, False),
+    'spanishly': (0.0, 1.0, True),
+    'special': (0.3571, 1.0, False),
+    'specially': (0.3571, 1.0, True),
+    'specific': (0.0, 1.0, False),
+    'specificly': (0.0, 1.0, True),
+    'spectacular': (0.6, 1.0, False),
+    'spectacularly': (0.6, 1.0, True),
+    'spent': (-0.1, 1.0, False),
+    'spirited': (0.5, 1.0, False),
+    'spiritedly': (0.5, 1.0, True),
+    'spiritual': (0.0, 1.0, False),
+    'spiritually': (0.0, 1.0, True),
+    'splendid': (0.8333, 1.0, False),
+    'splendidly': (0.8333, 1.0, True),
+    'spontaneous': (0.6, 1.0, False),
+    'spontaneously': (0.6, 1.0, True),
+    'spoof': (-0.1, 1.0, False),
+    'sprightlily': (0.4, 1.0, True),
+    'sprightly': (0.4, 1.0, False),
+    'stabbing': (-0.6, 1.0, False),
+    'stabbingly': (-0.6, 1.0, True),
+    'stainless': (0.2, 1.0, False),
+    'stainlessly': (0.2, 1.0, True),
+    'stale': (-0.5, 1.0, False),
+    'staly': (-0.5, 1.0, True),
+    'standard': (0.0, 1.0, False),
+    'standardly': (0.0, 1.0, True),
+    'stark': (-0.2, 1.0, False),
+    'starkly': (-0.2, 1.0, True),
+    'starting': (0.0, 1.0, False),
+    'startingly': (0.0, 1.0, True),
+    'startling': (-0.5, 1.0, False),
+    'startlingly': (-0.5, 1.0, True),
+    'state-supported': (0.1, 1.0, False),
+    'state-supportedly': (0.1, 1.0, True),
+    'static': (0.5, 1.0, False),
+    'staticly': (0.5, 1.0, True),
+    'steadfast': (0.4, 1.0, False),
+    'steadfastly': (0.4, 1.0, True),
+    'steadily': (0.1667, 1.0, True),
+    'steady': (0.1667, 1.0, False),
+    'stellar': (0.25, 1.0, False),
+    'stellarly': (0.25, 1.0, True),
+    'stereotyped': (-0.1, 1.0, False),
+    'stereotypedly': (-0.1, 1.0, True),
+    'stereotypical': (-0.5, 1.0, False),
+    'stereotypically': (-0.5, 1.0, True),
+    'stiff': (-0.2143, 1.0, False),
+    'stiffly': (-0.2143, 1.0, True),
+    'stinker': (-0.5, 1.0, False),
+    'stinks': (-0.6, 1.0, False),
+    'straight': (0.2, 1.0, False),
+    'straightforward': (0.375, 1.0, False),
+    'straightforwardly': (0.375, 1.0, True),
+    'straightly': (0.2, 1.0, True),
+    'strange': (-0.05, 1.0, False),
+    'strangely': (-0.05, 1.0, True),
+    'stretched': (-0.05, 1.0, False),
+    'stretchedly': (-0.05, 1.0, True),
+    'striking': (0.5, 1.0, False),
+    'strikingly': (0.5, 1.0, True),
+    'strong': (0.4333, 1.0, False),
+    'strongly': (0.4333, 1.0, True),
+    'strutting': (-0.3, 1.0, False),
+    'stumble': (-0.05, 1.0, False),
+    'stunning': (0.5, 1.0, False),
+    'stunningly': (0.5, 1.0, True),
+    'stupid': (-0.8, 1.0, False),
+    'stupidity': (-0.6, 1.0, False),
+    'stupidly': (-0.8, 1.0, True),
+    'stylish': (0.5, 1.0, False),
+    'stylishly': (0.5, 1.0, True),
+    'subconscious': (0.0, 1.0, False),
+    'subconsciously': (0.0, 1.0, True),
+    'subject': (-0.1667, 1.0, False),
+    'subjectly': (-0.1667, 1.0, True),
+    'subnormal': (-0.6, 1.0, False),
+    'subnormally': (-0.6, 1.0, True),
+    'subsequent': (0.0, 1.0, False),
+    'subsequently': (0.0, 1.0, True),
+    'subtle': (-0.3333, 1.0, False),
+    'subtly': (-0.3333, 1.0, True),
+    'suburban': (0.0, 1.0, False),
+    'suburbanly': (0.0, 1.0, True),
+    'succeeds': (0.7, 1.0, False),
+    'success': (0.3, 1.0, False),
+    'successful': (0.75, 1.0, False),
+    'successfully': (0.75, 1.0, True),
+    'such': (0.0, 1.0, False),
+    'suchly': (0.0, 1.0, True),
+    'sucker': (-0.3, 1.0, False),
+    'suckers': (-0.3, 1.0, False),
+    'sucks': (-0.3, 1.0, False),
+    'sudden': (0.0, 1.0, False),
+    'suddenly': (0.0, 1.0, True),
+    'suffers': (-0.6, 1.0, False),
+    'suffocating': (-0.5, 1.0, False),
+    'suitable': (0.55, 1.0, False),
+    'suitably': (0.55, 1.0, True),
+    'super': (0.3333, 1.0, False),
+    'superb': (1.0, 1.0, False),
+    'superbly': (1.0, 1.0, True),
+    'superfine': (0.4, 1.0, False),
+    'superfinely': (0.4, 1.0, True),
+    'superior': (0.7, 1.0, False),
+    'superiorly': (0.7, 1.0, True),
+    'superly': (0.3333, 1.0, True),
+    'supernatural': (0.1667, 1.0, False),
+    'supernaturally': (0.1667, 1.0, True),
+    'supporting': (0.25, 1.0, False),
+    'supportingly': (0.25, 1.0, True),
+    'supportive': (0.5, 1.0, False),
+    'supportively': (0.5, 1.0, True),
+    'sure': (0.5, 1.0, False),
+    'surely': (0.5, 1.0, True),
+    'surprised': (0.1, 1.0, False),
+    'surprisedly': (0.1, 1.0, True),
+    'surprising': (0.7, 1.0, False),
+    'surprisingly': (0.7, 1.0, True),
+    'surreal': (0.25, 1.0, False),
+    'surreally': (0.25, 1.0, True),
+    'suspenseful': (0.0, 1.0, False),
+    'suspensefully': (0.0, 1.0, True),
+    'sweet': (0.35, 1.0, False),
+    'sweetly': (0.35, 1.0, True),
+    'swill': (-0.1, 1.0, False),
+    'sympathetic': (0.5, 1.0, False),
+    'sympatheticly': (0.5, 1.0, True),
+    'talented': (0.7, 1.0, False),
+    'talentedly': (0.7, 1.0, True),
+    'tame': (-0.2167, 1.0, False),
+    'tamely': (-0.2333, 1.0, True),
+    'tasteless': (-0.6, 1.0, False),
+    'tastelessly': (-0.6, 1.0, True),
+    'technical': (0.0, 1.0, False),
+    'technically': (0.0, 1.0, True),
+    'tedious': (-0.5, 1.0, False),
+    'tediously': (-0.5, 1.0, True),
+    'teen': (0.0, 1.0, False),
+    'teenage': (0.0, 1.0, False),
+    'teenagely': (0.0, 1.0, True),
+    'teenly': (0.0, 1.0, True),
+    'ten': (0.0, 1.0, False),
+    'tenly': (0.0, 1.0, True),
+    'tense': (-0.3333, 1.0, False),
+    'tensely': (-0.3333, 1.0, True),
+    'terminally': (-0.4, 1.0, True),
+    'terrestrial': (0.0, 1.0, False),
+    'terrestrially': (0.0, 1.0, True),
+    'terrible': (-1.0, 1.0, False),
+    'terribly': (-1.0, 1.0, True),
+    'terrific': (0.0, 1.0, False),
+    'terrificly': (0.0, 1.0, True),
+    'terrifying': (-1.0, 1.0, False),
+    'terrifyingly': (-1.0, 1.0, True),
+    'thanks': (0.2, 1.0, False),
+    'theatrical': (0.0, 1.0, False),
+    'theatrically': (0.0, 1.0, True),
+    'thematic': (0.0, 1.0, False),
+    'thematicly': (0.0, 1.0, True),
+    'theoretical': (0.0, 1.0, False),
+    'theoretically': (0.0, 1.0, True),
+    'thick': (-0.3, 1.0, False),
+    'thickly': (-0.3, 1.0, True),
+    'thin': (-0.4, 1.0, False),
+    'thinly': (-0.4, 1.0, True),
+    'third': (0.0, 1.0, False),
+    'thirdly': (0.0, 1.0, True),
+    'thought-provoking': (0.4, 1.0, False),
+    'thought-provokingly': (0.4, 1.0, True),
+    'thoughtful': (0.4, 1.0, False),
+    'thoughtfully': (0.4, 1.0, True),
+    'thrilled': (0.6, 1.0, False),
+    'thrilledly': (0.6, 1.0, True),
+    'thrilling': (0.25, 1.0, False),
+    'thrillingly': (0.25, 1.0, True),
+    'tidily': (0.6, 1.0, True),
+    'tidy': (0.6, 1.0, False),
+    'tight': (-0.1786, 1.0, False),
+    'tightly': (-0.1786, 1.0, True),
+    'tinily': (0.0, 1.0, True),
+    'tiny': (0.0, 1.0, False),
+    'tired': (-0.4, 1.0, False),
+    'tiredly': (-0.4, 1.0, True),
+    'tiresome': (-0.5, 1.0, False),
+    'tiresomely': (-0.5, 1.0, True),
+    'titular': (0.1, 1.0, False),
+    'titularly': (0.1, 1.0, True),
+    'toilet': (-0.0333, 1.0, False),
+    'toneless': (-0.1, 1.0, False),
+    'tonelessly': (-0.1, 1.0, True),
+    'top': (0.5, 1.0, False),
+    'top-notch': (1.0, 1.0, False),
+    'top-notchly': (1.0, 1.0, True),
+    'topical': (0.0, 1.0, False),
+    'topically': (0.0, 1.0, True),
+    'toply': (0.5, 1.0, True),
+    'total': (0.0, 1.0, False),
+    'totally': (0.0, 1.0, True),
+    'touching': (0.5, 1.0, False),
+    'tough': (-0.3889, 1.0, False),
+    'toughly': (-0.3889, 1.0, True),
+    'traditional': (0.0, 1.0, False),
+    'traditionally': (0.0, 1.0, True),
+    'tragic': (-0.75, 1.0, False),
+    'tragicly': (-0.75, 1.0, True),
+    'trapped': (-0.2, 1.0, False),
+    'tremendous': (0.3333, 1.0, False),
+    'tremendously': (0.3333, 1.0, True),
+    'trendily': (0.6, 1.0, True),
+    'trendy': (0.6, 1.0, False),
+    'tries': (-0.1, 1.0, False),
+    'trouble': (-0.2, 1.0, False),
+    'troubled': (-0.5, 1.0, False),
+    'troubledly': (-0.5, 1.0, True),
+    'true': (0.35, 1.0, False),
+    'truely': (0.35, 1.0, True),
+    'truthful': (0.5, 1.0, False),
+    'truthfully': (0.5, 1.0, True),
+    'twisted': (-0.5, 1.0, False),
+    'twistedly': (-0.5, 1.0, True),
+    'two-dimensional': (-0.1, 1.0, False),
+    'two-dimensionally': (-0.1, 1.0, True),
+    'typical': (-0.1667, 1.0, False),
+    'typically': (-0.1667, 1.0, True),
+    'uglily': (-0.7, 1.0, True),
+    'ugliness': (-0.3, 1.0, False),
+    'ugly': (-0.7, 1.0, False),
+    'ugly-duckling': (-0.1, 1.0, False),
+    'ultimate': (0.0, 1.0, False),
+    'ultimately': (0.0, 1.0, True),
+    'unable': (-0.5, 1.0, False),
+    'unably': (-0.5, 1.0, True),
+    'unadulterated': (0.4, 1.0, False),
+    'unadulteratedly': (0.4, 1.0, True),
+    'unaffected': (-0.05, 1.0, False),
+    'unaffectedly': (-0.05, 1.0, True),
+    'unanswered': (-0.1, 1.0, False),
+    'unansweredly': (-0.1, 1.0, True),
+    'unappealing': (-0.4, 1.0, False),
+    'unappealingly': (-0.4, 1.0, True),
+    'unappetizing': (-0.8, 1.0, False),
+    'unappetizingly': (-0.8, 1.0, True),
+    'unashamed': (-0.5, 1.0, False),
+    'unashamedly': (-0.5, 1.0, True),
+    'unavowed': (0.0, 1.0, False),
+    'unavowedly': (0.0, 1.0, True),
+    'unaware': (0.0, 1.0, False),
+    'unawarely': (0.0, 1.0, True),
+    'unbefitting': (-0.6, 1.0, False),
+    'unbefittingly': (-0.6, 1.0, True),
+    'unbelievable': (-0.25, 1.0, False),
+    'unbelievably': (-0.25, 1.0, True),
+    'unblemished': (0.1, 1.0, False),
+    'unblemishedly': (0.1, 1.0, True),
+    'unblinking': (0.3, 1.0, False),
+    'unblinkingly': (0.3, 1.0, True),
+    'unbranded': (-0.1, 1.0, False),
+    'unbrandedly': (-0.1, 1.0, True),
+    'uncared-for': (-0.2, 1.0, False),
+    'uncared-forly': (-0.2, 1.0, True),
+    'unchaste': (-0.7, 1.0, False),
+    'unchastely': (-0.7, 1.0, True),
+    'uncivil': (-0.7333, 1.0, False),
+    'uncivilly': (-0.7333, 1.0, True),
+    'uncomfortable': (-0.5, 1.0, False),
+    'uncomfortably': (-0.5, 1.0, True),
+    'uncommon': (0.8, 1.0, False),
+    'uncommonly': (0.8, 1.0, True),
+    'uncontroversial': (0.3, 1.0, False),
+    'uncontroversially': (0.3, 1.0, True),
+    'uncooked': (-0.1, 1.0, False),
+    'uncookedly': (-0.1, 1.0, True),
+    'uncritical': (0.0, 1.0, False),
+    'uncritically': (0.0, 1.0, True),
+    'uncut': (-0.5, 1.0, False),
+    'uncutly': (-0.5, 1.0, True),
+    'undeserved': (-0.3, 1.0, False),
+    'undeservedly': (-0.3, 1.0, True),
+    'undignified': (-0.6, 1.0, False),
+    'undignifiedly': (-0.6, 1.0, True),
+    'unengaging': (-0.2, 1.0, False),
+    'uneven': (-0.2, 1.0, False),
+    'unevenly': (-0.2, 1.0, True),
+    'unexcelled': (0.5, 1.0, False),
+    'unexcelledly': (0.5, 1.0, True),
+    'unexpected': (0.1, 1.0, False),
+    'unexpectedly': (0.1, 1.0, True),
+    'unexplained': (-0.05, 1.0, False),
+    'unexplainedly': (-0.05, 1.0, True),
+    'unfair': (-0.5, 1.0, False),
+    'unfairly': (-0.5, 1.0, True),
+    'unfaithful': (-0.6, 1.0, False),
+    'unfaithfully': (-0.6, 1.0, True),
+    'unfocused': (-0.4, 1.0, False),
+    'unfocusedly': (-0.4, 1.0, True),
+    'unforgettable': (0.8, 1.0, False),
+    'unforgettably': (0.8, 1.0, True),
+    'unfortunate': (-0.5, 1.0, False),
+    'unfortunately': (-0.5, 1.0, True),
+    'unfruitful': (-0.6, 1.0, False),
+    'unfruitfully': (-0.6, 1.0, True),
+    'ungraded': (-0.4, 1.0, False),
+    'ungradedly': (-0.4, 1.0, True),
+    'unhampered': (0.6, 1.0, False),
+    'unhamperedly': (0.6, 1.0, True),
+    'unhappily': (-0.6, 1.0, True),
+    'unhappy': (-0.6, 1.0, False),
+    'unhealthily': (-0.4, 1.0, True),
+    'unhealthy': (-0.4, 1.0, False),
+    'unhesitating': (0.1, 1.0, False),
+    'unhesitatingly': (0.1, 1.0, True),
+    'unilateral': (-0.5, 1.0, False),
+    'unilaterally': (-0.5, 1.0, True),
+    'unimportant': (-0.4, 1.0, False),
+    'unimportantly': (-0.4, 1.0, True),
+    'uninspired': (-0.5, 1.0, False),
+    'uninspiredly': (-0.5, 1.0, True),
+    'unintelligent': (-0.65, 1.0, False),
+    'unintelligently': (-0.65, 1.0, True),
+    'uninterrupted': (0.0, 1.0, False),
+    'uninterruptedly': (0.0, 1.0, True),
+    'unique': (0.375, 1.0, False),
+    'uniquely': (0.375, 1.0, True),
+    'universal': (0.0, 1.0, False),
+    'universally': (0.0, 1.0, True),
+    'unknown': (-0.1, 1.0, False),
+    'unknownly': (-0.1, 1.0, True),
+    'unlikelily': (-0.5, 1.0, True),
+    'unlikely': (-0.5, 1.0, False),
+    'unnecessarily': (-0.4, 1.0, True),
+    'unnecessary': (-0.4, 1.0, False),
+    'unnoticed': (-0.2, 1.0, False),
+    'unnoticedly': (-0.2, 1.0, True),
+    'unoriginal': (-0.2, 1.0, False),
+    'unoriginally': (-0.2, 1.0, True),
+    'unpaid': (0.2, 1.0, False),
+    'unpaidly': (0.2, 1.0, True),
+    'unplayable': (-0.4, 1.0, False),
+    'unplayably': (-0.4, 1.0, True),
+    'unpleasant': (-0.65, 1.0, False),
+    'unpleasantly': (-0.65, 1.0, True),
+    'unprecedented': (0.6, 1.0, False),
+    'unprecedentedly': (0.6, 1.0, True),
+    'unpredictable': (-0.1667, 1.0, False),
+    'unpredictably': (-0.1667, 1.0, True),
+    'unprocessed': (-0.1, 1.0, False),
+    'unprocessedly': (-0.1, 1.0, True),
+    'unpropitious': (-0.6, 1.0, False),
+    'unpropitiously': (-0.6, 1.0, True),
+    'unread': (0.1, 1.0, False),
+    'unreadly': (0.1, 1.0, True),
+    'unrealistic': (-0.5, 1.0, False),
+    'unrealisticly': (-0.5, 1.0, True),
+    'unsalted': (0.4, 1.0, False),
+    'unsaltedly': (0.4, 1.0, True),
+    'unschooled': (-0.2, 1.0, False),
+    'unschooledly': (-0.2, 1.0, True),
+    'unsettling': (-0.5, 1.0, False),
+    'unsettlingly': (-0.5, 1.0, True),
+    'unstirred': (-0.4, 1.0, False),
+    'unstirredly': (-0.4, 1.0, True),
+    'unthinkable': (-0.05, 1.0, False),
+    'unthinkably': (-0.05, 1.0, True),
+    'untraceable': (-0.3, 1.0, False),
+    'untraceably': (-0.3, 1.0, True),
+    'unusual': (0.2, 1.0, False),
+    'unusually': (0.2, 1.0, True),
+    'unwed': (0.0, 1.0, False),
+    'unwedly': (0.0, 1.0, True),
+    'upper': (0.0, 1.0, False),
+    'upperly': (0.0, 1.0, True),
+    'urban': (0.0, 1.0, False),
+    'urbanly': (0.0, 1.0, True),
+    'urinates': (-0.1, 1.0, False),
+    'useful': (0.3, 1.0, False),
+    'usefully': (0.3, 1.0, True),
+    'useless': (-0.5, 1.0, False),
+    'uselessly': (-0.5, 1.0, True),
+    'usual': (-0.25, 1.0, False),
+    'usually': (-0.25, 1.0, True),
+    'utter': (0.0, 1.0, False),
+    'utterly': (0.0, 1.0, True),
+    'vacuum': (-0.0083, 1.0, False),
+    'vague': (-0.5, 1.0, False),
+    'vaguely': (-0.5, 1.0, True),
+    'vapid': (-0.3, 1.0, False),
+    'vapidly': (-0.3, 1.0, True),
+    'vaporific': (0.0, 1.0, False),
+    'vaporificly': (0.0, 1.0, True),
+    'various': (0.0, 1.0, False),
+    'variously': (0.0, 1.0, True),
+    'vast': (0.0, 1.0, False),
+    'vastly': (0.0, 1.0, True),
+    'very': (0.2, 1.3, True),
+    'veteran': (0.0, 1.0, False),
+    'veteranly': (0.0, 1.0, True),
+    'vibrant': (0.1667, 1.0, False),
+    'vibrantly': (0.1667, 1.0, True),
+    'vicious': (-1.0, 1.0, False),
+    'viciously': (-1.0, 1.0, True),
+    'victim': (-0.075, 1.0, False),
+    'violent': (-0.8, 1.0, False),
+    'violently': (-0.8, 1.0, True),
+    'visual': (0.0, 1.0, False),
+    'visually': (0.0, 1.0, True),
+    'vital': (0.1, 1.0, False),
+    'vitally': (0.1, 1.0, True),
+    'vivid': (0.125, 1.0, False),
+    'vividly': (0.125, 1.0, True),
+    'vocational': (0.3, 1.0, False),
+    'vocationally': (0.3, 1.0, True),
+    'vulgar': (-0.7, 1.0, False),
+    'vulgarly': (-0.7, 1.0, True),
+    'vulnerable': (-0.5, 1.0, False),
+    'vulnerably': (-0.5, 1.0, True),
+    'wackily': (0.5, 1.0, True),
+    'wacky': (0.5, 1.0, False),
+    'wan': (-0.2, 1.0, False),
+    'wanly': (-0.2, 1.0, True),
+    'wants': (0.2, 1.0, False),
+    'warily': (-0.5, 1.0, True),
+    'warm': (0.6, 1.0, False),
+    'warmly': (0.6, 1.0, True),
+    'wary': (-0.5, 1.0, False),
+    'waste': (-0.2, 1.0, False),
+    'wasted': (-0.2, 1.0, False),
+    'wastes': (-0.2, 1.0, False),
+    'weak': (-0.375, 1.0, False),
+    'weakly': (-0.375, 1.0, True),
+    'wealthily': (0.5, 1.0, True),
+    'wealthy': (0.5, 1.0, False),
+    'weird': (-0.5, 1.0, False),
+    'weirdly': (-0.5, 1.0, True),
+    'welcome': (0.8, 1.0, False),
+    'welcomely': (0.8, 1.0, True),
+    'well-advised': (0.6, 1.0, False),
+    'well-advisedly': (0.6, 1.0, True),
+    'well-intentioned': (-0.05, 1.0, False),
+    'well-intentionedly': (-0.05, 1.0, True),
+    'well-off': (0.4, 1.0, False),
+    'well-offly': (0.4, 1.0, True),
+    'western': (0.0, 1.0, False),
+    'westernly': (0.0, 1.0, True),
+    'wet': (-0.1, 1.0, False),
+    'wetly': (-0.1, 1.0, True),
+    'whaddupwitdat': (-0.1, 1.0, False),
+    'whimsical': (-0.5, 1.0, False),
+    'whimsically': (-0.5, 1.0, True),
+    'white': (0.0, 1.0, False),
+    'whitely': (0.0, 1.0, True),
+    'whole': (0.2, 1.0, False),
+    'wholy': (0.2, 1.0, True),
+    'wide': (-0.1, 1.0, False),
+    'widely': (-0.1, 1.0, True),
+    'wild': (0.1, 1.0, False),
+    'wildly': (0.1, 1.0, True),
+    'willing': (0.25, 1.0, False),
+    'willingly': (0.25, 1.0, True),
+    'win': (0.8, 1.0, False),
+    'winning': (0.5, 1.0, False),
+    'winningly': (0.5, 1.0, True),
+    'wins': (0.3, 1.0, False),
+    'wise': (0.7, 1.0, False),
+    'wisely': (0.7, 1.0, True),
+    'wittily': (0.5, 1.0, True),
+    'witty': (0.5, 1.0, False),
+    'womanlily': (0.0, 1.0, True),
+    'womanly': (0.0, 1.0, False),
+    "won't": (-0.1, 1.0, False),
+    'wonderful': (1.0, 1.0, False),
+    'wonderfully': (1.0, 1.0, True),
+    'wonkily': (-0.3, 1.0, True),
+    'wonky': (-0.3, 1.0, False),
+    'wooden': (0.0, 1.0, False),
+    'woodenly': (0.0, 1.0, True),
+    'workmanlike': (0.5, 1.0, False),
+    'workmanlikely': (0.5, 1.0, True),
+    'worse': (-0.4, 1.0, False),
+    'worsely': (-0.4, 1.0, True),
+    'worst': (-1.0, 1.0, False),
+    'worstly': (-1.0, 1.0, True),
+    'worth': (0.3, 1.0, False),
+    'worthily': (0.3333, 1.0, True),
+    'worthless': (-0.8, 1.0, False),
+    'worthlessly': (-0.8, 1.0, True),
+    'worthly': (0.3, 1.0, True),
+    'worthwhile': (0.5, 1.0, False),
+    'worthwhily': (0.5, 1.0, True),
+    'worthy': (0.3333, 1.0, False),
+    'wow': (0.1, 1.0, False),
+    'wrong': (-0.5, 1.0, False),
+    'wrongly': (-0.5, 1.0, True),
+    'wtf': (-0.5, 1.0, False),
+    'yaaawwnnnn': (-0.5, 1.0, False),
+    'yarn': (-0.1, 1.0, False),
+    'yellow': (0.0, 1.0, False),
+    'yellowly': (0.0, 1.0, True),
+    'young': (0.1, 1.0, False),
+    'younger': (0.0, 1.0, False),
+    'youngerly': (0.0, 1.0, True),
+    'youngish': (0.4, 1.0, False),
+    'youngishly': (0.4, 1.0, True),
+    'youngly': (0.1, 1.0, True),
+}
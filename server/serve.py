@@ -0,0 +1,212 @@
+import argparse
+import gc
+import os
+import random
+import signal
+import socket
+import sys
+import time
+
+# Add the server directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from werkzeug.serving import BaseWSGIServer, WSGIRequestHandler
+
+
+class PreforkRequestHandler(WSGIRequestHandler):
+    # One request per connection, so an idle keep-alive client never pins a single-threaded worker
+    protocol_version = 'HTTP/1.0'
+
+
+class WorkerServer(BaseWSGIServer):
+    """Single-threaded WSGI server that accepts from a listening socket shared with its siblings"""
+
+    multiprocess = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.handled = 0
+
+    def process_request(self, request, client_address):
+        self.handled += 1
+        super().process_request(request, client_address)
+
+
+def default_worker_count():
+    """Worker count from WEB_CONCURRENCY or the CPUs this process may run on"""
+    if os.environ.get('WEB_CONCURRENCY'):
+        return int(os.environ['WEB_CONCURRENCY'])
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def run_worker(app, sock, max_requests, on_exit=None):
+    """Serve from the shared socket until told to drain or until max_requests is reached, then run on_exit"""
+    state = {'running': True}
+
+    def drain(signum, frame):
+        state['running'] = False
+        app.config['READY'] = False
+
+    signal.signal(signal.SIGTERM, drain)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl-C is handled by the arbiter
+    signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+    host, port = sock.getsockname()[:2]
+    server = WorkerServer(host, port, app, handler=PreforkRequestHandler, fd=sock.fileno())
+    server.socket.setblocking(False)  # siblings race for accept(); losers just go back to select()
+    server.timeout = 0.5
+
+    while state['running'] and (not max_requests or server.handled < max_requests):
+        server.handle_request()
+
+    server.socket.close()
+    # os._exit skips atexit, so flush write-behind queues and indexes explicitly first
+    if on_exit is not None:
+        on_exit()
+    os._exit(0)
+
+
+class PreforkServer:
+    """Arbiter that preloads the app, forks workers and keeps the pool at size"""
+
+    def __init__(self, app, host='0.0.0.0', port=5000, workers=None, max_requests=1000,
+                 max_requests_jitter=100, graceful_timeout=30, backlog=2048, on_worker_exit=None):
+        self.app = app
+        # Called in each worker after its last request, before it exits
+        self.on_worker_exit = on_worker_exit
+        self.host = host
+        self.port = port
+        self.worker_count = workers or default_worker_count()
+        self.max_requests = max_requests
+        self.max_requests_jitter = max_requests_jitter
+        self.graceful_timeout = graceful_timeout
+        self.backlog = backlog
+        self.workers = {}
+        self.sock = None
+        self.stopping = False
+        self.reload_requested = False
+
+    def spawn_worker(self):
+        # Jitter the recycle point so workers do not all restart at once
+        max_requests = self.max_requests
+        if max_requests and self.max_requests_jitter:
+            max_requests += random.randint(0, self.max_requests_jitter)
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_worker(self.app, self.sock, max_requests, self.on_worker_exit)
+            finally:
+                os._exit(1)
+        self.workers[pid] = time.time()
+        return pid
+
+    def reap_workers(self):
+        while self.workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.workers.clear()
+                return
+            if pid == 0:
+                return
+            self.workers.pop(pid, None)
+
+    def signal_workers(self, pids, signum):
+        for pid in pids:
+            try:
+                os.kill(pid, signum)
+            except ProcessLookupError:
+                self.workers.pop(pid, None)
+
+    def handle_stop(self, signum, frame):
+        self.stopping = True
+
+    def handle_reload(self, signum, frame):
+        self.reload_requested = True
+
+    def run(self):
+        """Bind, fork the pool and supervise it until SIGTERM/SIGINT"""
+        self.sock = socket.create_server((self.host, self.port), backlog=self.backlog)
+        self.sock.setblocking(False)
+
+        # Keep the preloaded validator and lookup tables out of future GC passes so the
+        # pages they live on stay shared copy-on-write between workers
+        gc.collect()
+        gc.freeze()
+
+        signal.signal(signal.SIGTERM, self.handle_stop)
+        signal.signal(signal.SIGINT, self.handle_stop)
+        signal.signal(signal.SIGHUP, self.handle_reload)
+
+        print(f"🌐 Prefork server on http://{self.host}:{self.port} with {self.worker_count} workers (pid {os.getpid()})")
+
+        while not self.stopping:
+            self.reap_workers()
+
+            if self.reload_requested:
+                # Rolling restart: bring up a fresh generation, then drain the old one
+                self.reload_requested = False
+                old_generation = list(self.workers)
+                for _ in range(self.worker_count):
+                    self.spawn_worker()
+                self.signal_workers(old_generation, signal.SIGTERM)
+
+            # Replace workers that were recycled or crashed
+            while len(self.workers) < self.worker_count and not self.stopping:
+                self.spawn_worker()
+
+            time.sleep(0.2)
+
+        self.shutdown()
+
+    def shutdown(self):
+        """Let workers finish in-flight requests, then kill stragglers"""
+        self.signal_workers(list(self.workers), signal.SIGTERM)
+        deadline = time.time() + self.graceful_timeout
+        while self.workers and time.time() < deadline:
+            self.reap_workers()
+            time.sleep(0.1)
+        self.signal_workers(list(self.workers), signal.SIGKILL)
+        self.reap_workers()
+        self.sock.close()
+        print("👋 Prefork server stopped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Preforking production server for the ML backend')
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=int(os.environ.get('PORT', 5000)))
+    parser.add_argument('--workers', type=int, default=None,
+                        help='worker processes (default: WEB_CONCURRENCY or available CPUs)')
+    parser.add_argument('--max-requests', type=int, default=1000,
+                        help='recycle a worker after this many requests (0 disables)')
+    parser.add_argument('--max-requests-jitter', type=int, default=100)
+    parser.add_argument('--graceful-timeout', type=int, default=30,
+                        help='seconds to wait for in-flight requests on shutdown')
+    args = parser.parse_args()
+
+    # Build the validator and its lookup tables once, before forking
+    from app import app, print_startup_report, shutdown_services
+    from ml_validator import ml_validator
+    ml_validator.warm_up()
+
+    print("🚀 Starting StartupValidator ML Backend (prefork)...")
+    print_startup_report()
+
+    PreforkServer(
+        app,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        max_requests=args.max_requests,
+        max_requests_jitter=args.max_requests_jitter,
+        graceful_timeout=args.graceful_timeout,
+        on_worker_exit=shutdown_services
+    ).run()
+
+
+if __name__ == '__main__':
+    main()
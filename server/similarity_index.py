@@ -0,0 +1,286 @@
+import atexit
+import logging
+import os
+import pickle
+import queue
+import threading
+
+from lazy_imports import lazy_import
+
+np = lazy_import('numpy')
+sparse = lazy_import('scipy.sparse')
+sklearn_text = lazy_import('sklearn.feature_extraction.text')
+
+logger = logging.getLogger(__name__)
+
+
+# Form fields add() reads; queued adds keep only these
+INDEXED_FIELDS = ('problemStatement', 'solutionDescription', 'id', 'startupTitle')
+
+
+def similarity_text(data):
+    """The text a startup is compared on: its problem statement and solution"""
+    return f"{data.get('problemStatement', '') or ''} {data.get('solutionDescription', '') or ''}".strip()
+
+
+class SimilarityIndex:
+    """Persistent TF-IDF index over validated startups' problem/solution text
+
+    The index keeps the max_entries most recently added startups; older rows are dropped
+    in chunks of evict_fraction of the cap. Entries hold only an id, a title and the
+    result-cache key, never whole results.
+    """
+
+    def __init__(self, path=None, max_features=1000, refit_growth=2.0, save_every=100, read_only=False,
+                 max_entries=10000, evict_fraction=0.1, max_queue=1000):
+        self.path = path
+        # A read-only index answers queries but ignores adds, e.g. a prebuilt index or a benchmark run
+        self.read_only = read_only
+        self.max_features = max_features
+        # Refit the vocabulary once the corpus has grown by this factor since the last fit
+        self.refit_growth = refit_growth
+        self.save_every = save_every
+        self.max_entries = max_entries
+        self.evict_fraction = evict_fraction
+        # Queued adds beyond this are dropped rather than buffered without bound
+        self.max_queue = max_queue
+
+        self.vectorizer = None
+        self.matrix = None          # L2-normalised TF-IDF rows, so a dot product is cosine similarity
+        self.pending_rows = []      # rows transformed since the last vstack
+        self.texts = []
+        self.entries = []           # per row: {'id', 'title', 'key'}
+        self.row_by_key = {}
+        self.fitted_size = 0
+        self.unsaved = 0
+        self.stats_counts = {'evicted': 0, 'dropped': 0, 'failed': 0}
+
+        self.lock = threading.RLock()
+        self.updates = None
+        self.updater = None
+
+        if path and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def fit(self):
+        """(Re)fit the vocabulary and IDF weights on every indexed text"""
+        with self.lock:
+            vectorizer = sklearn_text.TfidfVectorizer(max_features=self.max_features, stop_words='english')
+            try:
+                self.matrix = vectorizer.fit_transform(self.texts).tocsr()
+            except ValueError:
+                # Only stop words so far; try again on the next add
+                self.vectorizer = None
+                return
+            self.vectorizer = vectorizer
+            self.pending_rows = []
+            self.fitted_size = len(self.texts)
+
+    def _rows(self):
+        if self.pending_rows:
+            self.matrix = sparse.vstack([self.matrix] + self.pending_rows, format='csr')
+            self.pending_rows = []
+        return self.matrix
+
+    def add(self, key, data, entry_id=None):
+        """Index one validated startup; key (the input hash) de-duplicates re-submissions
+
+        key is also the result-cache key that find_duplicate hands back.
+        """
+        text = similarity_text(data)
+        if not text or self.read_only:
+            return False
+
+        with self.lock:
+            if key in self.row_by_key:
+                return False
+
+            self.row_by_key[key] = len(self.entries)
+            self.texts.append(text)
+            self.entries.append({
+                'id': entry_id or data.get('id') or key,
+                'title': data.get('startupTitle') or text[:80],
+                'key': key
+            })
+
+            if self.max_entries and len(self.entries) > self.max_entries:
+                self._evict(len(self.entries) - self.max_entries + int(self.max_entries * self.evict_fraction))
+
+            if self.vectorizer is None or len(self.texts) >= self.fitted_size * self.refit_growth:
+                self.fit()
+            else:
+                # Vocabulary stays fixed between refits, so adding a row is just one transform
+                self.pending_rows.append(self.vectorizer.transform([text]))
+
+            self.unsaved += 1
+            if self.path and self.unsaved >= self.save_every:
+                self.save()
+        return True
+
+    def _evict(self, count):
+        # Drop the count oldest rows; the vocabulary is kept until the next refit
+        count = min(count, len(self.entries))
+        rows = self._rows() if self.vectorizer is not None else None
+        del self.texts[:count]
+        del self.entries[:count]
+        self.row_by_key = {entry['key']: row for row, entry in enumerate(self.entries)}
+        if rows is not None:
+            self.matrix = rows[count:]
+        # fitted_size counts the rows the vocabulary was fitted on that are still indexed, so a
+        # capped index still refits once enough of it has turned over
+        self.fitted_size = max(self.fitted_size - count, 0)
+        self.stats_counts['evicted'] += count
+
+    def add_async(self, key, data):
+        """Queue an add on a background thread so the request path never waits on the index"""
+        if self.read_only:
+            return
+        if self.updater is None:
+            with self.lock:
+                if self.updater is None:
+                    self.updates = queue.Queue(maxsize=self.max_queue)
+                    self.updater = threading.Thread(target=self._apply_updates, daemon=True)
+                    self.updater.start()
+                    atexit.register(self.close)
+        # Only the two compared fields are kept while queued
+        try:
+            self.updates.put_nowait((key, {field: data.get(field) for field in INDEXED_FIELDS}))
+        except queue.Full:
+            with self.lock:
+                self.stats_counts['dropped'] += 1
+
+    def _apply(self, item):
+        try:
+            self.add(*item)
+        except Exception:
+            # The index is best-effort; a failed add must not kill the updater
+            with self.lock:
+                self.stats_counts['failed'] += 1
+            logger.exception('Similarity index update failed')
+
+    def _apply_updates(self):
+        while True:
+            item = self.updates.get()
+            try:
+                if item is None:
+                    return
+                self._apply(item)
+            finally:
+                self.updates.task_done()
+
+    def warm_up(self):
+        """Import scikit-learn and SciPy up front instead of on the first indexed validation"""
+        sklearn_text.TfidfVectorizer
+        sparse.csr_matrix
+
+    def nearest(self, data, k):
+        """[(row, cosine similarity)] for the k nearest rows, best first"""
+        text = similarity_text(data)
+        with self.lock:
+            if not text or self.vectorizer is None:
+                return []
+            rows = self._rows()
+            query = self.vectorizer.transform([text])
+            scores = (rows @ query.T).toarray().ravel()
+
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(i), float(scores[i])) for i in top]
+
+    def similar(self, data, k=5, min_similarity=0.0):
+        """Top-k most similar indexed startups as [{'id', 'title', 'similarity'}]"""
+        return [
+            {
+                'id': self.entries[row]['id'],
+                'title': self.entries[row]['title'],
+                'similarity': round(score, 4)
+            }
+            for row, score in self.nearest(data, k) if score > min_similarity
+        ]
+
+    def find_duplicate(self, data, threshold=0.97):
+        """Best match at or above threshold, with the result-cache key it was indexed under, or None"""
+        matches = self.nearest(data, 1)
+        if not matches or matches[0][1] < threshold:
+            return None
+        row, score = matches[0]
+        entry = self.entries[row]
+        return {'id': entry['id'], 'title': entry['title'], 'similarity': round(score, 4), 'key': entry['key']}
+
+    def save(self, path=None):
+        """Write the index atomically to disk"""
+        path = path or self.path
+        with self.lock:
+            state = {
+                'max_features': self.max_features,
+                'vectorizer': self.vectorizer,
+                'matrix': self._rows() if self.vectorizer is not None else None,
+                'texts': self.texts,
+                'entries': self.entries,
+                'row_by_key': self.row_by_key,
+                'fitted_size': self.fitted_size
+            }
+            tmp_path = f'{path}.tmp'
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            self.unsaved = 0
+
+    def load(self, path):
+        """Restore a saved index"""
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        with self.lock:
+            self.max_features = state['max_features']
+            self.vectorizer = state['vectorizer']
+            self.matrix = state['matrix']
+            self.texts = state['texts']
+            self.row_by_key = state['row_by_key']
+            # Indexes saved before entries carried their key also held whole results
+            keys = {row: key for key, row in self.row_by_key.items()}
+            self.entries = [{'id': entry['id'], 'title': entry['title'], 'key': entry.get('key', keys.get(row))}
+                            for row, entry in enumerate(state['entries'])]
+            self.fitted_size = state['fitted_size']
+            self.pending_rows = []
+            if self.max_entries and len(self.entries) > self.max_entries:
+                self._evict(len(self.entries) - self.max_entries)
+
+    def close(self):
+        """Apply every queued update, stop the updater and persist"""
+        with self.lock:
+            updater, self.updater = self.updater, None
+        if updater is not None:
+            # The daemon updater would be killed mid-queue at exit, so wait for it to finish
+            self.updates.put(None)
+            updater.join()
+            # Adds queued after the sentinel are applied here
+            while True:
+                try:
+                    item = self.updates.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    self._apply(item)
+                self.updates.task_done()
+        if self.path and self.unsaved and not self.read_only:
+            self.save()
+
+    def stats(self):
+        """Index size and fit state"""
+        with self.lock:
+            return {
+                'size': len(self.entries),
+                'max_entries': self.max_entries,
+                'queued': self.updates.qsize() if self.updater is not None else 0,
+                **self.stats_counts,
+                'fitted_size': self.fitted_size,
+                'vocabulary': len(self.vectorizer.vocabulary_) if self.vectorizer is not None else 0,
+                'persistent': bool(self.path),
+                'read_only': self.read_only
+            }
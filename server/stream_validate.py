@@ -0,0 +1,107 @@
+import argparse
+import json
+import os
+import sys
+import time
+from itertools import islice
+
+# Add the server directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from json_codec import loads
+
+DEFAULT_BATCH_SIZE = 256
+
+
+class StreamStats:
+    """Running totals for one streaming validation pass"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.records = 0
+        self.failed = 0
+
+    def summary(self):
+        seconds = time.perf_counter() - self.started
+        return {
+            'records': self.records,
+            'failed': self.failed,
+            'seconds': round(seconds, 3),
+            'records_per_second': round(self.records / seconds, 1) if seconds > 0 else 0.0
+        }
+
+
+def parse_lines(lines):
+    """Lazily turn NDJSON lines (str or bytes) into (line_number, record_or_error) pairs"""
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_number, loads(line)
+        except ValueError as e:
+            yield line_number, {'__error__': f'Invalid JSON: {e}'}
+
+
+def stream_validate(lines, validator, batch_size=DEFAULT_BATCH_SIZE, stats=None):
+    """Score NDJSON lines in micro-batches, yielding one output dict per input record in order"""
+    stats = stats if stats is not None else StreamStats()
+    parsed = parse_lines(lines)
+
+    while True:
+        batch = list(islice(parsed, batch_size))
+        if not batch:
+            break
+
+        valid = [(n, record) for n, record in batch if not (isinstance(record, dict) and '__error__' in record)]
+        results = iter(validator.validate_batch([record for _, record in valid]))
+        valid_lines = {n for n, _ in valid}
+
+        for line_number, record in batch:
+            if line_number in valid_lines:
+                result = next(results)
+            else:
+                result = {'success': False, 'error': record['__error__']}
+
+            output = {'line': line_number}
+            if isinstance(record, dict) and record.get('id') is not None:
+                output['id'] = record['id']
+            output['result'] = result
+
+            stats.records += 1
+            if not result.get('success'):
+                stats.failed += 1
+            yield output
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Stream NDJSON startup records through the validator')
+    parser.add_argument('input', nargs='?', default='-', help='NDJSON file of validation forms (default: stdin)')
+    parser.add_argument('-o', '--output', default='-', help='NDJSON file for results (default: stdout)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    from ml_validator import ml_validator
+
+    source = sys.stdin if args.input == '-' else open(args.input, encoding='utf-8')
+    sink = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    stats = StreamStats()
+
+    try:
+        for output in stream_validate(source, ml_validator, args.batch_size, stats):
+            sink.write(json.dumps(output) + '\n')
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+        # Index everything queued during the run before the interpreter starts shutting down
+        ml_validator.similarity_index.close()
+
+    summary = stats.summary()
+    print(f"✅ {summary['records']} records ({summary['failed']} failed) in {summary['seconds']}s "
+          f"- {summary['records_per_second']} records/s", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+import random
+
+# Values the validation wizard offers for its select fields
+MARKET_SIZES = ('local', 'national', 'international', 'global')
+REVENUE_MODELS = ('subscription', 'marketplace', 'freemium', 'one-time', 'advertising', 'licensing', 'other')
+TEAM_SIZES = ('solo', '2-3', '4-6', '7-10', '10+')
+STAGES = ('idea', 'prototype', 'beta', 'early-revenue', 'growth')
+
+# Sentence fragments per free-text field, mixing analyzer keywords with filler so scores vary
+FRAGMENTS = {
+    'problemStatement': (
+        'small businesses struggle to track cash flow', 'the current process is slow and expensive',
+        'teams waste hours on manual data entry', 'customers face a frustrating onboarding issue',
+        'there is a clear pain point for busy parents', 'existing tools are difficult to use'
+    ),
+    'solutionDescription': (
+        'an AI platform that automates bookkeeping', 'a mobile app that connects local providers',
+        'a simple dashboard for real-time insights', 'software that integrates with existing tools',
+        'a marketplace matching freelancers with projects', 'a subscription service delivered monthly'
+    ),
+    'uniqueValueProposition': (
+        'unique proprietary models', 'ten times faster than manual work', 'cheaper than incumbents',
+        'a better experience for first-time users', 'innovative pricing with no lock-in'
+    ),
+    'targetMarket': (
+        'small business owners in retail', 'enterprise finance teams', 'consumers aged 25 to 40',
+        'independent professionals and freelancers', 'schools and education providers'
+    ),
+    'customerSegments': (
+        'early adopters in tech-savvy cities', 'mid-market companies with 50 to 500 employees',
+        'budget-conscious individual users', 'corporate procurement teams'
+    ),
+    'pricingStrategy': (
+        'tiered monthly plans from $19 to $99', 'a free tier with paid upgrades', 'usage-based pricing',
+        'annual contracts with volume discounts'
+    ),
+    'keyMetrics': (
+        'monthly recurring revenue', 'customer acquisition cost', 'churn rate below 3%',
+        'weekly active users', 'net promoter score'
+    ),
+    'directCompetitors': ('QuickBooks', 'Xero', 'FreshBooks', 'Wave', 'Zoho Books'),
+    'indirectCompetitors': ('spreadsheets', 'accountants', 'in-house tools', 'paper records'),
+    'competitiveAdvantage': (
+        'proprietary data from partnerships', 'a patent-pending matching algorithm',
+        'exclusive distribution deals', 'a unique community-driven approach', 'network effects'
+    ),
+    'foundersExperience': (
+        'ten years of software engineering', 'former product manager at a fintech startup',
+        'previous exit in e-commerce', 'deep technical background in machine learning'
+    ),
+    'keySkills': (
+        'programming and data science', 'sales and business development', 'design and marketing',
+        'technical architecture and development'
+    ),
+    'existingTraction': (
+        '200 beta users on the waitlist', '$5k monthly revenue', 'three pilot customers',
+        'letters of intent from two enterprises'
+    ),
+    'fundingNeeds': (
+        'raising $500k seed to hire engineers', 'bootstrapped and profitable', 'seeking $2M for expansion',
+        'a small angel round to finish the MVP'
+    ),
+}
+
+FILLER = ('and', 'with', 'because', 'which means', 'while', 'so that', 'across', 'for')
+ENDINGS = ('.', '.', '.', '!', '?')
+
+TEXT_FIELDS = tuple(FRAGMENTS)
+
+
+def generate_text(rng, field, length):
+    """Roughly `length` characters of plausible text for a form field (empty when length is 0)"""
+    if length <= 0:
+        return ''
+    sentences = []
+    size = 0
+    while size < length:
+        words = [rng.choice(FRAGMENTS[field])]
+        for _ in range(rng.randint(0, 2)):
+            words += [rng.choice(FILLER), rng.choice(FRAGMENTS[field])]
+        sentence = ' '.join(words)
+        sentence = sentence[0].upper() + sentence[1:] + rng.choice(ENDINGS)
+        sentences.append(sentence)
+        size += len(sentence) + 1
+    return ' '.join(sentences)[:length]
+
+
+def generate_form(rng, length=None):
+    """One validation form; every text field gets `length` characters, or a realistic random length"""
+    form = {
+        'startupTitle': f'Startup {rng.randint(1, 10 ** 6)}',
+        'marketSize': rng.choice(MARKET_SIZES),
+        'revenueModel': rng.choice(REVENUE_MODELS),
+        'teamSize': rng.choice(TEAM_SIZES),
+        'currentStage': rng.choice(STAGES),
+    }
+    for field in TEXT_FIELDS:
+        field_length = length if length is not None else rng.choice((0, 40, 120, 300, 800))
+        form[field] = generate_text(rng, field, field_length)
+    return form
+
+
+def generate_forms(count, seed=0, length=None):
+    """A reproducible list of forms for a given seed"""
+    rng = random.Random(seed)
+    return [generate_form(rng, length) for _ in range(count)]
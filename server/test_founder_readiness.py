@@ -0,0 +1,56 @@
+import sqlite3
+
+from founder_readiness import TEAM_ITEM, FounderReadiness
+from ml_validator import ml_validator
+
+ANSWERS = {
+    'foundersExperience': 'Led a team of eight engineers and managed the product roadmap for three years',
+    'keySkills': 'Software architecture, data engineering and sales',
+    'motivation': 'I started two side projects and learned from the failure of the first',
+    'network': 'Two advisors and an accelerator mentor who introduced us to investors'
+}
+
+
+def test_null_answers_read_as_unanswered():
+    engine = FounderReadiness(ml_validator)
+    with_nulls = engine.assess(dict(ANSWERS, setbacks=None, answers={'mentors': None}))['assessment']
+    without = engine.assess(ANSWERS)['assessment']
+    assert with_nulls['categories'] == without['categories']
+    assert with_nulls['answered'] == without['answered'] == len(ANSWERS)
+
+
+def test_reassessment_only_rescores_changed_answers():
+    engine = FounderReadiness(ml_validator)
+    first = engine.assess(dict(ANSWERS, founderId='founder-1'))
+    assert sorted(first['assessment']['rescored']) == sorted(list(ANSWERS) + [TEAM_ITEM])
+
+    second = engine.assess({'founderId': 'founder-1', 'answers': {'mentors': 'A mentor from our incubator'}})
+    assert second['assessment']['rescored'] == ['mentors']
+    assert second['revision'] == 2
+    assert second['assessment']['answered'] == len(ANSWERS) + 1
+
+    # A changed team answer rescores that answer and the team item built from it
+    third = engine.assess({'founderId': 'founder-1', 'keySkills': 'Growth marketing'})
+    assert sorted(third['assessment']['rescored']) == ['keySkills', TEAM_ITEM]
+
+
+def test_assessments_are_stored_and_restore_the_profile(tmp_path):
+    path = str(tmp_path / 'founders.db')
+    engine = FounderReadiness(ml_validator, path=path)
+    engine.assess(dict(ANSWERS, founderId='founder-2', startupId='startup-2'))
+    stored = engine.assess({'founderId': 'founder-2', 'answers': {'mentors': 'A mentor from our incubator'}})
+
+    rows = sqlite3.connect(path).execute(
+        "SELECT user_id, startup_id, overall_score FROM founder_assessments ORDER BY assessed_at"
+    ).fetchall()
+    assert [row[:2] for row in rows] == [('founder-2', 'startup-2'), ('founder-2', None)]
+    assert rows[-1][2] == stored['assessment']['overall_score']
+
+    # Another worker restores the profile from the latest assessment without rescoring anything
+    restored = FounderReadiness(ml_validator, path=path)
+    latest = restored.latest('founder-2')
+    assert latest['revision'] == 2
+    assert latest['assessment']['categories'] == stored['assessment']['categories']
+    assert restored.stats()['restored'] == 1
+    assert restored.stats()['items_scored'] == 0
+    assert restored.latest('someone-else') is None
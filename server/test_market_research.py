@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+from market_research import ALL, MarketResearch
+from response_templates import SCORE_CATEGORIES
+from validation_store import SQLiteBackend, validation_row
+
+RESULT = {
+    'success': True,
+    'overall_score': 64,
+    'viability_level': 'Moderate',
+    'scores': [{'category': name, 'score': 64} for _, name in SCORE_CATEGORIES]
+}
+
+FINTECH_FORM = {'problemStatement': 'Freelancers wait weeks for payment', 'currentStage': 'mvp',
+                'marketSize': 'global', 'revenueModel': 'subscription'}
+
+
+@pytest.fixture
+def store(tmp_path):
+    """A validations backend whose inserts update the summaries of an engine on the same file"""
+    path = str(tmp_path / 'market.db')
+    backend = SQLiteBackend(path)
+    engine = MarketResearch(path)
+    backend.listeners.append(engine)
+    backend.connect()
+    yield backend, engine
+    backend.close()
+
+
+def row(form, input_data_hash):
+    return validation_row(form, RESULT, input_data_hash, '2.0')
+
+
+def summaries(conn):
+    return sorted(summary[:-1] for summary in conn.execute('SELECT * FROM market_summaries'))
+
+
+def test_incremental_summaries_match_a_rebuild(store):
+    backend, engine = store
+    forms = [
+        dict(FINTECH_FORM, marketSize=size, currentStage=stage)
+        for size in ('global', 'national', 'local') for stage in ('mvp', 'beta')
+    ]
+    backend.insert([row(form, f'hash-{i}') for i, form in enumerate(forms[:4])])
+    backend.insert([row(form, f'hash-{i + 4}') for i, form in enumerate(forms[4:])] + [row(forms[0], 'hash-0')])
+
+    incremental = summaries(backend.conn)
+    engine.rebuild(backend.conn)
+    assert summaries(backend.conn) == incremental
+
+
+def test_resubmitted_form_counts_as_one_startup(store):
+    backend, engine = store
+    for _ in range(3):
+        backend.insert([row(FINTECH_FORM, 'same-form')])
+    report = json.loads(engine.lookup('FinTech', 'mvp')[0])
+    assert report['aggregates']['startups'] == 1
+    assert report['aggregates']['validations'] == 3
+    assert report['market_data']['competitive_landscape']['direct_competitors'] == 1
+
+
+def test_report_segments_come_from_the_summaries(store):
+    backend, engine = store
+    sizes = ('global', 'global', 'national', 'local')
+    backend.insert([row(dict(FINTECH_FORM, marketSize=size), f'hash-{i}') for i, size in enumerate(sizes)])
+    market_data = json.loads(engine.lookup('FinTech', ALL)[0])['market_data']
+    assert market_data['customer_segments'] == {
+        'primary': 'Global customers (50% of startups)',
+        'secondary': 'Local (city/region) customers (25% of startups)',
+        'tertiary': 'National customers (25% of startups)',
+        'other': 'Other reach (0% of startups)'
+    }
+    assert market_data['placeholders'] == ['market_size', 'growth_projections']
+
+
+def test_default_payload_is_marked_as_placeholder(tmp_path):
+    market_data = json.loads(MarketResearch(str(tmp_path / 'empty.db')).lookup()[0])['market_data']
+    assert set(market_data['placeholders']) == {
+        'market_size', 'customer_segments', 'competitive_landscape', 'market_trends', 'growth_projections'
+    }
@@ -0,0 +1,102 @@
+import os
+
+os.environ['RATE_LIMIT_PER_SECOND'] = '0'
+
+import pytest
+
+from rate_limiter import LocalBackend, RateLimited, RateLimiter, SQLiteBackend
+
+
+class Clock:
+    """Time that only moves when a test says so"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(params=['local', 'sqlite'])
+def backend(request, tmp_path):
+    backend = LocalBackend() if request.param == 'local' else SQLiteBackend(str(tmp_path / 'limits.db'))
+    backend.clock = Clock()
+    yield backend
+    backend.close()
+
+
+def limiter_for(backend, **options):
+    options = dict(dict(rate=2.0, burst=10.0, max_concurrent=0, costs={'/cheap': 1, '/heavy': 5, '/free': 0}), **options)
+    return RateLimiter(backend, **options)
+
+
+def admitted(limiter, client, rule, count):
+    allowed = 0
+    for _ in range(count):
+        try:
+            limiter.acquire(client, rule)
+            allowed += 1
+        except RateLimited:
+            pass
+    return allowed
+
+
+def test_burst_then_refill(backend):
+    limiter = limiter_for(backend)
+    assert admitted(limiter, 'addr:a', '/cheap', 15) == 10
+    backend.clock.now += 1.5
+    assert admitted(limiter, 'addr:a', '/cheap', 5) == 3
+
+
+def test_cost_weighting(backend):
+    limiter = limiter_for(backend)
+    assert admitted(limiter, 'addr:a', '/heavy', 5) == 2
+    assert admitted(limiter, 'addr:a', '/free', 50) == 50
+    # Unlisted rules cost default_cost, and buckets are per client
+    assert admitted(limiter, 'addr:b', '/unknown', 12) == 10
+
+
+def test_retry_after(backend):
+    limiter = limiter_for(backend)
+    admitted(limiter, 'addr:a', '/heavy', 2)
+    with pytest.raises(RateLimited) as error:
+        limiter.acquire('addr:a', '/heavy')
+    assert error.value.reason == 'rate'
+    assert error.value.retry_after == 3  # 5 tokens at 2 per second, rounded up
+    backend.clock.now += 2.5
+    limiter.acquire('addr:a', '/heavy')
+
+
+def test_concurrency_cap(backend):
+    limiter = limiter_for(backend, max_concurrent=2)
+    leases = [limiter.acquire('addr:a', '/cheap') for _ in range(2)]
+    with pytest.raises(RateLimited) as error:
+        limiter.acquire('addr:a', '/cheap')
+    assert error.value.reason == 'concurrency'
+    limiter.release(leases[0])
+    limiter.acquire('addr:a', '/cheap')
+    assert limiter.stats()['concurrency'] == 1
+
+
+def test_rotating_unknown_keys_share_the_address_bucket(backend):
+    limiter = limiter_for(backend, api_keys=['known'])
+    clients = {limiter.client_for(f'made-up-{i}', '10.0.0.1') for i in range(20)}
+    assert clients == {'addr:10.0.0.1'}
+    assert sum(admitted(limiter, limiter.client_for(f'made-up-{i}', '10.0.0.1'), '/cheap', 1) for i in range(20)) == 10
+    # A configured key has a bucket of its own
+    assert admitted(limiter, limiter.client_for('known', '10.0.0.1'), '/cheap', 12) == 10
+
+
+def test_app_ignores_unknown_api_keys(monkeypatch):
+    from app import app
+    from rate_limiter import rate_limiter
+
+    monkeypatch.setattr(rate_limiter, 'backend', LocalBackend())
+    monkeypatch.setattr(rate_limiter, 'rate', 1.0)
+    monkeypatch.setattr(rate_limiter, 'burst', 3.0)
+    client = app.test_client()
+    codes = [client.get('/api/health', headers={'X-API-Key': f'rotated-{i}'}).status_code for i in range(20)]
+    assert codes.count(200) == 3
+    response = client.get('/api/health')
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '1'
@@ -0,0 +1,56 @@
+import os
+
+# Keep the app's optional persistence and throttling out of the test process
+os.environ['RATE_LIMIT_PER_SECOND'] = '0'
+for variable in ('VALIDATION_STORE_URL', 'VALIDATION_CACHE_PATH', 'SIMILARITY_INDEX_PATH'):
+    os.environ.pop(variable, None)
+
+from app import app
+from ml_validator import SCORE_KEYS, ml_validator
+
+NULL_FIELDS_FORM = {
+    'problemStatement': 'Small clinics lose hours every week reconciling insurance claims by hand',
+    'solutionDescription': None,
+    'directCompetitors': None,
+    'foundersExperience': None,
+    'keySkills': None,
+    'uniqueValueProposition': None,
+    'competitiveAdvantage': None,
+    'targetMarket': None
+}
+
+QUADRANTS = ('strengths', 'weaknesses', 'opportunities', 'threats')
+
+
+def test_swot_signals_treat_null_fields_as_empty():
+    scores = dict.fromkeys(SCORE_KEYS, 40)
+    signals = ml_validator.swot_signals(scores, NULL_FIELDS_FORM)
+    assert signals == ml_validator.swot_signals(scores, {'problemStatement': NULL_FIELDS_FORM['problemStatement']})
+    assert 'unknown_competitors' in signals
+    assert 'no_technical_team' in signals
+
+
+def test_validate_include_swot_accepts_null_fields():
+    response = app.test_client().post('/api/validate?include=swot', json=NULL_FIELDS_FORM)
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['success']
+    assert all(body['swot_analysis'][quadrant] for quadrant in QUADRANTS)
+
+
+def test_generate_swot_accepts_the_same_null_fields():
+    client = app.test_client()
+    validated = client.post('/api/validate?include=swot', json=NULL_FIELDS_FORM).get_json()
+    response = client.post('/api/generate-swot', json=NULL_FIELDS_FORM)
+    assert response.status_code == 200
+    assert response.get_json()['swot_analysis'] == validated['swot_analysis']
+
+
+def test_generate_swot_still_rejects_non_string_fields():
+    response = app.test_client().post('/api/generate-swot', json=dict(NULL_FIELDS_FORM, directCompetitors=3))
+    assert response.status_code == 400
+
+
+def teardown_module():
+    # Finish the index update queued by the request before the interpreter shuts down
+    ml_validator.similarity_index.close()
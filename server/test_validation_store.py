@@ -0,0 +1,71 @@
+import json
+import sqlite3
+
+from validation_store import SQLiteBackend, ValidationStore
+
+RESULT = {
+    'success': True,
+    'overall_score': 72,
+    'viability_level': 'High',
+    'scores': [{'category': 'Market Opportunity', 'score': 72}],
+    'recommendations': ['Talk to ten customers'],
+    'timestamp': '2026-01-01T00:00:00'
+}
+
+
+def store_for(path, **options):
+    store = ValidationStore(SQLiteBackend(str(path)), **dict(dict(batch_size=10, flush_interval=0.05), **options))
+    store.first_retry_seconds = 0.01
+    return store
+
+
+def record(store, count):
+    for i in range(count):
+        store.record({'problemStatement': f'problem {i}'}, RESULT, f'hash-{i}', '2.0', processing_time_ms=12.4)
+
+
+def test_rows_are_written_by_close(tmp_path):
+    store = store_for(tmp_path / 'validations.db')
+    record(store, 25)
+    store.close()
+
+    stats = store.stats()
+    assert (stats['queued'], stats['written'], stats['dropped'], stats['pending']) == (25, 25, 0, 0)
+    rows = sqlite3.connect(tmp_path / 'validations.db').execute(
+        'SELECT overall_score, viability_level, recommendations, processing_time_ms, input_data_hash '
+        'FROM validations ORDER BY input_data_hash'
+    ).fetchall()
+    assert len(rows) == 25
+    assert rows[0] == (72, 'high', json.dumps(RESULT['recommendations']), 12, 'hash-0')
+
+
+def test_failed_connects_are_retried(tmp_path):
+    # The database directory does not exist yet, so connecting fails until it is created
+    path = tmp_path / 'later' / 'validations.db'
+    store = store_for(path)
+    record(store, 3)
+    for _ in range(500):
+        if store.stats()['failed_connects'] >= 2:
+            break
+        store.writer.join(0.01)
+    stats = store.stats()
+    assert stats['failed_connects'] >= 2
+    assert not stats['connected'] and stats['last_error']
+
+    path.parent.mkdir()
+    store.close()
+    stats = store.stats()
+    assert stats['written'] == 3
+    assert stats['last_error'] is None
+    assert sqlite3.connect(path).execute('SELECT COUNT(*) FROM validations').fetchone()[0] == 3
+
+
+def test_rows_are_dropped_and_counted_while_unreachable(tmp_path):
+    store = store_for(tmp_path / 'missing' / 'validations.db', batch_size=1, max_queue=2)
+    record(store, 5)
+    store.close()
+
+    stats = store.stats()
+    assert stats['written'] == 0
+    assert stats['dropped'] == 5
+    assert stats['failed_connects'] >= 1
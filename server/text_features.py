@@ -0,0 +1,75 @@
+import re
+
+# Characters preprocess_text strips before splitting a field into terms
+NON_TERM_RE = re.compile(r'[^a-zA-Z0-9\s]')
+
+# A sample of a long field: this many evenly spaced windows of about this many characters each
+SAMPLE_WINDOWS = 8
+SAMPLE_WINDOW_CHARS = 2000
+
+
+class TextFeatures:
+    """What the analyzers read from one form field, each part derived at most once per request
+
+    The lowercase form is shared by sentiment, keyword scans and terms. word_count,
+    unique_count and sentiment are only filled when the quality score missed the memo.
+    len() is the text length, so an instance is falsy exactly when its field is empty.
+
+    An approximate instance is a field too long to read word by word: everything but its
+    length is derived from sample_text, so its cost does not grow with the field.
+    """
+
+    __slots__ = ('text', 'sample', 'lower', 'length', 'word_count', 'unique_count', 'sentiment', 'quality',
+                 'terms', 'keywords', 'approximate')
+
+    def __init__(self, text, approximate=False):
+        self.length = len(text)
+        self.text = text
+        self.approximate = approximate
+        # The text the features are read from: the whole field, or evenly spaced windows of it
+        self.sample = sample_text(text) if approximate else text
+        self.lower = self.sample.lower()
+        self.word_count = None
+        self.unique_count = None
+        self.sentiment = None
+        self.quality = None
+        # Set of lowercase alphanumeric words, as preprocess_text(text).split() would give
+        self.terms = None
+        # Keyword group tuple -> keywords found, per scan the analyzers asked for
+        self.keywords = {}
+
+    def __len__(self):
+        return self.length
+
+    def term_set(self):
+        if self.terms is None:
+            self.terms = set(NON_TERM_RE.sub('', self.lower).split())
+        return self.terms
+
+
+# Shared by every empty (or None) field; nothing is ever filled in on it
+EMPTY_FEATURES = TextFeatures('')
+EMPTY_FEATURES.quality = 0
+EMPTY_FEATURES.terms = frozenset()
+
+
+def sample_text(text, windows=SAMPLE_WINDOWS, window_chars=SAMPLE_WINDOW_CHARS):
+    """Evenly spaced windows of text, the first at its start and the last at its end
+
+    Words cut by a window edge are dropped, and the words of a window are joined by single
+    spaces, windows by newlines. Text that fits in the windows is returned as is.
+    """
+    if len(text) <= windows * window_chars:
+        return text
+    stride = (len(text) - window_chars) // max(windows - 1, 1)
+    parts = []
+    for i in range(windows):
+        start = i * stride
+        end = start + window_chars
+        words = text[start:end].split()
+        if start and words and not text[start - 1].isspace() and not text[start].isspace():
+            words = words[1:]
+        if end < len(text) and words and not text[end - 1].isspace() and not text[end].isspace():
+            words = words[:-1]
+        parts.append(' '.join(words))
+    return '\n'.join(parts)
@@ -0,0 +1,164 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class ValidationCache:
+    """Bounded LRU/TTL cache of validation results with an optional SQLite spill store"""
+
+    def __init__(self, max_entries=1024, ttl_seconds=3600, db_path=None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.db = None
+        if db_path:
+            self.db = sqlite3.connect(db_path, check_same_thread=False)
+            self.db.execute(
+                'CREATE TABLE IF NOT EXISTS validation_cache ('
+                'input_data_hash TEXT PRIMARY KEY, result TEXT NOT NULL, created_at REAL NOT NULL)'
+            )
+            self.db.execute(
+                'DELETE FROM validation_cache WHERE created_at < ?', (time.time() - ttl_seconds,)
+            )
+            self.db.commit()
+            # SQLite connections must not be shared across fork(); give each worker its own
+            os.register_at_fork(after_in_child=self._reconnect)
+
+    def _reconnect(self):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(self.db_path, check_same_thread=False)
+
+    @staticmethod
+    def key_for(data, fields, version):
+        """Canonical SHA-256 of the form fields plus the algorithm version"""
+        canonical = json.dumps(
+            [version, [data.get(field, '') for field in fields]],
+            separators=(',', ':'), ensure_ascii=False, default=str
+        )
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Return a copy of the cached result for key, or None"""
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                created_at, result = entry
+                if now - created_at <= self.ttl_seconds:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return dict(result)
+                del self.entries[key]
+
+            if self.db is not None:
+                row = self.db.execute(
+                    'SELECT result, created_at FROM validation_cache WHERE input_data_hash = ?', (key,)
+                ).fetchone()
+                if row and now - row[1] <= self.ttl_seconds:
+                    result = json.loads(row[0])
+                    self._remember(key, row[1], result)
+                    self.disk_hits += 1
+                    return dict(result)
+
+            self.misses += 1
+            return None
+
+    def set(self, key, result):
+        """Store a result under key, writing through to the spill store if configured"""
+        created_at = time.time()
+        with self.lock:
+            self._remember(key, created_at, result)
+            if self.db is not None:
+                self.db.execute(
+                    'INSERT OR REPLACE INTO validation_cache (input_data_hash, result, created_at) VALUES (?, ?, ?)',
+                    (key, json.dumps(result), created_at)
+                )
+                self.db.commit()
+
+    def _remember(self, key, created_at, result):
+        self.entries[key] = (created_at, result)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every cached result, in memory and on disk"""
+        with self.lock:
+            self.entries.clear()
+            if self.db is not None:
+                self.db.execute('DELETE FROM validation_cache')
+                self.db.commit()
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self.lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self.entries),
+                'max_entries': self.max_entries,
+                'hit_rate': round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                'persistent': self.db is not None
+            }
+
+
+class FieldScoreCache:
+    """Bounded LRU memo of per-field text scores keyed by a digest of the field text"""
+
+    def __init__(self, max_entries=8192):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(text):
+        """Compact 128-bit digest so long fields are not kept alive as dict keys"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+    def get(self, text):
+        """Return the memoized score for text, or None"""
+        key = self.key_for(text)
+        with self.lock:
+            score = self.entries.get(key)
+            if score is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return score
+
+    def set(self, text, score):
+        """Memoize the score for text, evicting the least recently used entry when full"""
+        key = self.key_for(text)
+        with self.lock:
+            self.entries[key] = score
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def stats(self):
+        """Hit/miss counters and current size"""
+        with self.lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self.entries),
+                'max_entries': self.max_entries
+            }
@@ -0,0 +1,172 @@
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from datetime import datetime
+
+
+class QueueFull(Exception):
+    """Raised when the job queue is at its depth limit"""
+
+    def __init__(self, retry_after):
+        super().__init__('Validation job queue is full')
+        self.retry_after = retry_after
+
+
+def _init_worker():
+    from ml_validator import ml_validator
+    ml_validator.warm_up()
+
+
+def _run_validation(payload, is_batch):
+    """Executed in a pool process; returns the result and the time spent scoring it"""
+    from ml_validator import ml_validator
+    started = time.perf_counter()
+    if is_batch:
+        result = ml_validator.validate_batch(payload)
+    else:
+        result = ml_validator.validate_startup_idea(payload)
+    return result, (time.perf_counter() - started) * 1000
+
+
+class ValidationJobQueue:
+    """Bounded queue of validation jobs executed on a process pool and polled by id"""
+
+    def __init__(self, max_workers=None, max_pending=64, result_ttl=600):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        # Jobs live in the process that accepted them; behind the prefork server,
+        # polling clients need sticky routing to that worker
+        self.jobs = {}
+        # Reentrant: Future.cancel() runs done-callbacks (which take the lock) synchronously
+        self.lock = threading.RLock()
+        self.executor = None
+
+    def _get_executor(self):
+        # Created on first use so importing app.py (or forking workers) never starts processes
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=_init_worker
+            )
+            atexit.register(self.shutdown)
+        return self.executor
+
+    def _pending(self):
+        return sum(1 for job in self.jobs.values() if not job['future'].done())
+
+    def _expire(self, now):
+        expired = [job_id for job_id, job in self.jobs.items()
+                   if job['completed_at'] is not None and now - job['completed_at'] > self.result_ttl]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+    def submit(self, payload, is_batch=False):
+        """Queue a validation and return its job id, or raise QueueFull"""
+        now = time.time()
+        with self.lock:
+            self._expire(now)
+            if self._pending() >= self.max_pending:
+                raise QueueFull(retry_after=max(1, round(self.max_pending / self.max_workers)))
+
+            job_id = uuid.uuid4().hex
+            future = self._get_executor().submit(_run_validation, payload, is_batch)
+            self.jobs[job_id] = {
+                'future': future,
+                'is_batch': is_batch,
+                'submitted_at': now,
+                'completed_at': None,
+                'cancelled': False
+            }
+
+        future.add_done_callback(lambda _: self._mark_completed(job_id))
+        return job_id
+
+    def _mark_completed(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is not None and job['completed_at'] is None:
+                job['completed_at'] = time.time()
+
+    def status(self, job_id):
+        """Return the public view of a job, or None if it is unknown or expired"""
+        with self.lock:
+            self._expire(time.time())
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            future = job['future']
+
+            view = {
+                'id': job_id,
+                'type': 'batch' if job['is_batch'] else 'single',
+                'submitted_at': datetime.fromtimestamp(job['submitted_at']).isoformat()
+            }
+
+            if job['cancelled'] or future.cancelled():
+                view['status'] = 'cancelled'
+            elif not future.done():
+                view['status'] = 'running' if future.running() else 'queued'
+            else:
+                view['completed_at'] = datetime.fromtimestamp(job['completed_at'] or time.time()).isoformat()
+                try:
+                    result, processing_ms = future.result()
+                except CancelledError:
+                    view['status'] = 'cancelled'
+                except Exception as e:
+                    view['status'] = 'failed'
+                    view['error'] = str(e)
+                else:
+                    total_ms = ((job['completed_at'] or time.time()) - job['submitted_at']) * 1000
+                    # Timings sit on the job, for single and batch jobs alike, so result has the
+                    # same shape /api/validate or /api/validate/batch would have returned
+                    timings = {
+                        'queued_ms': round(max(total_ms - processing_ms, 0), 2),
+                        'processing_ms': round(processing_ms, 2),
+                        'total_ms': round(total_ms, 2)
+                    }
+                    view['status'] = 'done'
+                    view['result'] = result
+                    view['timings'] = timings
+            return view
+
+    def cancel(self, job_id):
+        """Cancel a queued job; returns True/False, or None if the job is unknown"""
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            if job['future'].cancel():
+                job['cancelled'] = True
+                job['completed_at'] = time.time()
+                return True
+            return job['cancelled']
+
+    def stats(self):
+        """Queue depth and job counts"""
+        with self.lock:
+            return {
+                'pending': self._pending(),
+                'max_pending': self.max_pending,
+                'workers': self.max_workers,
+                'tracked_jobs': len(self.jobs)
+            }
+
+    def shutdown(self):
+        """Stop the pool, dropping jobs that have not started"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+
+# Global job queue
+validation_jobs = ValidationJobQueue(
+    max_workers=int(os.environ.get('VALIDATION_JOB_WORKERS', 0)) or None,
+    max_pending=int(os.environ.get('VALIDATION_JOB_QUEUE', 64)),
+    result_ttl=int(os.environ.get('VALIDATION_JOB_TTL', 600))
+)
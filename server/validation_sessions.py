@@ -0,0 +1,127 @@
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from metrics import StageTimer, metrics
+from ml_validator import FIELD_CATEGORIES, FORM_FIELDS, SCORE_KEYS, ml_validator
+
+
+def check_fields(fields, allow_null=False):
+    """Raise ValueError unless fields is a dict whose form fields are all strings
+
+    With allow_null, null fields pass too; the analyzers read them as empty, as /api/validate does.
+    """
+    if not isinstance(fields, dict):
+        raise ValueError('Expected a JSON object of form fields')
+    for field in FORM_FIELDS:
+        if field in fields and not isinstance(fields[field], str) and not (allow_null and fields[field] is None):
+            raise ValueError(f"Field '{field}' {'must be a string or null' if allow_null else 'must be a string'}")
+
+
+class ValidationSessions:
+    """Live-scoring sessions that keep each form's category scores and rescore only what a diff touches"""
+
+    def __init__(self, validator, max_sessions=1024, ttl_seconds=1800):
+        self.validator = validator
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        # Sessions live in the process that created them; behind the prefork server, clients
+        # need sticky routing to that worker or must re-create the session on a 404
+        self.sessions = OrderedDict()  # session id -> session, least recently used first
+        self.lock = threading.Lock()
+        self.evictions = 0
+
+    def _expire(self, now):
+        while self.sessions:
+            session_id, session = next(iter(self.sessions.items()))
+            if now - session['last_used'] <= self.ttl_seconds:
+                break
+            del self.sessions[session_id]
+
+    def _score(self, session, keys):
+        timer = StageTimer(metrics)
+        session['scores'].update(self.validator.score_categories(session['data'], keys, timer))
+        # Overall, investor, clarity, pattern and learned scores all derive from the six category scores
+        result = self.validator.format_result(session['scores'], session['data'], timer=timer)
+        timer.publish()
+        session['result'] = dict(result, session_id=session['id'], revision=session['revision'],
+                                 rescored=list(keys))
+        return session['result']
+
+    def create(self, data):
+        """Score a (possibly partial) form in full and open a session for it"""
+        check_fields(data)
+        now = time.time()
+        session = {
+            'id': uuid.uuid4().hex,
+            'data': dict(data),
+            'scores': {},
+            'revision': 0,
+            'created_at': now,
+            'last_used': now,
+            'lock': threading.Lock()
+        }
+        result = self._score(session, SCORE_KEYS)
+
+        with self.lock:
+            self._expire(now)
+            self.sessions[session['id']] = session
+            while len(self.sessions) > self.max_sessions:
+                self.sessions.popitem(last=False)
+                self.evictions += 1
+        return result
+
+    def _get(self, session_id):
+        now = time.time()
+        with self.lock:
+            self._expire(now)
+            session = self.sessions.get(session_id)
+            if session is not None:
+                # Sessions expire after ttl_seconds idle, so the LRU order is also the expiry order
+                session['last_used'] = now
+                self.sessions.move_to_end(session_id)
+            return session
+
+    def update(self, session_id, fields):
+        """Apply a field-level diff and rescore the affected categories; None if the session is unknown"""
+        check_fields(fields)
+        session = self._get(session_id)
+        if session is None:
+            return None
+
+        # Concurrent diffs to one session are applied in turn
+        with session['lock']:
+            changed = [field for field, value in fields.items() if session['data'].get(field, '') != value]
+            session['data'].update(fields)
+            session['revision'] += 1
+            affected = {key for field in changed for key in FIELD_CATEGORIES.get(field, ())}
+            return self._score(session, tuple(key for key in SCORE_KEYS if key in affected))
+
+    def result(self, session_id):
+        """The latest result of a session, or None if it is unknown"""
+        session = self._get(session_id)
+        return session['result'] if session is not None else None
+
+    def close(self, session_id):
+        """Drop a session; returns False if it was unknown"""
+        with self.lock:
+            return self.sessions.pop(session_id, None) is not None
+
+    def stats(self):
+        with self.lock:
+            return {
+                'active': len(self.sessions),
+                'max_sessions': self.max_sessions,
+                'ttl_seconds': self.ttl_seconds,
+                'evictions': self.evictions
+            }
+
+
+# Global per-process session store
+validation_sessions = ValidationSessions(
+    ml_validator,
+    max_sessions=int(os.environ.get('VALIDATION_SESSION_LIMIT', 1024)),
+    ttl_seconds=int(os.environ.get('VALIDATION_SESSION_TTL', 1800))
+)
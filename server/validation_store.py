@@ -0,0 +1,325 @@
+import atexit
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+
+# validations.viability_level only accepts these values (see database/schema.sql)
+VIABILITY_LEVELS = {'High': 'high', 'Moderate': 'medium', 'Low': 'low'}
+
+COLUMNS = (
+    'id', 'startup_id', 'overall_score', 'viability_level', 'scores', 'recommendations',
+    'analysis_data', 'validation_version', 'processing_time_ms', 'input_data_hash', 'validated_at'
+)
+
+# Local stand-in for the PostgreSQL table: same columns, JSONB stored as TEXT, no foreign keys
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS validations (
+    id TEXT PRIMARY KEY,
+    startup_id TEXT,
+    overall_score INTEGER NOT NULL CHECK (overall_score >= 0 AND overall_score <= 100),
+    viability_level TEXT CHECK (viability_level IN ('very-low', 'low', 'medium', 'high')),
+    scores TEXT NOT NULL,
+    recommendations TEXT,
+    analysis_data TEXT,
+    validation_version TEXT DEFAULT '1.0',
+    processing_time_ms INTEGER,
+    input_data_hash TEXT,
+    validated_at TEXT DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+
+def validation_row(data, result, input_data_hash, validation_version, processing_time_ms=None,
+                   recommendations=None):
+    """Map a form submission and its successful result onto a validations row
+
+    API results carry no recommendations, so the validator passes the list it computed.
+    """
+    if recommendations is None:
+        recommendations = result.get('recommendations')
+    analysis = {key: value for key, value in result.items()
+                if key not in ('success', 'overall_score', 'viability_level', 'scores', 'recommendations', 'timestamp')}
+    # The form input is kept so stored rows can be re-scored and used for training (score_model.py)
+    analysis['input'] = data
+    return (
+        str(uuid.uuid4()),
+        data.get('startupId'),
+        result['overall_score'],
+        VIABILITY_LEVELS.get(result.get('viability_level')),
+        json.dumps(result['scores']),
+        json.dumps(recommendations) if recommendations is not None else None,
+        json.dumps(analysis),
+        validation_version,
+        round(processing_time_ms) if processing_time_ms is not None else None,
+        input_data_hash,
+        result.get('timestamp') or datetime.now().isoformat()
+    )
+
+
+class SQLiteBackend:
+    """Bulk inserts into a local SQLite validations table"""
+
+    requires_startup_id = False
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = None
+        # Objects with prepare(conn) and apply(conn, rows), run on connect and inside each insert transaction
+        self.listeners = []
+
+    def connect(self):
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute(SQLITE_SCHEMA)
+        self.conn.commit()
+        for listener in self.listeners:
+            listener.prepare(self.conn)
+
+    def insert(self, rows):
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO validations ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                rows
+            )
+            for listener in self.listeners:
+                listener.apply(self.conn, rows)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class PostgresBackend:
+    """Multi-row inserts into the PostgreSQL validations table through a small connection pool"""
+
+    requires_startup_id = True  # validations.startup_id is NOT NULL REFERENCES startups(id)
+
+    def __init__(self, dsn):
+        self.dsn = dsn
+        self.pool = None
+
+    def connect(self):
+        # Optional dependency, only needed when persisting to PostgreSQL
+        from psycopg2.pool import ThreadedConnectionPool
+        self.pool = ThreadedConnectionPool(1, 2, self.dsn)
+
+    def insert(self, rows):
+        from psycopg2.extras import execute_values
+        conn = self.pool.getconn()
+        try:
+            with conn, conn.cursor() as cursor:
+                execute_values(
+                    cursor,
+                    f"INSERT INTO validations ({', '.join(COLUMNS)}) VALUES %s",
+                    rows,
+                    template='(%s, %s, %s, %s, %s::jsonb, %s::jsonb, %s::jsonb, %s, %s, %s, %s)',
+                    page_size=len(rows)
+                )
+        finally:
+            self.pool.putconn(conn)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.closeall()
+            self.pool = None
+
+
+def backend_for(url):
+    """Backend for a VALIDATION_STORE_URL: postgresql://... or sqlite:///path (or a bare path)"""
+    if url.startswith(('postgres://', 'postgresql://')):
+        return PostgresBackend(url)
+    if url.startswith('sqlite:///'):
+        url = url[len('sqlite:///'):]
+    return SQLiteBackend(url)
+
+
+class ValidationStore:
+    """Write-behind queue that persists validation results in bulk from a background thread
+
+    The writer connects lazily and treats a failed connect like a failed insert: it logs,
+    keeps the rows and retries with a doubling delay. Rows that arrive while the queue is
+    full, and rows still unwritten at shutdown, are counted as dropped.
+    """
+
+    # Delay before the first retry of a failed connect or insert; it doubles up to max_retry_seconds
+    first_retry_seconds = 0.5
+    max_retry_seconds = 30
+
+    def __init__(self, backend, batch_size=500, flush_interval=1.0, max_queue=10000):
+        self.backend = backend
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.lock = threading.Lock()
+        self.stats_counts = {'queued': 0, 'written': 0, 'dropped': 0, 'skipped': 0,
+                             'failed_connects': 0, 'failed_flushes': 0}
+        self.connected = False
+        self.last_error = None
+        self.writer = None
+        self.pid = None
+        atexit.register(self.close)
+
+    def _ensure_writer(self):
+        # Threads do not survive fork, so each prefork worker starts its own writer and connection
+        if self.writer is None or self.pid != os.getpid():
+            with self.lock:
+                if self.writer is None or self.pid != os.getpid():
+                    self.pid = os.getpid()
+                    self.pending = queue.Queue(maxsize=self.max_queue)
+                    self.stop_requested = threading.Event()
+                    self.writer = threading.Thread(target=self._run, daemon=True)
+                    self.writer.start()
+
+    def record(self, data, result, input_data_hash, validation_version, processing_time_ms=None,
+               recommendations=None):
+        """Queue a successful validation for persistence; never blocks the caller"""
+        if not result.get('success'):
+            return False
+        if self.backend.requires_startup_id and not data.get('startupId'):
+            self._count('skipped')
+            return False
+
+        self._ensure_writer()
+        row = validation_row(data, result, input_data_hash, validation_version, processing_time_ms, recommendations)
+        try:
+            self.pending.put_nowait(row)
+        except queue.Full:
+            # Shedding rows beats stalling requests while the database is down or slow
+            self._count('dropped')
+            return False
+        self._count('queued')
+        return True
+
+    def _count(self, counter, amount=1):
+        # Request threads and the writer both update the counters
+        with self.lock:
+            self.stats_counts[counter] += amount
+
+    def _write(self, rows):
+        if not self.connected:
+            try:
+                self.backend.connect()
+            except Exception:
+                self._count('failed_connects')
+                # Drop whatever a half-finished connect left open before the next attempt
+                try:
+                    self.backend.close()
+                except Exception:
+                    pass
+                raise
+            self.connected = True
+        try:
+            self.backend.insert(rows)
+        except Exception:
+            self._count('failed_flushes')
+            raise
+
+    def _run(self):
+        buffer = []
+        stopping = False
+        retry_delay = self.first_retry_seconds
+        while not stopping or buffer:
+            # Seen here too, as a full queue may have no room for close()'s None
+            stopping = stopping or self.stop_requested.is_set()
+            deadline = time.monotonic() + self.flush_interval
+            while not stopping and len(buffer) < self.batch_size:
+                try:
+                    row = self.pending.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if row is None:
+                    stopping = True
+                else:
+                    buffer.append(row)
+
+            if stopping:
+                # Drain whatever is still queued so nothing accepted before shutdown is lost
+                while True:
+                    try:
+                        row = self.pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    if row is not None:
+                        buffer.append(row)
+
+            if not buffer:
+                continue
+            try:
+                self._write(buffer)
+            except Exception as e:
+                self.last_error = f'{type(e).__name__}: {e}'
+                if stopping:
+                    print(f"⚠️ Failed to persist {len(buffer)} validations at shutdown, dropping them: {e}")
+                    self._count('dropped', len(buffer))
+                    break
+                # Keep the rows and retry; new ones wait in the queue, which sheds them once full
+                print(f"⚠️ Failed to persist {len(buffer)} validations, retrying in {retry_delay:g}s: {e}")
+                self.stop_requested.wait(retry_delay)
+                retry_delay = min(retry_delay * 2, self.max_retry_seconds)
+                continue
+            retry_delay = self.first_retry_seconds
+            self.last_error = None
+            self._count('written', len(buffer))
+            buffer = []
+        if self.connected:
+            self.backend.close()
+            self.connected = False
+
+    def close(self, timeout=30):
+        """Flush everything queued and stop the writer"""
+        if self.writer is None or self.pid != os.getpid() or not self.writer.is_alive():
+            return
+        self.stop_requested.set()
+        try:
+            # Wakes a writer waiting on an empty queue
+            self.pending.put_nowait(None)
+        except queue.Full:
+            pass
+        self.writer.join(timeout)
+        if self.writer.is_alive():
+            print(f"⚠️ Validation store still flushing after {timeout}s, {self.pending.qsize()} rows unwritten")
+
+    def stats(self):
+        """Write-behind queue counters, and whether the writer currently reaches the database"""
+        with self.lock:
+            counts = dict(self.stats_counts)
+        return dict(
+            counts,
+            pending=self.pending.qsize() if self.writer is not None else 0,
+            connected=self.connected,
+            last_error=self.last_error,
+            backend=type(self.backend).__name__
+        )
+
+
+def sqlite_path_from_env(variable):
+    """SQLite path from the given variable, else from a sqlite VALIDATION_STORE_URL, else None"""
+    path = os.environ.get(variable)
+    if path:
+        return path
+    url = os.environ.get('VALIDATION_STORE_URL', '')
+    if not url or url.startswith(('postgres://', 'postgresql://')):
+        return None
+    return url[len('sqlite:///'):] if url.startswith('sqlite:///') else url
+
+
+def store_from_env():
+    """ValidationStore configured from VALIDATION_STORE_URL, or None when persistence is off"""
+    url = os.environ.get('VALIDATION_STORE_URL')
+    if not url:
+        return None
+    return ValidationStore(
+        backend_for(url),
+        batch_size=int(os.environ.get('VALIDATION_STORE_BATCH', 500)),
+        flush_interval=float(os.environ.get('VALIDATION_STORE_FLUSH_SECONDS', 1.0))
+    )
+
+
+# Global store; None unless VALIDATION_STORE_URL is set
+validation_store = store_from_env()
@@ -119,6 +119,8 @@ export interface MarketData {
     year_3: string;
     year_5: string;
   };
+  // Sections holding baseline figures rather than figures from stored validations
+  placeholders?: string[];
 }
 
 class StartupValidatorAPI {